@@ -0,0 +1,83 @@
+"""
+Batch Construction Benchmark
+============================
+
+Compares building RoundedButtons one widget at a time against building them
+with a single generated Tcl script (components.batch.build_buttons).
+
+Usage:
+    python benchmarks/batch_construction.py --count 100 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ttkbootstrap as ttk
+from components import RoundedButton, build_buttons
+from components.offscreen import THEME_PATH
+
+
+def create_root():
+    """Create a themed root window like the showcase does"""
+    root = ttk.tk.Tk()
+    root.style = ttk.Style()
+    root.style.load_user_themes(THEME_PATH)
+    root.style.theme_use("ghost")
+    return root
+
+
+def on_click(event=None):
+    pass
+
+
+def build_individually(parent, count):
+    for i in range(count):
+        button = RoundedButton(parent, text=f"Button {i}", command=on_click, bootstyle="primary.TButton", radius=8)
+        button.pack(side=ttk.LEFT, padx=2)
+
+
+def build_batched(parent, count):
+    build_buttons(parent, [
+        dict(text=f"Button {i}", command=on_click, bootstyle="primary.TButton", radius=8, geometry=("pack", {"side": "left", "padx": 2}))
+        for i in range(count)
+    ])
+
+
+def measure(root, build, count, repeat):
+    """Return the best wall time of building count buttons, including the first layout"""
+    best = float("inf")
+    for _ in range(repeat):
+        container = ttk.Frame(root)
+        container.pack()
+        start = time.perf_counter()
+        build(container, count)
+        root.update_idletasks()
+        best = min(best, time.perf_counter() - start)
+        container.destroy()
+        root.update_idletasks()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100, help="buttons per build")
+    parser.add_argument("--repeat", type=int, default=5, help="builds per mode (best time is reported)")
+    args = parser.parse_args()
+
+    root = create_root()
+    individual = measure(root, build_individually, args.count, args.repeat)
+    batched = measure(root, build_batched, args.count, args.repeat)
+    root.destroy()
+
+    print(f"{args.count} RoundedButtons, best of {args.repeat}")
+    print(f"  per-widget construction: {individual * 1000:8.2f} ms")
+    print(f"  single Tcl script:       {batched * 1000:8.2f} ms")
+    print(f"  speedup:                 {individual / batched:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Stress Test
+===========
+
+Builds a synthetic UI far larger than the showcase (nested RoundedFrames,
+RoundedButtons, comboboxes and listboxes with many rows), then scripts
+resize, hover and scroll sequences against it. Reports startup time, frame
+times per sequence, and memory: process RSS plus Tcl object counts.
+
+With --fake the UI is built on a FakeRoot instead of a display, so the
+numbers are the Python side of the work only.
+
+Usage:
+    python benchmarks/stress_test.py --frames 400 --depth 4 --buttons 300 --lists 20 --rows 500
+    python benchmarks/stress_test.py --fake --frames 2000 --steps 50
+"""
+
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ttkbootstrap as ttk
+from ttkbootstrap.scrolled import ScrolledFrame
+from components import (
+    FakeRoot, LatencyHistogram, RoundedButton, RoundedCombobox, RoundedFrame, RoundedListbox,
+    attach_scroll_engine, snapshot,
+)
+from components.offscreen import THEME_PATH
+
+COLUMNS = 4
+BUTTONS_PER_ROW = 10
+
+
+def rss_megabytes():
+    """Return the resident set size of this process in MB (peak RSS where current is unavailable)"""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def count_widgets(widget):
+    """Count a widget and all of its descendants"""
+    return 1 + sum(count_widgets(child) for child in widget.children.values())
+
+
+def create_root(fake):
+    """Create a themed root window like the showcase does (or a FakeRoot)"""
+    if fake:
+        root = FakeRoot()
+    else:
+        root = ttk.tk.Tk()
+        root.geometry("1200x800")
+        root.style = ttk.Style()
+    root.style.load_user_themes(THEME_PATH)
+    root.style.theme_use("ghost")
+    return root
+
+
+def on_click(event=None):
+    pass
+
+
+def build_ui(root, args):
+    """
+    Build the synthetic UI inside a ScrolledFrame.
+
+    Returns:
+        A namespace with the created components and the scroll engine
+    """
+    scrolled = ScrolledFrame(root, autohide=True)
+    scrolled.pack(fill=ttk.BOTH, expand=True)
+    ui = SimpleNamespace(scroll_engine=attach_scroll_engine(scrolled, smooth=False), frames=[], buttons=[], comboboxes=[], listboxes=[])
+
+    main = ttk.Frame(scrolled)
+    main.pack(fill=ttk.BOTH, expand=True, padx=10, pady=10)
+
+    # Chains of frames nested depth levels deep, laid out in a grid
+    grid = ttk.Frame(main)
+    grid.pack(fill=ttk.X)
+    for column in range(COLUMNS):
+        grid.grid_columnconfigure(column, weight=1)
+    chain = 0
+    while len(ui.frames) < args.frames:
+        parent = grid
+        for level in range(args.depth):
+            if len(ui.frames) >= args.frames:
+                break
+            frame = RoundedFrame(parent, radius=12, bootstyle="dark.TFrame" if level % 2 == 0 else "secondary.TFrame")
+            if level == 0:
+                frame.grid(row=chain // COLUMNS, column=chain % COLUMNS, sticky=ttk.NSEW, padx=4, pady=4)
+            else:
+                frame.pack(fill=ttk.BOTH, expand=True, padx=6, pady=6)
+            ui.frames.append((frame, level))
+            parent = frame
+        ttk.Label(parent, text=f"Card {chain}").pack(padx=8, pady=8)
+        chain += 1
+
+    # Rows of buttons
+    row = None
+    for index in range(args.buttons):
+        if index % BUTTONS_PER_ROW == 0:
+            row = ttk.Frame(main)
+            row.pack(fill=ttk.X, pady=2)
+        button = RoundedButton(row, text=f"Button {index}", radius=8, command=on_click)
+        button.pack(side=ttk.LEFT, padx=2)
+        ui.buttons.append(button)
+
+    # Comboboxes and listboxes with rows items each
+    values = [f"Row {index}" for index in range(args.rows)]
+    for index in range(args.lists):
+        container = RoundedFrame(main, radius=15, bootstyle="secondary.TFrame")
+        container.pack(fill=ttk.X, pady=4)
+        combobox = RoundedCombobox(container, values=values, width=30)
+        combobox.pack(fill=ttk.X, padx=15, pady=(10, 5))
+        listbox = RoundedListbox(container, values=values, height=8, selectmode="extended")
+        listbox.pack(fill=ttk.BOTH, padx=15, pady=(5, 10))
+        ui.comboboxes.append(combobox)
+        ui.listboxes.append(listbox)
+    return ui
+
+
+def timed(root, action):
+    """Run one scripted step and the event processing it causes; return the seconds taken"""
+    start = time.perf_counter()
+    action()
+    root.update()
+    return time.perf_counter() - start
+
+
+def resize_sequence(root, ui, steps, fake):
+    """Grow and shrink the window, one size per frame"""
+    histogram = LatencyHistogram()
+    for step in range(steps):
+        width = 900 + (step % 10) * 40
+        height = 600 + (step % 5) * 40
+        if fake:
+            # No window manager: deliver the resulting Configure events directly
+            def action(width=width, height=height):
+                for frame, level in ui.frames:
+                    root.tk.set_size(frame, max(40, width // COLUMNS - 24 * level), max(40, 160 - 24 * level))
+        else:
+            def action(width=width, height=height):
+                root.geometry(f"{width}x{height}")
+        histogram.record(timed(root, action))
+    return histogram
+
+
+def hover_sequence(root, ui, steps):
+    """Move the pointer across buttons and comboboxes, one enter/leave pair per frame"""
+    histogram = LatencyHistogram()
+    targets = [button.frame for button in ui.buttons] + ui.comboboxes
+    if not targets:
+        return histogram
+    for step in range(steps):
+        target = targets[step % len(targets)]
+
+        def action(target=target):
+            target.event_generate("<Enter>")
+            target.event_generate("<Leave>")
+        histogram.record(timed(root, action))
+    return histogram
+
+
+def scroll_sequence(root, ui, steps, fake):
+    """Wheel-scroll the page and each listbox, timing the frame that applies each scroll"""
+    histogram = LatencyHistogram()
+    engines = [ui.scroll_engine] + [listbox.scroll_engine for listbox in ui.listboxes]
+    for step in range(steps):
+        engine = engines[step % len(engines)]
+        # num 4/5 is a wheel notch up/down on every platform
+        event = SimpleNamespace(num=5 if (step // len(engines)) % 20 < 10 else 4, delta=0)
+        elapsed = timed(root, lambda: engine.on_wheel(event))
+        if not fake:
+            # The engine applies the scroll on its next frame
+            time.sleep(engine.frame_ms / 1000)
+        histogram.record(elapsed + timed(root, lambda: None))
+    return histogram
+
+
+def format_histogram(name, histogram):
+    return (
+        f"  {name:<8} {histogram.count:>6} {histogram.mean() * 1000:>9.2f} {histogram.percentile(50) * 1000:>9.2f} "
+        f"{histogram.percentile(95) * 1000:>9.2f} {histogram.max * 1000:>9.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=200, help="RoundedFrames to create (N)")
+    parser.add_argument("--depth", type=int, default=4, help="nesting depth of the frames (D)")
+    parser.add_argument("--buttons", type=int, default=200, help="RoundedButtons to create (M)")
+    parser.add_argument("--lists", type=int, default=10, help="comboboxes and listboxes to create, K of each")
+    parser.add_argument("--rows", type=int, default=200, help="rows per combobox and listbox (R)")
+    parser.add_argument("--steps", type=int, default=100, help="frames per scripted sequence")
+    parser.add_argument("--fake", action="store_true", help="build on a FakeRoot (no display, Python cost only)")
+    args = parser.parse_args()
+    args.depth = max(1, args.depth)
+
+    rss_before = rss_megabytes()
+    start = time.perf_counter()
+    root = create_root(args.fake)
+    ui = build_ui(root, args)
+    root.update()
+    startup = time.perf_counter() - start
+    rss_built = rss_megabytes()
+    counts = snapshot(root)
+
+    sequences = [
+        ("resize", resize_sequence(root, ui, args.steps, args.fake)),
+        ("hover", hover_sequence(root, ui, args.steps)),
+        ("scroll", scroll_sequence(root, ui, args.steps, args.fake)),
+    ]
+    rss_after = rss_megabytes()
+
+    print(f"{args.frames} frames (depth {args.depth}), {args.buttons} buttons, "
+          f"{args.lists} comboboxes + {args.lists} listboxes x {args.rows} rows"
+          f"{' on a FakeRoot' if args.fake else ''}")
+    print(f"  startup:        {startup * 1000:10.1f} ms")
+    print(f"  widgets:        {count_widgets(root):10d}")
+    interpreter = counts["interpreter"]
+    print(f"  tcl commands:   {interpreter['tcl_commands']:10d}")
+    print(f"  images:         {interpreter['images']:10d}")
+    print(f"  ttk styles:     {interpreter['styles']:10d}")
+    print(f"  pending after:  {interpreter['after']:10d}")
+    if rss_before is not None:
+        print(f"  RSS:            {rss_before:10.1f} MB at start, {rss_built:.1f} MB built, {rss_after:.1f} MB after sequences")
+    print()
+    print(f"  {'sequence':<8} {'frames':>6} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for name, histogram in sequences:
+        print(format_histogram(name, histogram))
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,26 @@
+from .theme_context import ThemeContext, get_theme_context
 from .rounded_frame import RoundedFrame
 from .rounded_button import RoundedButton
 from .rounded_combobox import RoundedCombobox
 from .rounded_listbox import RoundedListbox
+from .selection import SelectionModel
+from .icon_atlas import IconAtlas, get_icon_atlas
+from .rounded_table import RoundedTable, ColumnStore
+from .card_grid import CardGrid
 from .rounded_menu import RoundedMenu, create_menubar, create_popup_menu
+from .option_theme import install_option_theme, refresh_option_theme
+from .batch import BatchBuilder, build_buttons, build_frames
+from .ui_spec import ConstructionPlan, compile_spec, load_plan
+from .latency import LatencyTracer, LatencyHistogram, LatencyOverlay
+from .profiler import TclProfiler
+from .fake_tk import FakeTkApp, FakeRoot
+from .diagnostics import snapshot, diff_snapshots, find_leaks
+from .widget_pool import WidgetPool
+from .geometry import geometry_cache_info
+from .offscreen import OffscreenImage, render_frame, render_button, render_batch
+from .layout_monitor import ConfigureLoopMonitor, install_layout_monitor, uninstall_layout_monitor
+from .scroll_engine import ScrollEngine, attach_scroll_engine
+from .async_bridge import AsyncioBridge, get_asyncio_bridge
+from .executor import submit, get_pool_size, set_pool_size, in_flight_count
 
-__all__ = ['RoundedFrame', 'RoundedButton', 'RoundedCombobox', 'RoundedListbox', 'RoundedMenu', 'create_menubar', 'create_popup_menu']
+__all__ = ['ThemeContext', 'get_theme_context', 'RoundedFrame', 'RoundedButton', 'RoundedCombobox', 'RoundedListbox', 'SelectionModel', 'IconAtlas', 'get_icon_atlas', 'RoundedTable', 'ColumnStore', 'CardGrid', 'RoundedMenu', 'create_menubar', 'create_popup_menu', 'install_option_theme', 'refresh_option_theme', 'BatchBuilder', 'build_buttons', 'build_frames', 'ConstructionPlan', 'compile_spec', 'load_plan', 'LatencyTracer', 'LatencyHistogram', 'LatencyOverlay', 'TclProfiler', 'FakeTkApp', 'FakeRoot', 'snapshot', 'diff_snapshots', 'find_leaks', 'WidgetPool', 'geometry_cache_info', 'OffscreenImage', 'render_frame', 'render_button', 'render_batch', 'ConfigureLoopMonitor', 'install_layout_monitor', 'uninstall_layout_monitor', 'ScrollEngine', 'attach_scroll_engine', 'AsyncioBridge', 'get_asyncio_bridge', 'submit', 'get_pool_size', 'set_pool_size', 'in_flight_count']
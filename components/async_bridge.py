@@ -0,0 +1,225 @@
+import asyncio
+import functools
+import queue
+import threading
+import sys
+from tkinter import TclError
+from .theme_context import get_theme_context
+from .diagnostics import track_binding
+
+
+class TkDispatcher:
+    """
+    Delivers callables from worker threads onto the Tk thread.
+
+    Callbacks are queued and the Tk thread is woken with a virtual event, so
+    nothing polls while the queue is empty. When a wakeup cannot be delivered
+    (the mainloop is not running yet), workers stop generating events and the
+    calls wait for the next drain on the Tk thread, which arms a one-shot
+    retry that picks up anything queued meanwhile. One dispatcher exists per
+    Tk interpreter; use get_dispatcher() instead of creating it directly.
+
+    Args:
+        root: The Tk root window
+    """
+    EVENT = "<<GhostDispatch>>"
+    # Delay of the Tk-thread retry that drains the queue while wakeups cannot be delivered
+    RETRY_MS = 50
+
+    def __init__(self, root):
+        self.root = root
+        self._queue = queue.SimpleQueue()
+        self._tk_thread = threading.get_ident()
+        self._wakeup_lost = False
+        self._retry_pending = False
+        self.root.bind(self.EVENT, self._drain, add="+")
+
+    def call_soon(self, func, *args):
+        """Schedule func(*args) to run on the Tk thread"""
+        self._queue.put((func, args))
+        try:
+            if threading.get_ident() == self._tk_thread:
+                self.root.after_idle(self._drain)
+            elif not self._wakeup_lost:
+                self.root.event_generate(self.EVENT, when="tail")
+        except (RuntimeError, TclError):
+            # Root destroyed, or mainloop not running (event_generate waited
+            # for it). Stop trying until the Tk thread has drained the queue
+            # and its retry has run.
+            self._wakeup_lost = True
+
+    def _schedule_retry(self):
+        """Arm the one-shot retry (Tk thread only)"""
+        if self._retry_pending:
+            return
+        try:
+            self.root.after(self.RETRY_MS, self._retry)
+            self._retry_pending = True
+        except TclError:
+            pass
+
+    def _retry(self):
+        """Drain calls queued after a lost wakeup and let workers wake the Tk thread again"""
+        self._retry_pending = False
+        self._wakeup_lost = False
+        self._drain()
+
+    def _drain(self, event=None):
+        """Run every queued callback on the Tk thread"""
+        while True:
+            try:
+                func, args = self._queue.get_nowait()
+            except queue.Empty:
+                if self._wakeup_lost:
+                    self._schedule_retry()
+                return
+            try:
+                func(*args)
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+
+
+class AsyncioBridge:
+    """
+    Runs an asyncio event loop alongside the Tk mainloop.
+
+    The loop lives on a daemon thread and blocks in its selector while idle;
+    results travel back to the Tk thread through the TkDispatcher, so neither
+    side busy-polls. Coroutines run on the loop thread and should use
+    call_in_tk() to touch widgets.
+
+    Args:
+        root: The Tk root window
+    """
+    def __init__(self, root):
+        self.root = root
+        self.dispatcher = get_dispatcher(root)
+        self.loop = asyncio.new_event_loop()
+        self._tasks = {}
+        self._thread = threading.Thread(target=self._run, name="ghost-asyncio", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            # Let cancelled tasks unwind before the loop goes away
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.close()
+
+    def create_task(self, coro, owner=None, on_done=None):
+        """
+        Schedule a coroutine on the asyncio loop.
+
+        Args:
+            coro: The coroutine object to run
+            owner: Widget whose destruction cancels the task
+            on_done: Called on the Tk thread with the result when it completes
+
+        Returns:
+            A concurrent.futures.Future for the task
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if owner is not None:
+            self._track(owner, future)
+        future.add_done_callback(lambda f: self.dispatcher.call_soon(self._finish, f, owner, on_done))
+        return future
+
+    def call_in_tk(self, func, *args):
+        """Run func(*args) on the Tk thread (safe to call from coroutines)"""
+        self.dispatcher.call_soon(func, *args)
+
+    def cancel_owner(self, owner):
+        """Cancel every pending task started on behalf of a widget"""
+        for future in self._tasks.pop(str(owner), ()):
+            future.cancel()
+
+    def close(self):
+        """Cancel all tasks and stop the event loop"""
+        for key in list(self._tasks):
+            for future in self._tasks.pop(key):
+                future.cancel()
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def _track(self, owner, future):
+        """Remember a task so it is cancelled when its owner is destroyed"""
+        key = str(owner)
+        if key not in self._tasks:
+            self._tasks[key] = set()
+            funcid = owner.bind("<Destroy>", lambda e: self._on_owner_destroy(e, owner), add="+")
+            track_binding(owner, owner, "<Destroy>", funcid)
+        self._tasks[key].add(future)
+
+    def _on_owner_destroy(self, event, owner):
+        # <Destroy> is delivered for every descendant as well
+        if event.widget is owner:
+            self.cancel_owner(owner)
+
+    def _finish(self, future, owner, on_done):
+        """Complete a task on the Tk thread"""
+        if owner is not None:
+            pending = self._tasks.get(str(owner))
+            if pending is not None:
+                pending.discard(future)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.root.report_callback_exception(type(error), error, error.__traceback__)
+        elif on_done is not None:
+            on_done(future.result())
+
+
+def get_dispatcher(widget):
+    """Return the TkDispatcher shared by the interpreter owning widget"""
+    context = get_theme_context(widget)
+    if context.dispatcher is None:
+        context.dispatcher = TkDispatcher(context.root)
+    return context.dispatcher
+
+
+def get_asyncio_bridge(widget):
+    """Return the AsyncioBridge shared by the interpreter owning widget"""
+    context = get_theme_context(widget)
+    if context.asyncio_bridge is None:
+        context.asyncio_bridge = AsyncioBridge(context.root)
+    return context.asyncio_bridge
+
+
+def wrap_command(widget, command, pass_event=True):
+    """
+    Adapt a component command so coroutine functions run on the asyncio bridge.
+
+    Plain callables are returned unchanged (or wrapped to drop the event when
+    pass_event is False). Coroutine functions are scheduled as tasks owned by
+    widget, so destroying the widget cancels them.
+
+    Args:
+        widget: The component that owns the command
+        command: Callback or coroutine function
+        pass_event: Whether the command receives the Tk event
+
+    Returns:
+        A callable suitable for bind()
+    """
+    if not asyncio.iscoroutinefunction(command):
+        if pass_event:
+            return command
+
+        @functools.wraps(command)
+        def call_without_event(event=None):
+            return command()
+
+        return call_without_event
+
+    @functools.wraps(command)
+    def handler(event=None):
+        coro = command(event) if pass_event else command()
+        get_asyncio_bridge(widget).create_task(coro, owner=widget)
+
+    return handler
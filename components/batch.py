@@ -0,0 +1,280 @@
+import sys
+import ttkbootstrap as ttk
+from tkinter import TclError
+from .rounded_frame import RoundedFrame
+from .rounded_button import RoundedButton
+from .async_bridge import wrap_command
+from .diagnostics import track, track_command
+from .theme_context import get_theme_context
+
+_SPECIAL = set('\\$[]{}"; \t\n')
+
+
+def tcl_quote(value):
+    """Quote a Python value as a single Tcl word"""
+    if isinstance(value, (list, tuple)):
+        value = " ".join(tcl_quote(item) for item in value)
+    text = str(value)
+    if not text:
+        return "{}"
+    if not any(char in _SPECIAL for char in text):
+        return text
+    return "".join("\\n" if char == "\n" else "\\" + char if char in _SPECIAL else char for char in text)
+
+
+def _default_font():
+    return ("Host Grotesk", "10") if sys.platform != "darwin" else ("Host Grotesk",)
+
+
+def _parent_background(parent, style):
+    """Same lookup as RoundedFrame._get_parent_background, done once per batch"""
+    if isinstance(parent, ttk.Frame):
+        return get_theme_context(parent).lookup(parent.cget("style"), "background")
+    elif isinstance(parent, RoundedFrame):
+        return parent.frame_background
+    try:
+        return parent.cget("background")
+    except:
+        return style.colors.get("dark")
+
+
+def _adopt(cls, master, widget_name):
+    """Create the Python object for a widget that Tcl already built"""
+    widget = cls.__new__(cls)
+    name = cls.__name__.lower()
+    if master._last_child_ids is None:
+        master._last_child_ids = {}
+    count = master._last_child_ids.get(name, 0) + 1
+    master._last_child_ids[name] = count
+    widget._name = f"!{name}" if count == 1 else f"!{name}{count}"
+    widget._w = ("" if master._w == "." else master._w) + "." + widget._name
+    widget.master = master
+    widget.tk = master.tk
+    widget.children = {}
+    widget._tclCommands = None
+    widget._last_child_ids = None
+    widget.widgetName = widget_name
+    master.children[widget._name] = widget
+    return widget
+
+
+class _BatchDispatch:
+    """
+    The one Tcl command routing every binding of a batch to its components.
+
+    Each component's handlers are dropped when the component is destroyed,
+    and the command is deleted with the last of them, so destroyed batch
+    components are not kept alive by the interpreter.
+    """
+    def __init__(self, parent):
+        self.tk = parent.tk
+        self.substitute = parent._substitute
+        self.handlers = {}
+        self.name = f"{id(self)}batch_dispatch"
+        self.tk.createcommand(self.name, self)
+
+    def __call__(self, index, handler, *args):
+        index = int(index)
+        if handler == "destroy":
+            self.handlers.pop(index, None)
+            if not self.handlers:
+                self.close()
+            return None
+        handlers = self.handlers.get(index)
+        func = handlers and handlers[handler]
+        if func is None:
+            return None
+        event = self.substitute(*args)[0]
+        return func(event)
+
+    def close(self):
+        """Delete the Tcl command and forget every handler"""
+        self.handlers.clear()
+        try:
+            self.tk.deletecommand(self.name)
+        except TclError:
+            pass
+
+
+class BatchBuilder:
+    """
+    Builds many components with a single Tcl script.
+
+    Each add_*() call queues a component; build() generates one script that
+    creates, configures, packs and binds every widget, evaluates it with a
+    single tk.eval(), and then wraps the resulting paths in regular
+    RoundedButton/RoundedFrame objects. All event bindings of a batch share
+    one registered Tcl command instead of one per binding; it is deleted once
+    every component of the batch has been destroyed.
+
+    Args:
+        parent: The parent widget of every queued component
+    """
+    def __init__(self, parent):
+        self.parent = parent
+        self.root = parent.winfo_toplevel()
+        self.style = get_theme_context(parent).style
+        self._queue = []
+
+    def add_button(self, text=None, command=None, radius=(8, 8, 8, 8), bootstyle="primary.TButton", padx=2, pady=None, font=None, background=None, geometry=None):
+        """
+        Queue a RoundedButton.
+
+        Args:
+            geometry: Optional ("pack" | "grid" | "place", {options}) applied in the script
+            Other arguments match RoundedButton
+        """
+        self._queue.append(("button", dict(text=text, command=command, radius=radius, bootstyle=bootstyle, padx=padx,
+                                           pady=pady, font=font, background=background, geometry=geometry)))
+
+    def add_frame(self, radius=(25, 25, 25, 25), bootstyle="primary.TButton", background=None, text=None, font=None, geometry=None):
+        """
+        Queue a RoundedFrame, optionally with a centered label (a simple card).
+
+        Args:
+            text: Optional label text packed inside the frame
+            geometry: Optional ("pack" | "grid" | "place", {options}) applied in the script
+            Other arguments match RoundedFrame
+        """
+        self._queue.append(("frame", dict(radius=radius, bootstyle=bootstyle, background=background, text=text,
+                                          font=font, geometry=geometry)))
+
+    def build(self):
+        """
+        Create every queued component with one tk.eval().
+
+        Returns:
+            The component objects in the order they were queued
+        """
+        context = get_theme_context(self.parent)
+        parent_bg = _parent_background(self.parent, self.style)
+        dispatcher = _BatchDispatch(self.parent)
+        dispatch = dispatcher.name
+        format_string = self.parent._subst_format_str
+        script = []
+        components = []
+
+        def bind(path, sequence, index, handler):
+            script.append(f'bind {path} {sequence} {{if {{"[{dispatch} {index} {handler} {format_string}]" == "break"}} break\n}}')
+
+        for kind, spec in self._queue:
+            index = len(components)
+            radius = spec["radius"] if not isinstance(spec["radius"], int) else (spec["radius"],) * 4
+            fill = spec["background"] or self.style.colors.get(spec["bootstyle"].split(".")[0])
+            if kind == "button":
+                component = self._adopt_button(spec, radius, fill, parent_bg)
+                frame = component.frame
+                label = component.button
+                path = component._w
+                script.append(f"canvas {path} -highlightthickness 0 -bd 0 -background {tcl_quote(parent_bg)}")
+                script.append(f"canvas {frame._w} -highlightthickness 0 -bd 0 -background {tcl_quote(parent_bg)}")
+                script.append(f"ttk::frame {frame.inner_frame._w}")
+                script.append(f"{frame._w} create window 0 0 -window {frame.inner_frame._w} -anchor nw")
+                script.append(
+                    f"ttk::label {label._w} -text {tcl_quote(spec['text'] or '')} -style {tcl_quote(spec['bootstyle'])} "
+                    f"-anchor center -borderwidth 0 -relief flat -font {tcl_quote(context.scaled_font(component.logical_font))}"
+                )
+                script.append(f"pack {label._w} -fill both -expand 1 -padx {component.padx} -pady {component.pady}")
+                script.append(f"pack {frame._w} -fill both")
+                bind(frame._w, "<Configure>", index, "configure")
+                for widget in (frame, label):
+                    bind(widget._w, "<Enter>", index, "enter")
+                    bind(widget._w, "<Leave>", index, "leave")
+                    if component.command:
+                        bind(widget._w, "<Button-1>", index, "click")
+                    component._bindings.extend((widget, sequence, None) for sequence in ("<Enter>", "<Leave>", "<Button-1>"))
+                handlers = {
+                    "configure": frame.on_resize,
+                    "enter": component._hover_enter,
+                    "leave": component._hover_leave,
+                    "click": wrap_command(component, component.command) if component.command else None,
+                }
+            else:
+                component = self._adopt_frame(RoundedFrame, self.parent, radius, fill, parent_bg)
+                path = component._w
+                script.append(f"canvas {path} -highlightthickness 0 -bd 0 -background {tcl_quote(parent_bg)}")
+                script.append(f"ttk::frame {component.inner_frame._w}")
+                script.append(f"{path} create window 0 0 -window {component.inner_frame._w} -anchor nw")
+                if spec["text"] is not None:
+                    label = _adopt(ttk.Label, component, "ttk::label")
+                    script.append(
+                        f"ttk::label {label._w} -text {tcl_quote(spec['text'])} -anchor center -background {tcl_quote(fill)} "
+                        f"-font {tcl_quote(context.scaled_font(spec['font'] or _default_font()))}"
+                    )
+                    script.append(f"pack {label._w} -fill both -expand 1 -padx 10 -pady 10")
+                bind(path, "<Configure>", index, "configure")
+                handlers = {"configure": component.on_resize}
+
+            if spec["geometry"]:
+                manager, options = spec["geometry"]
+                arguments = " ".join(f"-{key} {tcl_quote(value)}" for key, value in options.items())
+                script.append(f"{manager} {path} {arguments}")
+            # Forget the handlers (and the bound components) on destroy
+            script.append(f"bind {path} <Destroy> {{+{dispatch} {index} destroy}}")
+            dispatcher.handlers[index] = handlers
+            components.append(component)
+
+        self._queue = []
+        if not components:
+            dispatcher.close()
+            return components
+        try:
+            self.parent.tk.eval("\n".join(script))
+        except TclError:
+            for component in components:
+                self.parent.children.pop(component._name, None)
+            dispatcher.close()
+            raise
+        for index, component in enumerate(components):
+            if isinstance(component, RoundedButton):
+                track(component.frame)
+            track(component)
+            track_command(component, dispatch, owner=dispatcher, key=index)
+        return components
+
+    def _adopt_frame(self, cls, master, radius, fill, parent_bg):
+        frame = _adopt(cls, master, "canvas")
+        frame._init_state(master, radius, dict(background=fill, parent_background=parent_bg), root=self.root)
+        frame.inner_frame = _adopt(ttk.Frame, frame, "ttk::frame")
+        return frame
+
+    def _adopt_button(self, spec, radius, fill, parent_bg):
+        button = _adopt(RoundedButton, self.parent, "canvas")
+        button._init_state(self.parent, radius, spec["command"], dict(padx=spec["padx"], pady=spec["pady"], background=fill, font=spec["font"]), root=self.root)
+        button.frame = self._adopt_frame(RoundedFrame, button, radius, fill, parent_bg)
+        button.button = _adopt(ttk.Label, button.frame, "ttk::label")
+        return button
+
+
+def build_buttons(parent, specs):
+    """
+    Build many RoundedButtons with one Tcl script.
+
+    Args:
+        parent: The parent widget
+        specs: Iterable of dicts of BatchBuilder.add_button() arguments
+
+    Returns:
+        The list of RoundedButton objects
+    """
+    builder = BatchBuilder(parent)
+    for spec in specs:
+        builder.add_button(**spec)
+    return builder.build()
+
+
+def build_frames(parent, specs):
+    """
+    Build many RoundedFrames (optionally with a label) with one Tcl script.
+
+    Args:
+        parent: The parent widget
+        specs: Iterable of dicts of BatchBuilder.add_frame() arguments
+
+    Returns:
+        The list of RoundedFrame objects
+    """
+    builder = BatchBuilder(parent)
+    for spec in specs:
+        builder.add_frame(**spec)
+    return builder.build()
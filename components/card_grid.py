@@ -0,0 +1,203 @@
+import sys
+import ttkbootstrap as ttk
+from .rounded_frame import RoundedFrame
+from .geometry import rounded_rect_points
+from .diagnostics import track
+from .theme_context import get_theme_context
+
+
+class CardGrid(ttk.Canvas):
+    """
+    A grid of rounded cards drawn as items on a single shared canvas.
+
+    Each card is a smoothed polygon plus a title and a value text item, so a
+    dashboard with hundreds of tiles costs one widget instead of a canvas,
+    frame and label per tile. Cards are laid out in equal-width columns; the
+    layout pass only runs when the container width changes.
+
+    Args:
+        parent: The parent widget
+        columns: Number of cards per row
+        card_height: Height of each card in logical pixels (scaled for DPI)
+        gap: Space between cards in logical pixels
+        radius: Corner radius (int for all corners, or tuple of 4)
+        command: Callback function called with the card key when a card is clicked
+        font: Font tuple for the card title
+        value_font: Font tuple for the card value
+    """
+    def __init__(self, parent, columns=4, card_height=60, gap=10, radius=10, command=None, **kwargs):
+        canvas_kwargs = {}
+        for key in kwargs:
+            if key not in ["font", "value_font", "parent_background"]:
+                canvas_kwargs[key] = kwargs[key]
+        context = get_theme_context(parent)
+        super().__init__(parent, highlightthickness=0, bd=0, height=context.scaled(card_height), **canvas_kwargs)
+
+        self.parent = parent
+        self.root = parent.winfo_toplevel()
+        self.style = get_theme_context(parent).style
+        self.columns = columns
+        # Sizes are given in logical pixels and applied scaled
+        self.logical_sizes = (card_height, gap, radius if not isinstance(radius, int) else (radius, radius, radius, radius))
+        self.card_height, self.gap, self.radius = context.scaled(self.logical_sizes)
+        self.command = command
+        # Pixel-sized fonts (negative sizes) are scaled like the sizes
+        self.logical_fonts = (kwargs.get("font") or (("Host Grotesk", 8) if sys.platform != "darwin" else ("Host Grotesk",)),)
+        self.logical_fonts += (kwargs.get("value_font") or self.logical_fonts[0],)
+        self.font, self.value_font = (context.scaled_font(font) for font in self.logical_fonts)
+        self.parent_background = self._get_parent_background() if kwargs.get("parent_background") is None else kwargs.get("parent_background")
+        self.configure(background=self.parent_background)
+
+        self.cards = {}
+        self.order = []
+        self._layout_width = None
+        self._card_width = 0
+        self._next_id = 0
+
+        self.bind("<Configure>", self._on_configure)
+        self.bind("<Button-1>", self._on_click)
+        track(self)
+
+    def _get_parent_background(self):
+        """Determines the background color of the parent widget"""
+        parent = self.parent
+        if isinstance(parent, ttk.Frame):
+            style = parent.cget("style")
+            return get_theme_context(self).lookup(style, "background")
+        elif isinstance(parent, RoundedFrame):
+            return parent.frame_background
+        else:
+            try:
+                return parent.cget("background")
+            except:
+                return self.style.colors.get("dark")
+
+    def _resolve_color(self, bootstyle, background):
+        """Pick an explicit background or the theme color of a bootstyle"""
+        if background is not None:
+            return background
+        return self.style.colors.get((bootstyle or "secondary").split(".")[0])
+
+    def add_card(self, key, title="", value="", bootstyle=None, background=None, foreground=None):
+        """
+        Add a card to the end of the grid.
+
+        Args:
+            key: Unique identifier used by update_card, remove_card and command
+            title: Upper text line
+            value: Lower text line
+            bootstyle: ttkbootstrap style string whose color fills the card
+            background: Custom fill color (overrides bootstyle)
+            foreground: Text color (defaults to the theme foreground)
+        """
+        if key in self.cards:
+            raise ValueError(f"Card {key!r} already exists")
+        fill = self._resolve_color(bootstyle, background)
+        text_color = foreground or self.style.colors.get("fg")
+        self._next_id += 1
+        tag = f"card{self._next_id}"
+        card = {
+            "tag": tag,
+            "shape": self.create_polygon(0, 0, 0, 0, smooth=True, fill=fill, outline=fill, tags=(tag,)),
+            "title": self.create_text(0, 0, text=title, font=self.font, fill=text_color, anchor="s", tags=(tag,)),
+            "value": self.create_text(0, 0, text=value, font=self.value_font, fill=text_color, anchor="n", tags=(tag,)),
+        }
+        self.cards[key] = card
+        self.order.append(key)
+        if self._layout_width is not None:
+            self._place(len(self.order) - 1, card)
+            self._update_height()
+
+    def update_card(self, key, title=None, value=None, bootstyle=None, background=None, foreground=None):
+        """Change the text or colors of one card without touching the others"""
+        card = self.cards[key]
+        if title is not None:
+            self.itemconfigure(card["title"], text=title)
+        if value is not None:
+            self.itemconfigure(card["value"], text=value)
+        if bootstyle is not None or background is not None:
+            fill = self._resolve_color(bootstyle, background)
+            self.itemconfigure(card["shape"], fill=fill, outline=fill)
+        if foreground is not None:
+            self.itemconfigure(card["title"], fill=foreground)
+            self.itemconfigure(card["value"], fill=foreground)
+
+    def remove_card(self, key):
+        """Delete a card and reflow the cards after it"""
+        card = self.cards.pop(key)
+        index = self.order.index(key)
+        self.order.pop(index)
+        self.delete(card["tag"])
+        if self._layout_width is not None:
+            for position in range(index, len(self.order)):
+                self._place(position, self.cards[self.order[position]])
+            self._update_height()
+
+    def clear(self):
+        """Delete every card"""
+        self.delete("all")
+        self.cards.clear()
+        self.order.clear()
+        self._update_height()
+
+    def card_at(self, x, y):
+        """Return the key of the card under canvas coordinates, or None"""
+        if not self._card_width:
+            return None
+        column, column_offset = divmod(x, self._card_width + self.gap)
+        row, row_offset = divmod(y, self.card_height + self.gap)
+        if column_offset > self._card_width or row_offset > self.card_height or column >= self.columns:
+            return None
+        index = int(row) * self.columns + int(column)
+        if 0 <= index < len(self.order):
+            return self.order[index]
+        return None
+
+    def _on_click(self, event):
+        key = self.card_at(self.canvasx(event.x), self.canvasy(event.y))
+        if key is not None and self.command:
+            self.command(key)
+
+    def rescale(self):
+        """Re-lay out the cards and rescale their fonts for a new DPI scale"""
+        context = get_theme_context(self)
+        self.card_height, self.gap, self.radius = context.scaled(self.logical_sizes)
+        self.font, self.value_font = (context.scaled_font(font) for font in self.logical_fonts)
+        for card in self.cards.values():
+            self.itemconfigure(card["title"], font=self.font)
+            self.itemconfigure(card["value"], font=self.value_font)
+        if self._layout_width is not None:
+            self._layout(self._layout_width)
+        else:
+            self._update_height()
+
+    def _on_configure(self, event):
+        """Reflow only when the width changed; height changes never move cards"""
+        if event.width == self._layout_width:
+            return
+        self._layout(event.width)
+
+    def _layout(self, width):
+        """Place every card for a container width"""
+        self._layout_width = width
+        self._card_width = max(1, (width - self.gap * (self.columns - 1)) / self.columns)
+        for index, key in enumerate(self.order):
+            self._place(index, self.cards[key])
+        self._update_height()
+
+    def _place(self, index, card):
+        """Move one card's items to its grid cell"""
+        row, column = divmod(index, self.columns)
+        x = column * (self._card_width + self.gap)
+        y = row * (self.card_height + self.gap)
+        self.coords(card["shape"], *rounded_rect_points(self._card_width - 1, self.card_height - 1, self.radius, x, y))
+        center_x, center_y = x + self._card_width / 2, y + self.card_height / 2
+        self.coords(card["title"], center_x, center_y)
+        self.coords(card["value"], center_x, center_y)
+
+    def _update_height(self):
+        """Request the height needed by the current number of rows"""
+        rows = max(1, -(-len(self.order) // self.columns))
+        height = rows * self.card_height + (rows - 1) * self.gap
+        if int(self.cget("height")) != height:
+            self.configure(height=height)
@@ -0,0 +1,23 @@
+def darken_color(hex_color, factor=0.9):
+    """Darken a #rrggbb color by a factor (non-hex colors are returned as-is)"""
+    if not hex_color.startswith("#"):
+        return hex_color
+
+    rgb = tuple(int(hex_color[i:i+2], 16) for i in (1, 3, 5))
+    darkened_rgb = tuple(max(0, int(value * factor)) for value in rgb)
+    return f"#{darkened_rgb[0]:02x}{darkened_rgb[1]:02x}{darkened_rgb[2]:02x}"
+
+
+def lighten_color(hex_color, factor=1.1):
+    """Lighten a #rrggbb color by a factor (non-hex colors are returned as-is)"""
+    if not hex_color.startswith("#"):
+        return hex_color
+
+    rgb = tuple(int(hex_color[i:i+2], 16) for i in (1, 3, 5))
+    lightened_rgb = tuple(min(255, int(value * factor)) for value in rgb)
+    return f"#{lightened_rgb[0]:02x}{lightened_rgb[1]:02x}{lightened_rgb[2]:02x}"
+
+
+def hex_to_rgb(hex_color):
+    """Convert #rrggbb to an (r, g, b) tuple"""
+    return tuple(int(hex_color[i:i+2], 16) for i in (1, 3, 5))
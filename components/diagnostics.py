@@ -0,0 +1,235 @@
+import gc
+import weakref
+from tkinter import TclError
+from .theme_context import get_theme_context
+
+# Every component registers itself here on construction
+_components = weakref.WeakSet()
+# Tcl commands and bindings each component registered, checked again after destroy
+_registrations = weakref.WeakKeyDictionary()
+
+
+def _record(component):
+    record = _registrations.get(component)
+    if record is None:
+        record = _registrations[component] = {"commands": [], "shared": [], "bindings": []}
+    return record
+
+
+def track(component):
+    """
+    Register a component for resource accounting (called by each component).
+
+    The command lists of the component's widgets are recorded as well;
+    tkinter keeps adding to them (and removing unbound commands) until the
+    widget is destroyed, so find_leaks() can check afterwards whether every
+    command the component registered was actually deleted.
+    """
+    _components.add(component)
+    record = _record(component)
+    for widget in _subtree(component):
+        if widget._tclCommands is None:
+            widget._tclCommands = []
+        record["commands"].append(widget._tclCommands)
+
+
+def track_command(component, name, owner=None, key=None):
+    """
+    Record a Tcl command registered on behalf of a component outside its widgets.
+
+    Args:
+        component: The tracked component
+        name: The Tcl command name
+        owner: For a command shared by several components, the object routing
+            it (held weakly); the command only refers to the component while
+            key is in owner.handlers
+        key: The component's entry in owner.handlers
+    """
+    _record(component)["shared"].append((name, weakref.ref(owner) if owner is not None else None, key))
+
+
+def track_binding(component, widget, sequence, funcid):
+    """Record a binding added on behalf of a component (possibly to another widget)"""
+    _record(component)["bindings"].append((widget._w, sequence, funcid))
+
+
+def live_components():
+    """Return the tracked components that are still referenced from Python"""
+    return list(_components)
+
+
+def _subtree(widget):
+    """Yield a widget and its internal descendants, stopping at nested components"""
+    stack = [widget]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(child for child in current.children.values() if child not in _components)
+
+
+def _exists(widget):
+    try:
+        return bool(widget.winfo_exists())
+    except TclError:
+        return False
+
+
+def _after_commands(tk):
+    """Map the command name of every pending after() callback to its id"""
+    pending = {}
+    for after_id in tk.splitlist(tk.call("after", "info")):
+        try:
+            script = tk.splitlist(tk.call("after", "info", after_id))[0]
+        except TclError:
+            continue
+        pending[str(script).split()[0] if script else ""] = after_id
+    return pending
+
+
+def component_resources(component, pending_after=None):
+    """
+    Count the resources held by one component and its internal widgets.
+
+    Returns:
+        A dict with tcl_commands, bindings, after, images and styles counts
+    """
+    if pending_after is None:
+        pending_after = _after_commands(component.tk)
+    alive = _exists(component)
+    counts = {"tcl_commands": 0, "bindings": 0, "after": 0, "images": 0, "styles": 0}
+    for widget in _subtree(component):
+        commands = widget._tclCommands or ()
+        counts["tcl_commands"] += len(commands)
+        counts["after"] += sum(1 for name in commands if name in pending_after)
+        if not alive:
+            continue
+        counts["bindings"] += len(widget.bind())
+        for option, key in (("image", "images"), ("style", "styles")):
+            try:
+                if widget.cget(option):
+                    counts[key] += 1
+            except TclError:
+                pass
+    return counts
+
+
+def snapshot(root):
+    """
+    Take a snapshot of component and interpreter resource counts.
+
+    Args:
+        root: Any widget of the interpreter to inspect
+
+    Returns:
+        A dict with per-type component counts and per-resource totals
+    """
+    tk = root.tk
+    pending_after = _after_commands(tk)
+    by_type = {}
+    totals = {"tcl_commands": 0, "bindings": 0, "after": 0, "images": 0, "styles": 0}
+    for component in live_components():
+        if component.tk is not tk:
+            continue
+        name = type(component).__name__
+        by_type[name] = by_type.get(name, 0) + 1
+        for key, value in component_resources(component, pending_after).items():
+            totals[key] += value
+
+    style = get_theme_context(root).style
+    return {
+        "components": by_type,
+        "component_resources": totals,
+        "interpreter": {
+            "tcl_commands": len(tk.splitlist(tk.call("info", "commands"))),
+            "after": len(pending_after),
+            "images": len(tk.splitlist(tk.call("image", "names"))),
+            "styles": len(getattr(style, "_style_registry", ())),
+        },
+    }
+
+
+def diff_snapshots(before, after):
+    """
+    Return the non-zero differences between two snapshots.
+
+    Returns:
+        A dict with the same sections as snapshot(), holding only changed counts
+    """
+    result = {}
+    for section in ("components", "component_resources", "interpreter"):
+        old, new = before.get(section, {}), after.get(section, {})
+        changes = {key: new.get(key, 0) - old.get(key, 0) for key in set(old) | set(new)}
+        changes = {key: delta for key, delta in changes.items() if delta}
+        if changes:
+            result[section] = changes
+    return result
+
+
+def _command_exists(tk, name):
+    return bool(tk.splitlist(tk.call("info", "commands", name)))
+
+
+def _remaining(component, pending_after):
+    """
+    Return the recorded commands and bindings of a component that still exist.
+
+    Returns:
+        A (command names, (path, sequence) pairs, pending after() count) tuple
+    """
+    tk = component.tk
+    record = _registrations.get(component, {"commands": [], "shared": [], "bindings": []})
+    names = {name for commands in record["commands"] for name in commands}
+    commands = sorted(name for name in names if _command_exists(tk, name))
+    for name, owner, key in record["shared"]:
+        if owner is not None:
+            owner = owner()
+            if owner is None or key not in owner.handlers:
+                continue
+        if name not in commands and _command_exists(tk, name):
+            commands.append(name)
+    bindings = []
+    for path, sequence, funcid in record["bindings"]:
+        try:
+            script = tk.call("bind", path, sequence)
+        except TclError:
+            # The widget is gone, and its bindings with it
+            continue
+        if funcid in str(script):
+            bindings.append((path, sequence))
+    after = sum(1 for name in names if name in pending_after)
+    return commands, bindings, after
+
+
+def find_leaks():
+    """
+    Find components that were destroyed without cleaning up.
+
+    tkinter forgets a widget's commands and children on destroy, so the
+    commands and bindings recorded when the component was tracked are
+    checked against the interpreter instead. A destroyed component is
+    reported when any of them still exists, it has pending after()
+    callbacks, or it is simply still referenced from Python.
+
+    Returns:
+        A list of dicts describing each leaking component
+    """
+    leaks = []
+    components = live_components()
+    pending = {}
+    for component in components:
+        if _exists(component):
+            continue
+        if component.tk not in pending:
+            pending[component.tk] = _after_commands(component.tk)
+        commands, bindings, after = _remaining(component, pending[component.tk])
+        referrers = [type(ref).__name__ for ref in gc.get_referrers(component) if ref is not components]
+        leaks.append({
+            "path": component._w,
+            "type": type(component).__name__,
+            "tcl_commands": len(commands),
+            "commands": commands,
+            "bindings": bindings,
+            "after": after,
+            "referrers": referrers,
+        })
+    return leaks
@@ -0,0 +1,111 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from .async_bridge import get_dispatcher
+
+# Shared, lazily created worker pools keyed by kind ("thread" or "process")
+_pools = {}
+_pool_sizes = {"thread": 4, "process": 2}
+_lock = threading.Lock()
+_in_flight = 0
+
+
+def get_pool(kind="thread"):
+    """
+    Return the shared worker pool of the given kind, creating it on first use.
+
+    Args:
+        kind: "thread" or "process"
+
+    Returns:
+        A concurrent.futures executor bounded to the configured pool size
+    """
+    if kind not in _pool_sizes:
+        raise ValueError(f"Unknown pool kind: {kind!r}")
+    with _lock:
+        pool = _pools.get(kind)
+        if pool is None:
+            pool_class = ThreadPoolExecutor if kind == "thread" else ProcessPoolExecutor
+            pool = _pools[kind] = pool_class(max_workers=_pool_sizes[kind])
+        return pool
+
+
+def get_pool_size(kind="thread"):
+    """Return the maximum number of workers for a pool kind"""
+    return _pool_sizes[kind]
+
+
+def set_pool_size(kind, size):
+    """
+    Change the worker limit of a pool kind.
+
+    A running pool is shut down without waiting; its queued work still
+    finishes and the next submit creates a pool of the new size.
+    """
+    if kind not in _pool_sizes:
+        raise ValueError(f"Unknown pool kind: {kind!r}")
+    if size < 1:
+        raise ValueError("Pool size must be at least 1")
+    with _lock:
+        _pool_sizes[kind] = size
+        pool = _pools.pop(kind, None)
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+def in_flight_count():
+    """Return the number of submitted commands that have not completed yet"""
+    return _in_flight
+
+
+def submit(widget, func, *args, kind="thread", on_result=None, on_error=None):
+    """
+    Run func(*args) on a shared pool and deliver the outcome on the Tk thread.
+
+    Args:
+        widget: Any widget of the interpreter that should receive the result
+        func: The callable to run (must be picklable for the process pool)
+        kind: "thread" or "process"
+        on_result: Called on the Tk thread with the return value
+        on_error: Called on the Tk thread with the exception; when omitted the
+            error goes to the root's report_callback_exception
+
+    Returns:
+        The concurrent.futures.Future of the submitted call
+    """
+    global _in_flight
+    dispatcher = get_dispatcher(widget)
+    with _lock:
+        _in_flight += 1
+    try:
+        future = get_pool(kind).submit(func, *args)
+    except Exception:
+        _finished()
+        raise
+    future.add_done_callback(lambda f: _done(dispatcher, f, on_result, on_error))
+    return future
+
+
+def _finished():
+    global _in_flight
+    with _lock:
+        _in_flight -= 1
+
+
+def _done(dispatcher, future, on_result, on_error):
+    """Count a future as completed where it finishes and queue its delivery on the Tk thread"""
+    _finished()
+    dispatcher.call_soon(_deliver, dispatcher, future, on_result, on_error)
+
+
+def _deliver(dispatcher, future, on_result, on_error):
+    """Hand a completed future to the callbacks on the Tk thread"""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is None:
+        if on_result is not None:
+            on_result(future.result())
+    elif on_error is not None:
+        on_error(error)
+    else:
+        dispatcher.root.report_callback_exception(type(error), error, error.__traceback__)
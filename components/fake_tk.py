@@ -0,0 +1,681 @@
+import fnmatch
+import re
+import time
+import tkinter
+import _tkinter
+import ttkbootstrap as ttk
+from .profiler import operation_name
+
+# Tk widget creation commands (every "ttk::" command except the ones below also creates a widget)
+_WIDGET_COMMANDS = {
+    "button", "canvas", "checkbutton", "entry", "frame", "label", "labelframe", "listbox", "menu",
+    "menubutton", "message", "panedwindow", "radiobutton", "scale", "scrollbar", "spinbox", "text", "toplevel",
+}
+_TTK_COMMANDS = {"ttk::style", "ttk::setTheme", "ttk::themes"}
+
+# Event type numbers for %T, by the first word of a sequence
+_EVENT_TYPES = {
+    "KeyPress": 2, "Key": 2, "KeyRelease": 3, "ButtonPress": 4, "Button": 4, "ButtonRelease": 5,
+    "Motion": 6, "Enter": 7, "Leave": 8, "FocusIn": 9, "FocusOut": 10, "Expose": 12, "Destroy": 17,
+    "Map": 19, "Unmap": 18, "Configure": 22, "MouseWheel": 38,
+}
+
+# "event generate" options and the substitution letters they set
+_GENERATE_FIELDS = {
+    "x": "x", "y": "y", "rootx": "X", "rooty": "Y", "delta": "D", "width": "w", "height": "h",
+    "button": "b", "keysym": "K", "keycode": "k", "state": "s", "serial": "#", "time": "t",
+}
+
+_BOUND_COMMAND = re.compile(r'\[(\S+) ([^\]]*)\]')
+
+_parser = None
+
+
+def _tcl():
+    """A bare Tcl interpreter (no Tk, no display), only used to parse lists"""
+    global _parser
+    if _parser is None:
+        _parser = tkinter.Tcl()
+    return _parser
+
+
+def _flatten(args):
+    if len(args) == 1 and isinstance(args[0], tuple):
+        args = args[0]
+    return tuple(str(arg) if not isinstance(arg, (str, int, float, tuple)) else arg for arg in args)
+
+
+def _options(words):
+    """Pair up "-option value" words into a dict"""
+    return {str(words[i]).lstrip("-"): words[i + 1] for i in range(0, len(words) - 1, 2)}
+
+
+def _number(value, default=1):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+class FakeTkApp:
+    """
+    A stand-in for the _tkinter interpreter that records calls instead of executing them.
+
+    It keeps just enough state to answer the queries components make (widget
+    options, sizes, bindings, images, after callbacks, ttk style settings), so
+    whole UIs can be built without a display and thousands of times faster
+    than with real widgets. What remains is the Python side of the work:
+    kwargs handling, color math, point lists and the Tcl calls themselves,
+    each counted by operation.
+
+    Args:
+        max_log: Maximum number of calls kept in log (all are counted)
+    """
+    def __init__(self, max_log=100000):
+        self.max_log = max_log
+        self.log = []
+        self.calls = 0
+        self.operations = {}
+        self.widgets = {".": {"class": "Tk", "options": {}, "size": [1, 1]}}
+        self.bindings = {}
+        self.commands = {}
+        self.variables = {"tk_version": _tkinter.TK_VERSION, "tcl_version": _tkinter.TCL_VERSION}
+        self.images = {}
+        self.styles = {}
+        self.theme = "default"
+        self.themes = {"default", "clam", "alt", "classic"}
+        self.pending = {}
+        self._counter = 0
+
+    # _tkinter interface
+
+    def call(self, *args):
+        args = _flatten(args)
+        self.calls += 1
+        operation = operation_name(args)
+        self.operations[operation] = self.operations.get(operation, 0) + 1
+        if len(self.log) < self.max_log:
+            self.log.append(args)
+        return self._dispatch(args)
+
+    def eval(self, script):
+        """Run a script command by command (words are not substituted)"""
+        if script.strip() == "return $ttk::currentTheme":
+            return self.theme
+        parser = _tcl().tk
+        result = ""
+        command = ""
+        for line in script.splitlines(keepends=True):
+            command += line
+            if not parser.getboolean(parser.call("info", "complete", command)):
+                continue
+            if command.strip() and not command.lstrip().startswith("#"):
+                result = self.call(*parser.splitlist(command))
+            command = ""
+        return result
+
+    def createcommand(self, name, func):
+        self.commands[name] = func
+
+    def deletecommand(self, name):
+        self.commands.pop(name, None)
+
+    def splitlist(self, value):
+        if isinstance(value, (tuple, list)):
+            return tuple(value)
+        if value == "" or value is None:
+            return ()
+        return _tcl().tk.splitlist(str(value))
+
+    def split(self, value):
+        return self.splitlist(value)
+
+    def getint(self, value):
+        return int(value)
+
+    def getdouble(self, value):
+        return float(value)
+
+    def getboolean(self, value):
+        if isinstance(value, str):
+            if value.lower() in ("1", "true", "yes", "on"):
+                return True
+            if value.lower() in ("0", "false", "no", "off"):
+                return False
+            raise tkinter.TclError(f'expected boolean value but got "{value}"')
+        return bool(value)
+
+    def getvar(self, name):
+        return self.variables.get(name, "")
+
+    def setvar(self, name, value="1"):
+        self.variables[name] = value
+
+    def unsetvar(self, name):
+        self.variables.pop(name, None)
+
+    globalgetvar = getvar
+    globalsetvar = setvar
+    globalunsetvar = unsetvar
+
+    def wantobjects(self):
+        return True
+
+    def interpaddr(self):
+        return 0
+
+    def mainloop(self, n=0):
+        self.run_pending()
+
+    def dooneevent(self, flags=0):
+        return self.run_pending() > 0
+
+    def quit(self):
+        pass
+
+    # Driving the fake
+
+    def set_size(self, path, width, height):
+        """Give a widget an actual size and deliver <Configure> to it"""
+        entry = self.widgets.get(str(path))
+        if entry is not None:
+            entry["size"] = [width, height]
+            self.fire(path, "<Configure>", w=width, h=height)
+
+    def fire(self, path, sequence, **fields):
+        """
+        Deliver an event to the bindings of each bindtag of a widget, as Tk does.
+
+        Args:
+            path: Widget path (or widget)
+            sequence: Event sequence, e.g. "<Enter>" or "<<ThemeChanged>>"
+            fields: Event fields by substitution letter without the %, e.g. x=3, D=-120
+        """
+        path = str(path)
+        tags = self._bindtags(path)
+        kind = sequence.strip("<>").split("-")[0]
+        values = {"#": 0, "b": "??", "f": 0, "h": "??", "k": "??", "s": 0, "t": 0, "w": "??", "x": 0,
+                  "y": 0, "A": "", "E": 0, "K": "??", "N": "??", "W": path, "T": _EVENT_TYPES.get(kind, 35),
+                  "X": 0, "Y": 0, "D": 0}
+        values.update(fields)
+        for tag in tags:
+            script = self.bindings.get((tag, sequence))
+            if script and self._run_binding(script, values) == "break":
+                break
+
+    def run_pending(self, idle_only=False):
+        """
+        Run the after() callbacks scheduled so far, timers at once.
+
+        Returns:
+            The number of callbacks run
+        """
+        due = [(after_id, command) for after_id, (command, idle) in self.pending.items() if idle or not idle_only]
+        for after_id, _ in due:
+            del self.pending[after_id]
+        for _, command in due:
+            func = self.commands.get(command)
+            if func is not None:
+                func()
+        return len(due)
+
+    def reset_counts(self):
+        """Forget the call log and counts"""
+        self.log = []
+        self.calls = 0
+        self.operations = {}
+
+    # Command handlers
+
+    def _dispatch(self, args):
+        if not args:
+            return ""
+        command = str(args[0])
+        if command.startswith("."):
+            return self._widget_command(command, args[1:])
+        if command in self.images:
+            return self._image_command(command, args[1:])
+        if command in _WIDGET_COMMANDS or (command.startswith("ttk::") and command not in _TTK_COMMANDS):
+            return self._create_widget(command, args[1:])
+        if command in self.commands:
+            return self.commands[command](*args[1:])
+        handler = getattr(self, "_cmd_" + command.lstrip(":").replace("::", "_"), None)
+        return handler(args[1:]) if handler is not None else ""
+
+    def _create_widget(self, command, words):
+        path = str(words[0])
+        options = _options(words[1:])
+        widget_class = options.pop("class", None) or command.split("::")[-1].capitalize()
+        if command.startswith("ttk::"):
+            widget_class = "T" + widget_class
+        self.widgets[path] = {"class": widget_class, "options": options, "size": None, "items": 0}
+        return path
+
+    def _widget_command(self, path, words):
+        entry = self.widgets.get(path)
+        if entry is None:
+            raise tkinter.TclError(f'invalid command name "{path}"')
+        if not words:
+            return ""
+        operation = words[0]
+        options = entry["options"]
+        if operation in ("configure", "config"):
+            if len(words) == 1:
+                return tuple(("-" + key, "", "", "", value) for key, value in options.items())
+            if len(words) == 2:
+                key = str(words[1]).lstrip("-")
+                return ("-" + key, "", "", "", options.get(key, ""))
+            options.update(_options(words[1:]))
+            return ""
+        if operation == "cget":
+            return options.get(str(words[1]).lstrip("-"), "")
+        if operation == "create":
+            entry["items"] += 1
+            return entry["items"]
+        if entry["class"] == "Listbox" and operation in ("insert", "delete", "get", "size", "index"):
+            return self._listbox_command(entry, operation, words[1:])
+        if entry["class"] == "Menu" and operation in ("add", "delete", "index", "entrycget", "entryconfigure", "type"):
+            return self._menu_command(entry, operation, words[1:])
+        if operation in ("yview", "xview") and len(words) == 1:
+            return (0.0, 1.0)
+        if operation in ("canvasx", "canvasy"):
+            # The view never scrolls, so window and canvas coordinates agree
+            return words[1]
+        if operation in ("curselection", "bbox", "find", "gettags", "state"):
+            return ()
+        if operation in ("size", "index", "instate"):
+            return 0
+        return ""
+
+    def _listbox_command(self, entry, operation, words):
+        """Model the rows of a listbox, so its size and contents can be checked"""
+        rows = entry.setdefault("rows", [])
+
+        def index(word):
+            # "end" is the position after the last row, as in Tk
+            return len(rows) if str(word) == "end" else _number(word, 0)
+
+        if operation == "size":
+            return len(rows)
+        if operation == "index":
+            return index(words[0])
+        if operation == "insert":
+            position = max(0, min(index(words[0]), len(rows)))
+            rows[position:position] = [str(word) for word in words[1:]]
+            return ""
+        first = max(0, index(words[0]))
+        last = min(index(words[1]) if len(words) > 1 else first, len(rows) - 1)
+        if operation == "delete":
+            del rows[first:last + 1]
+            return ""
+        if len(words) > 1:
+            return tuple(rows[first:last + 1])
+        return rows[first] if first < len(rows) else ""
+
+    def _menu_command(self, entry, operation, words):
+        """Model the entries of a menu, so repopulating it can be checked"""
+        entries = entry.setdefault("entries", [])
+
+        def index(word):
+            if str(word) in ("end", "last"):
+                return len(entries) - 1
+            return _number(word, 0)
+
+        if operation == "add":
+            entries.append((str(words[0]), _options(words[1:])))
+            return ""
+        if operation == "index":
+            position = index(words[0])
+            return "none" if position < 0 else position
+        if operation == "delete":
+            last = index(words[1]) if len(words) > 1 else index(words[0])
+            del entries[index(words[0]):last + 1]
+            return ""
+        kind, options = entries[index(words[0])]
+        if operation == "type":
+            return kind
+        if operation == "entrycget":
+            return options.get(str(words[1]).lstrip("-"), "")
+        if len(words) == 1:
+            return tuple(("-" + key, "", "", "", value) for key, value in options.items())
+        options.update(_options(words[1:]))
+        return ""
+
+    def _image_command(self, name, words):
+        options = self.images[name]
+        if words and words[0] in ("configure", "config") and len(words) > 2:
+            options.update(_options(words[1:]))
+        elif words and words[0] == "cget":
+            return options.get(str(words[1]).lstrip("-"), "")
+        elif words and words[0] == "copy" and "-to" in words:
+            # copy source -to x1 y1 x2 y2 resizes an auto-sized image
+            position = words.index("-to")
+            coordinates = [_number(word, 0) for word in words[position + 1:position + 5] if str(word)[:1] != "-"]
+            if len(coordinates) == 4:
+                options["width"], options["height"] = coordinates[2], coordinates[3]
+        return ""
+
+    def _cmd_image(self, words):
+        operation = words[0] if words else ""
+        if operation == "create":
+            name = str(words[2]) if len(words) > 2 and not str(words[2]).startswith("-") else f"image{self._next()}"
+            self.images[name] = _options(words[3:] if name == str(words[2]) else words[2:])
+            return name
+        if operation == "delete":
+            for name in words[1:]:
+                self.images.pop(str(name), None)
+            return ""
+        if operation == "names":
+            return tuple(self.images)
+        if operation in ("width", "height"):
+            return _number(self.images.get(str(words[1]), {}).get(operation), 0)
+        if operation == "inuse":
+            return False
+        return ""
+
+    def _cmd_winfo(self, words):
+        operation, path = words[0], str(words[1]) if len(words) > 1 else "."
+        entry = self.widgets.get(path)
+        if operation == "exists":
+            return int(entry is not None)
+        if operation in ("width", "height", "reqwidth", "reqheight"):
+            index = 0 if operation.endswith("width") else 1
+            if entry is None:
+                return 1
+            if entry["size"] is not None and not operation.startswith("req"):
+                return entry["size"][index]
+            return _number(entry["options"].get("width" if index == 0 else "height"), 1)
+        if operation == "class":
+            return entry["class"] if entry else ""
+        if operation == "toplevel":
+            return "."
+        if operation == "children":
+            prefix = "." if path == "." else path + "."
+            return tuple(child for child in self.widgets if child.startswith(prefix) and child[len(prefix):] and "." not in child[len(prefix):])
+        if operation in ("ismapped", "viewable"):
+            return 1
+        if operation in ("screenwidth", "vrootwidth"):
+            return 1920
+        if operation in ("screenheight", "vrootheight"):
+            return 1080
+        if operation == "rgb":
+            return (0, 0, 0)
+        if operation == "pointerxy":
+            return (0, 0)
+        if operation == "fpixels":
+            return float(_number(words[2], 0))
+        if operation == "pixels":
+            return _number(words[2], 0)
+        if operation == "depth":
+            return 24
+        if operation in ("manager", "name", "server", "visual"):
+            return ""
+        return 0
+
+    def _cmd_after(self, words):
+        operation = str(words[0])
+        if operation == "cancel":
+            self.pending.pop(str(words[1]), None)
+            return ""
+        if operation == "info":
+            if len(words) > 1:
+                command, idle = self.pending.get(str(words[1]), ("", True))
+                return (command, "idle" if idle else "timer")
+            return tuple(self.pending)
+        if len(words) < 2:
+            return ""
+        after_id = f"after#{self._next()}"
+        self.pending[after_id] = (str(words[1]), operation == "idle")
+        return after_id
+
+    def _cmd_update(self, words):
+        self.run_pending(idle_only=bool(words))
+        return ""
+
+    def _cmd_bind(self, words):
+        tag = str(words[0])
+        if len(words) == 1:
+            return tuple(sequence for bound_tag, sequence in self.bindings if bound_tag == tag)
+        sequence = str(words[1])
+        if len(words) == 2:
+            return self.bindings.get((tag, sequence), "")
+        script = str(words[2])
+        if script.startswith("+"):
+            script = self.bindings.get((tag, sequence), "") + "\n" + script[1:]
+        self.bindings[(tag, sequence)] = script
+        return ""
+
+    def _cmd_bindtags(self, words):
+        path = str(words[0])
+        if len(words) == 1:
+            return self._bindtags(path)
+        entry = self.widgets.get(path)
+        if entry is not None:
+            entry["bindtags"] = tuple(str(tag) for tag in (words[1:] if len(words) > 2 else self.splitlist(words[1])))
+        return ""
+
+    def _bindtags(self, path):
+        """Return the bindtags of a widget; Tk's default is (path, class, toplevel, "all")"""
+        entry = self.widgets.get(path)
+        if entry is not None and "bindtags" in entry:
+            return entry["bindtags"]
+        toplevel = path
+        while toplevel != "." and self.widgets.get(toplevel, {}).get("class") != "Toplevel":
+            toplevel = toplevel.rsplit(".", 1)[0] or "."
+        tags = (path, entry["class"] if entry else "")
+        return tags + ("all",) if toplevel == path else tags + (toplevel, "all")
+
+    def _cmd_event(self, words):
+        if words[0] == "generate" and len(words) > 2:
+            fields = {_GENERATE_FIELDS[key]: value for key, value in _options(words[3:]).items() if key in _GENERATE_FIELDS}
+            self.fire(words[1], str(words[2]), **fields)
+        return ""
+
+    def _cmd_destroy(self, words):
+        for path in map(str, words):
+            doomed = [child for child in self.widgets if child == path or child.startswith(path + ".")]
+            for child in sorted(doomed, key=len, reverse=True):
+                self.fire(child, "<Destroy>")
+                del self.widgets[child]
+                for key in [key for key in self.bindings if key[0] == child]:
+                    del self.bindings[key]
+        return ""
+
+    def _cmd_tk(self, words):
+        if words[0] == "scaling":
+            return 96 / 72
+        if words[0] == "windowingsystem":
+            return "x11"
+        return ""
+
+    def _cmd_info(self, words):
+        if words and words[0] == "patchlevel":
+            return _tkinter.TCL_VERSION + ".0"
+        if words and words[0] == "exists":
+            return int(str(words[1]) in self.variables)
+        if words and words[0] == "commands":
+            names = tuple(self.commands) + tuple(self.widgets) + tuple(self.images)
+            return tuple(name for name in names if len(words) < 2 or fnmatch.fnmatchcase(name, str(words[1])))
+        return ""
+
+    def _cmd_font(self, words):
+        operation = words[0]
+        if operation in ("actual", "configure") and len(words) <= 2:
+            return ("-family", "Helvetica", "-size", 10, "-weight", "normal", "-slant", "roman", "-underline", 0, "-overstrike", 0)
+        if operation in ("actual", "configure") and len(words) == 3:
+            return {"-family": "Helvetica", "-size": 10, "-weight": "normal", "-slant": "roman"}.get(str(words[2]), 0)
+        if operation == "measure":
+            return 7 * len(str(words[-1]))
+        if operation == "metrics":
+            return {"-ascent": 12, "-descent": 3, "-linespace": 15, "-fixed": 0}.get(str(words[-1]), ("-ascent", 12, "-descent", 3, "-linespace", 15, "-fixed", 0))
+        if operation == "create":
+            return str(words[1]) if len(words) > 1 and not str(words[1]).startswith("-") else f"font{self._next()}"
+        if operation in ("names", "families"):
+            return ()
+        return ""
+
+    def _cmd_ttk_style(self, words):
+        operation = words[0]
+        if operation == "theme":
+            if words[1] == "use":
+                if len(words) == 2:
+                    return self.theme
+                self._cmd_ttk_setTheme(words[2:])
+            elif words[1] == "create":
+                self.themes.add(str(words[2]))
+            elif words[1] == "names":
+                return tuple(self.themes)
+            return ""
+        if operation in ("configure", "map"):
+            settings = self.styles.setdefault((operation, str(words[1])), {})
+            if len(words) == 3:
+                return settings.get(str(words[2]).lstrip("-"), "")
+            settings.update(_options(words[2:]))
+            if operation == "configure" and len(words) > 2:
+                self.fire(".", "<<ThemeChanged>>")
+            return ""
+        if operation == "lookup":
+            style, option = str(words[1]), str(words[2]).lstrip("-")
+            for name in (style, style.split(".")[-1], "."):
+                value = self.styles.get(("configure", name), {}).get(option)
+                if value is not None:
+                    return value
+            return ""
+        if operation == "element" and len(words) > 1 and words[1] == "names":
+            return ()
+        return ""
+
+    def _cmd_ttk_setTheme(self, words):
+        self.theme = str(words[0])
+        self.themes.add(self.theme)
+        for path in list(self.widgets):
+            self.fire(path, "<<ThemeChanged>>")
+        return ""
+
+    def _cmd_ttk_themes(self, words):
+        return tuple(self.themes)
+
+    def _cmd_msgcat_mc(self, words):
+        return words[0] if words else ""
+
+    def _cmd_msgcat_mcmset(self, words):
+        return len(self.splitlist(words[1])) // 2 if len(words) > 1 else 0
+
+    def _cmd_wm(self, words):
+        if words[0] == "geometry" and len(words) == 2:
+            return "1x1+0+0"
+        if words[0] == "state" and len(words) == 2:
+            return "normal"
+        return ""
+
+    def _cmd_pack(self, words):
+        return () if words and words[0] in ("slaves", "content") else ""
+
+    _cmd_grid = _cmd_pack
+    _cmd_place = _cmd_pack
+
+    def _run_binding(self, script, values):
+        """Run the commands of a binding script: tkinter's "[cmd %# ...]" form or plain "cmd args" lines"""
+        result = None
+        for line in script.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            calls = _BOUND_COMMAND.findall(line)
+            if not calls:
+                name, _, fields = line.partition(" ")
+                calls = [(name, fields)]
+            for name, fields in calls:
+                func = self.commands.get(name)
+                if func is None:
+                    continue
+                args = [str(values.get(field[1:], field)) if field.startswith("%") else field for field in fields.split()]
+                result = func(*args)
+                if result == "break":
+                    return result
+        return result
+
+    def _next(self):
+        self._counter += 1
+        return self._counter
+
+
+class FakeRoot(tkinter.Tk):
+    """
+    A Tk root window backed by FakeTkApp, for tests and microbenchmarks.
+
+    Components are created under it like under a real root, with the
+    ttkbootstrap style of theme, but no Tk window or X11 connection is
+    involved. measure() times how much Python work a component costs per
+    instance; the fake's log and operations show the Tcl calls it issues.
+    ttkbootstrap keeps one Style per process, so do not mix a fake root with
+    a real one in the same process.
+
+    Usage:
+        root = FakeRoot()
+        root.measure("RoundedButton", lambda: RoundedButton(root, text="OK"), count=1000)
+        print(root.report())
+
+    Args:
+        theme: ttkbootstrap theme name
+        max_log: Maximum number of calls kept in the log
+    """
+    def __init__(self, theme="darkly", max_log=100000):
+        self.master = None
+        self.children = {}
+        self._tclCommands = None
+        self.tk = FakeTkApp(max_log=max_log)
+        self._loadtk()
+        self.style = ttk.Style(theme)
+        self.measurements = {}
+
+    @property
+    def fake(self):
+        """The FakeTkApp of this root"""
+        return self.tk
+
+    def measure(self, label, factory, count=1):
+        """
+        Create count objects with factory() and record the cost per instance.
+
+        Args:
+            label: Name of the measurement in the report
+            factory: Called count times, e.g. lambda: RoundedFrame(root)
+            count: Number of instances
+
+        Returns:
+            The created objects
+        """
+        fake = self.tk
+        calls, operations = fake.calls, dict(fake.operations)
+        start = time.perf_counter()
+        created = [factory() for _ in range(count)]
+        elapsed = time.perf_counter() - start
+        entry = self.measurements.setdefault(label, {"instances": 0, "time": 0.0, "calls": 0, "operations": {}})
+        entry["instances"] += count
+        entry["time"] += elapsed
+        entry["calls"] += fake.calls - calls
+        for operation, total in fake.operations.items():
+            added = total - operations.get(operation, 0)
+            if added:
+                entry["operations"][operation] = entry["operations"].get(operation, 0) + added
+        return created
+
+    def report(self, limit=20):
+        """
+        Format the measurements, most expensive per instance first.
+
+        Returns:
+            A plain-text table
+        """
+        lines = [f"{'component':<32} {'instances':>9} {'us/instance':>11} {'calls/instance':>14}  top operations"]
+        ranked = sorted(self.measurements.items(), key=lambda item: item[1]["time"] / item[1]["instances"], reverse=True)
+        for label, entry in ranked[:limit]:
+            instances = entry["instances"]
+            top = sorted(entry["operations"].items(), key=lambda item: item[1], reverse=True)[:3]
+            top_text = ", ".join(f"{name} x{count / instances:g}" for name, count in top)
+            lines.append(
+                f"{label:<32} {instances:>9} {entry['time'] / instances * 1e6:>11.1f} "
+                f"{entry['calls'] / instances:>14.1f}  {top_text}"
+            )
+        return "\n".join(lines)
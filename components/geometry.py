@@ -0,0 +1,211 @@
+import math
+from collections import OrderedDict
+
+
+class GeometryCache:
+    """
+    A bounded least-recently-used cache for outline point lists.
+
+    One instance is shared by every frame in the process, so layouts that
+    reuse a handful of (width, height, radius) combinations build each point
+    list once.
+
+    Args:
+        maxsize: Maximum number of point lists kept
+    """
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, build):
+        """Return the cached value for key, calling build() on a miss"""
+        entries = self._entries
+        value = entries.get(key)
+        if value is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = entries[key] = build()
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return value
+
+    def resize(self, maxsize):
+        """Change the capacity, evicting the oldest entries if needed"""
+        self.maxsize = maxsize
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry and reset the statistics"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Return hit/miss statistics as a dict"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+# Shared by every component that draws rounded outlines
+outline_cache = GeometryCache()
+
+# Quarter-circle (cos, sin) tables keyed by segment count
+_unit_tables = {}
+
+
+def _quarter_circle(segments):
+    """Return segments + 1 precomputed (cos, sin) pairs covering 0-90 degrees"""
+    table = _unit_tables.get(segments)
+    if table is None:
+        step = math.pi / 2 / segments
+        table = _unit_tables[segments] = tuple((math.cos(i * step), math.sin(i * step)) for i in range(segments + 1))
+    return table
+
+
+def rounded_rect_points(width, height, radius, x=0, y=0):
+    """
+    Build the control points of a smoothed rounded rectangle.
+
+    The points are meant for create_polygon(..., smooth=True), which turns
+    the doubled corner points into curves.
+
+    Args:
+        width: Right edge relative to x
+        height: Bottom edge relative to y
+        radius: Tuple of 4 corner radii (TL, TR, BR, BL)
+        x: Left edge
+        y: Top edge
+
+    Returns:
+        A flat list of 24 coordinates
+    """
+    radius_tl, radius_tr, radius_br, radius_bl = radius
+    right, bottom = x + width, y + height
+    return [
+        x + radius_tl, y,
+        right - radius_tr, y,
+        right, y,
+        right, y + radius_tr,
+        right, bottom - radius_br,
+        right, bottom,
+        right - radius_br, bottom,
+        x + radius_bl, bottom,
+        x, bottom,
+        x, bottom - radius_bl,
+        x, y + radius_tl,
+        x, y
+    ]
+
+
+def arc_rect_points(width, height, radius, segments=8):
+    """
+    Build a rounded rectangle whose corners are sampled true circular arcs.
+
+    Unlike rounded_rect_points the result is drawn without smoothing, so the
+    corners are exact quarter circles at any size.
+
+    Args:
+        width: Right edge
+        height: Bottom edge
+        radius: Tuple of 4 corner radii (TL, TR, BR, BL)
+        segments: Number of straight segments per corner
+
+    Returns:
+        A flat list of 8 * (segments + 1) coordinates
+    """
+    table = _quarter_circle(segments)
+    limit = min(width, height) / 2
+    radius_tl, radius_tr, radius_br, radius_bl = (min(r, limit) for r in radius)
+    points = []
+    for c, s in table:
+        points += (radius_tl - radius_tl * c, radius_tl - radius_tl * s)
+    for c, s in table:
+        points += (width - radius_tr + radius_tr * s, radius_tr - radius_tr * c)
+    for c, s in table:
+        points += (width - radius_br + radius_br * c, height - radius_br + radius_br * s)
+    for c, s in table:
+        points += (radius_bl - radius_bl * s, height - radius_bl + radius_bl * c)
+    return points
+
+
+def outline_points(width, height, radius, corner_style="smooth", segments=8):
+    """
+    Return the memoized outline of a rounded rectangle at the origin.
+
+    Args:
+        width: Right edge
+        height: Bottom edge
+        radius: Tuple of 4 corner radii (TL, TR, BR, BL)
+        corner_style: "smooth" (spline through control points) or "arc"
+        segments: Segments per corner for the "arc" style
+
+    Returns:
+        A tuple of coordinates shared between callers; do not mutate it
+    """
+    radius = tuple(radius)
+    if corner_style == "arc":
+        key = ("arc", width, height, radius, segments)
+        return outline_cache.get(key, lambda: tuple(arc_rect_points(width, height, radius, segments)))
+    key = ("smooth", width, height, radius)
+    return outline_cache.get(key, lambda: tuple(rounded_rect_points(width, height, radius)))
+
+
+def spline_points(points, steps=12):
+    """
+    Flatten a closed smoothed polygon the way Tk draws it.
+
+    Tk's create_polygon(..., smooth=True) replaces every point by a cubic
+    Bezier running between the midpoints of its two edges, with control
+    points 5/6 of the way towards it; steps matches -splinesteps.
+
+    Args:
+        points: Flat list of control point coordinates
+        steps: Line segments per curve
+
+    Returns:
+        A flat list of coordinates of the drawn outline
+    """
+    vertices = list(zip(points[0::2], points[1::2]))
+    count = len(vertices)
+    result = []
+    for index in range(count):
+        (x0, y0), (x1, y1), (x2, y2) = vertices[index - 1], vertices[index], vertices[(index + 1) % count]
+        start = ((x0 + x1) / 2, (y0 + y1) / 2)
+        control1 = (x0 / 6 + x1 * 5 / 6, y0 / 6 + y1 * 5 / 6)
+        control2 = (x1 * 5 / 6 + x2 / 6, y1 * 5 / 6 + y2 / 6)
+        end = ((x1 + x2) / 2, (y1 + y2) / 2)
+        for step in range(steps):
+            t = step / steps
+            u = 1 - t
+            a, b, c, d = u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t
+            result += (
+                a * start[0] + b * control1[0] + c * control2[0] + d * end[0],
+                a * start[1] + b * control1[1] + c * control2[1] + d * end[1],
+            )
+    return result
+
+
+def drawn_outline(width, height, radius, corner_style="smooth", segments=8):
+    """
+    Return the memoized outline Tk actually draws for outline_points().
+
+    The "smooth" control points are flattened with spline_points(); the
+    "arc" points are drawn as they are.
+
+    Returns:
+        A tuple of coordinates shared between callers; do not mutate it
+    """
+    points = outline_points(width, height, radius, corner_style, segments)
+    if corner_style == "arc":
+        return points
+    key = ("drawn", width, height, tuple(radius))
+    return outline_cache.get(key, lambda: tuple(spline_points(points)))
+
+
+def geometry_cache_info():
+    """Return hit/miss statistics of the shared outline cache"""
+    return outline_cache.info()
@@ -0,0 +1,171 @@
+from collections import OrderedDict
+from fractions import Fraction
+from tkinter import PhotoImage, TclError
+from .theme_context import get_theme_context
+
+try:
+    from PIL import Image, ImageTk
+except ImportError:
+    Image = None
+
+
+class IconAtlas:
+    """
+    Loads icon sheets once and hands out shared, scaled PhotoImages.
+
+    Icons are addressed by name. Each (name, pixel size) pair is rendered once
+    and reference counted, so any number of buttons showing the same icon
+    share one Tk image. Images nobody uses any more are kept in a small spare
+    pool before they are deleted, so rebuilding a toolbar does not reload them.
+    Scaling uses Pillow when it is installed and Tk's zoom/subsample otherwise.
+
+    Args:
+        master: Any widget of the Tk interpreter the images belong to
+        spare: Number of unused images kept before deleting them
+    """
+    def __init__(self, master, spare=16):
+        self.master = master
+        self.spare = spare
+        self._sheets = {}
+        self._icons = {}
+        self._images = {}
+        self._refs = {}
+        self._keys = {}
+        self._unused = OrderedDict()
+
+    def add_sheet(self, path, names, cell_size, columns=None):
+        """
+        Register a sheet of equally sized icons.
+
+        Args:
+            path: Image file of the sheet (PNG or GIF without Pillow)
+            names: Icon names in row-major cell order (None skips a cell)
+            cell_size: Cell size in pixels, int or (width, height)
+            columns: Cells per row (default: sheet width // cell width)
+        """
+        width, height = (cell_size, cell_size) if isinstance(cell_size, int) else cell_size
+        sheet = self._load(path)
+        if columns is None:
+            columns = max(1, self._sheet_size(sheet)[0] // width)
+        for index, name in enumerate(names):
+            if name is not None:
+                x, y = (index % columns) * width, (index // columns) * height
+                self._icons[name] = (path, x, y, width, height)
+
+    def add_icon(self, name, path):
+        """Register a single-icon image file"""
+        sheet = self._load(path)
+        self._icons[name] = (path, 0, 0) + self._sheet_size(sheet)
+
+    def names(self):
+        """Return the registered icon names"""
+        return list(self._icons)
+
+    def acquire(self, name, size=16):
+        """
+        Return the shared PhotoImage of an icon and take a reference to it.
+
+        Args:
+            name: A registered icon name
+            size: Size in logical pixels, scaled by the display's DPI
+
+        Returns:
+            A PhotoImage; pass it to release() when it is no longer shown
+        """
+        if name not in self._icons:
+            raise KeyError(f"Unknown icon {name!r}")
+        # Keyed by pixel size, so each DPI scale gets (and keeps) its own image
+        key = (name, max(1, get_theme_context(self.master).scaled(size)))
+        image = self._images.get(key)
+        if image is None:
+            image = self._images[key] = self._render(key)
+            self._keys[str(image)] = key
+        self._unused.pop(key, None)
+        self._refs[key] = self._refs.get(key, 0) + 1
+        return image
+
+    def release(self, image):
+        """Drop a reference taken by acquire(); unused images are evicted"""
+        key = self._keys.get(str(image))
+        if key is None or key not in self._refs:
+            return
+        self._refs[key] -= 1
+        if self._refs[key] > 0:
+            return
+        del self._refs[key]
+        self._unused[key] = True
+        while len(self._unused) > self.spare:
+            stale, _ = self._unused.popitem(last=False)
+            self._delete(stale)
+
+    def clear(self):
+        """Delete every unused image"""
+        for key in list(self._unused):
+            self._delete(key)
+        self._unused.clear()
+
+    def info(self):
+        """Return counts of icons, live images and references"""
+        return {
+            "icons": len(self._icons),
+            "images": len(self._images),
+            "unused": len(self._unused),
+            "references": sum(self._refs.values()),
+        }
+
+    def _load(self, path):
+        sheet = self._sheets.get(path)
+        if sheet is None:
+            if Image is not None:
+                sheet = Image.open(path).convert("RGBA")
+                sheet.load()
+            else:
+                sheet = PhotoImage(master=self.master, file=path)
+            self._sheets[path] = sheet
+        return sheet
+
+    def _sheet_size(self, sheet):
+        if Image is not None:
+            return sheet.size
+        return sheet.width(), sheet.height()
+
+    def _render(self, key):
+        """Slice an icon from its sheet and scale it to the key's pixel size"""
+        name, pixels = key
+        path, x, y, width, height = self._icons[name]
+        sheet = self._sheets[path]
+        target = (pixels, max(1, round(pixels * height / width)))
+        if Image is not None:
+            icon = sheet.crop((x, y, x + width, y + height))
+            if icon.size != target:
+                icon = icon.resize(target, Image.LANCZOS)
+            return ImageTk.PhotoImage(icon, master=self.master)
+
+        cell = PhotoImage(master=self.master)
+        cell.tk.call(cell, "copy", sheet, "-from", x, y, x + width, y + height)
+        if target[0] == width:
+            return cell
+        ratio = Fraction(target[0], width).limit_denominator(8)
+        zoomed = PhotoImage(master=self.master)
+        zoomed.tk.call(zoomed, "copy", cell, "-zoom", ratio.numerator)
+        icon = PhotoImage(master=self.master)
+        icon.tk.call(icon, "copy", zoomed, "-subsample", ratio.denominator)
+        return icon
+
+    def _delete(self, key):
+        image = self._images.pop(key, None)
+        if image is None:
+            return
+        self._keys.pop(str(image), None)
+        try:
+            self.master.tk.call("image", "delete", str(image))
+        except TclError:
+            pass
+
+
+def get_icon_atlas(widget):
+    """Return the IconAtlas shared by the interpreter owning widget"""
+    context = get_theme_context(widget)
+    if context.icon_atlas is None:
+        context.icon_atlas = IconAtlas(context.root)
+    return context.icon_atlas
@@ -0,0 +1,220 @@
+import math
+import time
+import tkinter
+import ttkbootstrap as ttk
+from .rounded_frame import RoundedFrame
+
+_original_call = tkinter.CallWrapper.__call__
+_active_tracer = None
+
+
+class LatencyHistogram:
+    """
+    A log-bucketed latency histogram (about 12% resolution, 1 us to 100 s).
+
+    Recording is O(1) and memory is fixed, so every handler call can be kept.
+    """
+    GROWTH = 1.12
+    MIN_SECONDS = 1e-6
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        """Add one sample in seconds"""
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        index = 0 if seconds <= self.MIN_SECONDS else int(math.log(seconds / self.MIN_SECONDS, self.GROWTH)) + 1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def percentile(self, percent):
+        """Return the upper bound (in seconds) of the bucket holding a percentile"""
+        if not self.count:
+            return 0.0
+        target = self.count * percent / 100
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return min(self.max, self.MIN_SECONDS * self.GROWTH ** index)
+        return self.max
+
+    def mean(self):
+        """Return the average sample in seconds"""
+        return self.total / self.count if self.count else 0.0
+
+
+def _unwrap(func):
+    """Return the user callback behind tkinter's after() trampoline"""
+    if func.__class__.__name__ == "function" and func.__qualname__.endswith("after.<locals>.callit") and func.__closure__:
+        for name, cell in zip(func.__code__.co_freevars, func.__closure__):
+            if name == "func":
+                return cell.cell_contents
+    return func
+
+
+def _handler_name(func):
+    """Name a Tk callback, e.g. "RoundedFrame.on_resize" or the command's qualname"""
+    name = getattr(func, "__qualname__", None)
+    return name or type(func).__name__
+
+
+def _traced_call(self, *args):
+    tracer = _active_tracer
+    if tracer is None:
+        return _original_call(self, *args)
+    func = _unwrap(self.func)
+    if func in tracer.ignored:
+        return _original_call(self, *args)
+    start = time.perf_counter()
+    try:
+        return _original_call(self, *args)
+    finally:
+        tracer.record(_handler_name(func), time.perf_counter() - start)
+
+
+class LatencyTracer:
+    """
+    Times every Tk callback (bindings, commands, after callbacks) per handler.
+
+    Tk callbacks are wrapped when they are registered, so install() the tracer
+    before the UI is built; handlers bound earlier are not timed. The lag
+    monitor measures how late a heartbeat after() callback fires, which is the
+    time the event loop spent busy elsewhere.
+
+    Args:
+        lag_interval: Heartbeat period of the lag monitor in milliseconds
+    """
+    def __init__(self, lag_interval=50):
+        self.lag_interval = lag_interval
+        self.handlers = {}
+        self.lag = LatencyHistogram()
+        self.ignored = set()
+        self._lag_root = None
+        self._lag_after = None
+        self._lag_expected = 0.0
+
+    def install(self):
+        """Start timing Tk callbacks registered from now on"""
+        global _active_tracer
+        _active_tracer = self
+        tkinter.CallWrapper.__call__ = _traced_call
+        return self
+
+    def uninstall(self):
+        """Stop timing callbacks and stop the lag monitor"""
+        global _active_tracer
+        if _active_tracer is self:
+            _active_tracer = None
+            tkinter.CallWrapper.__call__ = _original_call
+        self.stop_lag_monitor()
+
+    def record(self, name, seconds):
+        """Add one handler sample"""
+        histogram = self.handlers.get(name)
+        if histogram is None:
+            histogram = self.handlers[name] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def start_lag_monitor(self, root):
+        """Measure event-loop lag with a heartbeat after() probe"""
+        self.stop_lag_monitor()
+        self._lag_root = root
+        self.ignored.add(self._heartbeat)
+        self._schedule_heartbeat()
+
+    def stop_lag_monitor(self):
+        """Cancel the heartbeat probe"""
+        if self._lag_after is not None:
+            try:
+                self._lag_root.after_cancel(self._lag_after)
+            except tkinter.TclError:
+                pass
+        self._lag_after = None
+        self._lag_root = None
+
+    def _schedule_heartbeat(self):
+        self._lag_expected = time.perf_counter() + self.lag_interval / 1000
+        self._lag_after = self._lag_root.after(self.lag_interval, self._heartbeat)
+
+    def _heartbeat(self):
+        self.lag.record(max(0.0, time.perf_counter() - self._lag_expected))
+        self._schedule_heartbeat()
+
+    def summary(self):
+        """
+        Return per-handler statistics, slowest p99 first.
+
+        Returns:
+            A list of dicts with name, count, p50, p99 and max (in seconds)
+        """
+        rows = [
+            {"name": name, "count": h.count, "p50": h.percentile(50), "p99": h.percentile(99), "max": h.max}
+            for name, h in self.handlers.items()
+        ]
+        rows.sort(key=lambda row: row["p99"], reverse=True)
+        return rows
+
+    def report(self, limit=20):
+        """Format the summary and event-loop lag as a plain-text table"""
+        lines = [f"{'handler':<45} {'calls':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}"]
+        for row in self.summary()[:limit]:
+            lines.append(f"{row['name']:<45} {row['count']:>7} {row['p50'] * 1000:>8.2f} {row['p99'] * 1000:>8.2f} {row['max'] * 1000:>8.2f}")
+        if self.lag.count:
+            lines.append(f"{'event-loop lag':<45} {self.lag.count:>7} {self.lag.percentile(50) * 1000:>8.2f} {self.lag.percentile(99) * 1000:>8.2f} {self.lag.max * 1000:>8.2f}")
+        return "\n".join(lines)
+
+
+class LatencyOverlay(RoundedFrame):
+    """
+    A rounded panel showing live p50/p99 handler latency and event-loop lag.
+
+    Args:
+        parent: The parent widget
+        tracer: The installed LatencyTracer to display
+        rows: Number of slowest handlers to list
+        refresh: Refresh period in milliseconds
+        **kwargs: Additional RoundedFrame options
+    """
+    def __init__(self, parent, tracer, rows=5, refresh=500, **kwargs):
+        kwargs.setdefault("bootstyle", "dark.TFrame")
+        super().__init__(parent, radius=kwargs.pop("radius", 10), **kwargs)
+        self.tracer = tracer
+        self.rows = rows
+        self.refresh = refresh
+        self.label = ttk.Label(
+            self,
+            font="TkFixedFont",
+            justify="left",
+            anchor="nw",
+            background=self.frame_background,
+            foreground=self.style.colors.get("fg"),
+        )
+        self.label.pack(fill=ttk.BOTH, expand=True, padx=10, pady=8)
+        self.tracer.ignored.add(self._update)
+        self._after = self.after(self.refresh, self._update)
+
+    def _update(self):
+        lines = []
+        if self.tracer.lag.count:
+            lag = self.tracer.lag
+            lines.append(f"loop lag   p50 {lag.percentile(50) * 1000:6.1f}  p99 {lag.percentile(99) * 1000:6.1f} ms")
+        for row in self.tracer.summary()[:self.rows]:
+            name = row["name"] if len(row["name"]) <= 28 else "…" + row["name"][-27:]
+            lines.append(f"{name:<28} {row['p50'] * 1000:6.1f} {row['p99'] * 1000:6.1f}")
+        self.label.configure(text="\n".join(lines) or "waiting for events…")
+        self._after = self.after(self.refresh, self._update)
+
+    def destroy(self):
+        """Stop refreshing before the overlay is destroyed"""
+        try:
+            self.after_cancel(self._after)
+        except Exception:
+            pass
+        self.tracer.ignored.discard(self._update)
+        super().destroy()
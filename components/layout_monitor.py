@@ -0,0 +1,88 @@
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigureLoopMonitor:
+    """
+    Detects <Configure> feedback loops between components and their masters.
+
+    Components report every Configure they handle. When one widget receives
+    more than `threshold` events within `window` seconds it is reported once
+    per burst, together with its widget path and the sizes it bounced between.
+
+    Args:
+        threshold: Number of events within the window that counts as a loop
+        window: Length of the sliding window in seconds
+        reporter: Called with a report dict; defaults to a logging warning
+    """
+    def __init__(self, threshold=20, window=0.25, reporter=None):
+        self.threshold = threshold
+        self.window = window
+        self.reporter = reporter or self._log
+        self.loops = []
+        self._events = {}
+        self._reported = set()
+
+    def record(self, widget, width, height):
+        """Register one Configure event for a widget"""
+        path = str(widget)
+        now = time.perf_counter()
+        events = self._events.get(path)
+        if events is None:
+            events = self._events[path] = deque()
+        events.append((now, width, height))
+        while events and now - events[0][0] > self.window:
+            events.popleft()
+
+        if len(events) <= self.threshold:
+            self._reported.discard(path)
+            return
+        if path in self._reported:
+            return
+        self._reported.add(path)
+        report = {
+            "path": path,
+            "widget": type(widget).__name__,
+            "events": len(events),
+            "window": self.window,
+            "sizes": sorted({(w, h) for _, w, h in events}),
+        }
+        self.loops.append(report)
+        self.reporter(report)
+
+    def forget(self, widget):
+        """Drop the history of a widget (e.g. after it was destroyed)"""
+        path = str(widget)
+        self._events.pop(path, None)
+        self._reported.discard(path)
+
+    def _log(self, report):
+        logger.warning(
+            "Configure feedback loop on %s (%s): %d events in %.0f ms, sizes %s",
+            report["path"], report["widget"], report["events"], report["window"] * 1000, report["sizes"]
+        )
+
+
+# The monitor components report to; None keeps instrumentation free when off
+active_monitor = None
+
+
+def install_layout_monitor(threshold=20, window=0.25, reporter=None):
+    """
+    Start reporting Configure feedback loops.
+
+    Returns:
+        The installed ConfigureLoopMonitor
+    """
+    global active_monitor
+    active_monitor = ConfigureLoopMonitor(threshold, window, reporter)
+    return active_monitor
+
+
+def uninstall_layout_monitor():
+    """Stop reporting Configure feedback loops"""
+    global active_monitor
+    active_monitor = None
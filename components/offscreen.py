@@ -0,0 +1,388 @@
+import json
+import math
+import os
+import struct
+import zlib
+from .colors import darken_color, hex_to_rgb
+from .geometry import GeometryCache, drawn_outline
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = None
+
+THEME_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "theme.json")
+FONT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "fonts", "HostGrotesk-Regular.ttf")
+
+_theme_colors = {}
+_fonts = {}
+
+
+class RasterCache(GeometryCache):
+    """
+    A least-recently-used cache of pixel buffers bounded by their total size.
+
+    Buffers larger than the whole budget are returned without being kept.
+
+    Args:
+        maxbytes: Maximum total length of the cached buffers
+        maxsize: Maximum number of buffers kept
+    """
+    def __init__(self, maxbytes=32 * 1024 * 1024, maxsize=1024):
+        super().__init__(maxsize)
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+
+    def get(self, key, build):
+        """Return the cached buffer for key, calling build() on a miss"""
+        entries = self._entries
+        value = entries.get(key)
+        if value is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = build()
+        if len(value) <= self.maxbytes:
+            entries[key] = value
+            self.nbytes += len(value)
+            self._evict()
+        return value
+
+    def resize(self, maxsize=None, maxbytes=None):
+        """Change the entry and byte limits, evicting the oldest buffers if needed"""
+        if maxsize is not None:
+            self.maxsize = maxsize
+        if maxbytes is not None:
+            self.maxbytes = maxbytes
+        self._evict()
+
+    def clear(self):
+        """Drop every buffer and reset the statistics"""
+        super().clear()
+        self.nbytes = 0
+
+    def info(self):
+        """Return hit/miss statistics and the memory use as a dict"""
+        info = super().info()
+        info.update(bytes=self.nbytes, maxbytes=self.maxbytes)
+        return info
+
+    def _evict(self):
+        entries = self._entries
+        while len(entries) > self.maxsize or self.nbytes > self.maxbytes:
+            _, value = entries.popitem(last=False)
+            self.nbytes -= len(value)
+
+
+# Row spans per outline and finished rasters per full variant
+span_cache = GeometryCache(256)
+raster_cache = RasterCache()
+
+
+class OffscreenImage:
+    """
+    An RGBA image rendered without a Tk window.
+
+    Args:
+        width: Width in pixels
+        height: Height in pixels
+        pixels: Row-major RGBA bytes (4 bytes per pixel, straight alpha)
+    """
+    __slots__ = ("width", "height", "pixels")
+
+    def __init__(self, width, height, pixels):
+        self.width = width
+        self.height = height
+        self.pixels = pixels
+
+    def pixel(self, x, y):
+        """Return the (r, g, b, a) tuple at a position"""
+        offset = (y * self.width + x) * 4
+        return tuple(self.pixels[offset:offset + 4])
+
+    def to_pillow(self):
+        """Convert to a PIL.Image (requires Pillow)"""
+        if Image is None:
+            raise RuntimeError("Pillow is required for to_pillow()")
+        return Image.frombytes("RGBA", (self.width, self.height), bytes(self.pixels))
+
+    def to_png(self):
+        """Encode as PNG bytes using only the standard library"""
+        stride = self.width * 4
+        raw = b"".join(b"\x00" + self.pixels[y * stride:(y + 1) * stride] for y in range(self.height))
+
+        def chunk(tag, data):
+            return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xffffffff)
+
+        header = struct.pack(">IIBBBBB", self.width, self.height, 8, 6, 0, 0, 0)
+        return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
+
+    def save(self, path):
+        """Write the image to a PNG file"""
+        with open(path, "wb") as file:
+            file.write(self.to_png())
+
+
+def load_theme_colors(path=THEME_PATH, theme="ghost"):
+    """
+    Read a theme's color palette from a ttkbootstrap user theme file.
+
+    Returns:
+        A dict mapping color names (primary, secondary, ...) to hex strings
+    """
+    key = (path, theme)
+    colors = _theme_colors.get(key)
+    if colors is None:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        for entry in data["themes"]:
+            if theme in entry:
+                colors = _theme_colors[key] = dict(entry[theme]["colors"])
+                break
+        else:
+            raise KeyError(f"Theme {theme!r} not found in {path}")
+    return colors
+
+
+def resolve_color(bootstyle, background=None, colors=None):
+    """Pick the fill color the same way RoundedFrame and RoundedButton do"""
+    if background is not None:
+        return background
+    colors = colors or load_theme_colors()
+    return colors.get(bootstyle.split(".")[0])
+
+
+def _normalize_radius(radius):
+    return radius if not isinstance(radius, int) else (radius, radius, radius, radius)
+
+
+def _scaled(value, scale):
+    """Logical to display pixels, as ThemeContext.scaled() does"""
+    if isinstance(value, (tuple, list)):
+        return tuple(_scaled(item, scale) for item in value)
+    return int(round(value * scale))
+
+
+def _outline_layers(width, height, radius, corner_style, segments, border):
+    """
+    Return the polygons RoundedFrame.on_resize draws, as (outer, inner) outlines.
+
+    The canvas draws the outline path inset by half the border and strokes
+    it with the border (or a 1 pixel outline in the fill color), so the
+    painted shape is the path grown by half the stroke. With a border, the
+    fill shows inside the path shrunk by half the stroke. Canvas coordinates
+    are pixel centers, hence the extra half pixel.
+    """
+    path_width, path_height = width - 1 - border, height - 1 - border
+    stroke = border or 1
+    outer = _translated(
+        drawn_outline(path_width + stroke, path_height + stroke, tuple(r + stroke / 2 for r in radius), corner_style, segments),
+        border / 2 - stroke / 2 + 0.5,
+    )
+    if not border:
+        return outer, None
+    inner = _translated(
+        drawn_outline(path_width - stroke, path_height - stroke, tuple(max(0, r - stroke / 2) for r in radius), corner_style, segments),
+        border / 2 + stroke / 2 + 0.5,
+    )
+    return outer, inner
+
+
+def _translated(points, offset):
+    return tuple(value + offset for value in points)
+
+
+def _polygon_spans(points, height):
+    """
+    Return the covered [left, right) span of every pixel row of a convex polygon.
+
+    Each edge only visits the rows whose centers it crosses, so the cost is
+    proportional to the height plus the number of edges, not their product.
+    """
+    left = [math.inf] * height
+    right = [-math.inf] * height
+    xs, ys = points[0::2], points[1::2]
+    for index in range(len(xs)):
+        x0, y0, x1, y1 = xs[index - 1], ys[index - 1], xs[index], ys[index]
+        if y0 == y1:
+            continue
+        # Rows whose center lies in [min(y0, y1), max(y0, y1))
+        first = max(0, math.ceil(min(y0, y1) - 0.5))
+        last = min(height, math.ceil(max(y0, y1) - 0.5))
+        slope = (x1 - x0) / (y1 - y0)
+        for row in range(first, last):
+            x = x0 + slope * (row + 0.5 - y0)
+            if x < left[row]:
+                left[row] = x
+            if x > right[row]:
+                right[row] = x
+    return [(low, high) if low <= high else None for low, high in zip(left, right)]
+
+
+def _row_spans(width, height, radius, corner_style="smooth", segments=8, border=0):
+    """Return the (outer, inner) covered spans of every pixel row"""
+    def build():
+        outer, inner = _outline_layers(width, height, radius, corner_style, segments, border)
+        inner_spans = _polygon_spans(inner, height) if inner else [None] * height
+        return tuple(zip(_polygon_spans(outer, height), inner_spans))
+
+    return span_cache.get((width, height, tuple(radius), corner_style, segments, border), build)
+
+
+def _blend(fill, background, coverage):
+    """Return one RGBA pixel partially covered by fill"""
+    if background is None:
+        return bytes((*fill, int(coverage * 255)))
+    return bytes(tuple(int(f * coverage + b * (1 - coverage)) for f, b in zip(fill, background)) + (255,))
+
+
+def _paint_span(buffer, span, width, color, under):
+    """Fill a row span, blending the partially covered edge pixels over under"""
+    left, right = max(0.0, span[0]), min(float(width), span[1])
+    if right <= left:
+        return
+    start, end = math.ceil(left), math.floor(right)
+    if end > start:
+        buffer[start * 4:end * 4] = bytes((*color, 255)) * (end - start)
+    if end < start:
+        # The span lies within a single pixel
+        buffer[end * 4:start * 4] = _blend(color, under, right - left)
+        return
+    if start > left:
+        buffer[(start - 1) * 4:start * 4] = _blend(color, under, start - left)
+    if right > end:
+        buffer[end * 4:(end + 1) * 4] = _blend(color, under, right - end)
+
+
+def _rasterize(width, height, radius, fill, parent_background, corner_style="smooth", segments=8, border=0, border_color=None):
+    """Render an anti-aliased RoundedFrame shape (radius and border in pixels) to RGBA bytes"""
+    def build():
+        fill_rgb = hex_to_rgb(fill)
+        outline_rgb = hex_to_rgb(border_color) if border and border_color else fill_rgb
+        background_rgb = hex_to_rgb(parent_background) if parent_background else None
+        background_pixel = bytes((*background_rgb, 255)) if background_rgb else b"\x00\x00\x00\x00"
+
+        rows = []
+        row_cache = {}
+        for spans in _row_spans(width, height, radius, corner_style, segments, border):
+            row = row_cache.get(spans)
+            if row is None:
+                outer, inner = spans
+                buffer = bytearray(background_pixel * width)
+                if outer is not None:
+                    _paint_span(buffer, outer, width, outline_rgb, background_rgb)
+                if inner is not None:
+                    _paint_span(buffer, inner, width, fill_rgb, outline_rgb)
+                row = row_cache[spans] = bytes(buffer)
+            rows.append(row)
+        return b"".join(rows)
+
+    key = ("shape", width, height, tuple(radius), fill, parent_background, corner_style, segments, border, border_color)
+    return raster_cache.get(key, build)
+
+
+def _font(size):
+    font = _fonts.get(size)
+    if font is None:
+        try:
+            font = ImageFont.truetype(FONT_PATH, size)
+        except OSError:
+            font = ImageFont.load_default()
+        _fonts[size] = font
+    return font
+
+
+def render_frame(width, height, radius=(25, 25, 25, 25), bootstyle="primary.TButton", background=None, parent_background=None, colors=None,
+                 corner_style="smooth", segments=8, border=0, border_color=None, scale=1.0):
+    """
+    Render a RoundedFrame shape offscreen.
+
+    The outline is the one the canvas draws: the same points, with the
+    "smooth" spline flattened like Tk does, and the same border stroke.
+
+    Args:
+        width: Width in pixels
+        height: Height in pixels
+        radius: Corner radius in logical pixels (int for all corners, or tuple of 4)
+        bootstyle: ttkbootstrap style string (e.g., "secondary.TFrame")
+        background: Custom background color (overrides bootstyle color)
+        parent_background: Color behind the shape; None leaves it transparent
+        colors: Theme palette (defaults to theme.json)
+        corner_style: "smooth" (default) or "arc", as for RoundedFrame
+        segments: Segments per corner for the "arc" corner style
+        border: Border width in logical pixels (0 disables)
+        border_color: Border color (defaults to the theme's border color)
+        scale: DPI scale applied to radius and border (see ThemeContext.scale)
+
+    Returns:
+        An OffscreenImage
+    """
+    colors = colors or load_theme_colors()
+    fill = resolve_color(bootstyle, background, colors)
+    border = max(1, _scaled(border, scale)) if border else 0
+    border_color = border_color or colors.get("border")
+    radius = _scaled(_normalize_radius(radius), scale)
+    return OffscreenImage(width, height, _rasterize(width, height, radius, fill, parent_background, corner_style, segments, border, border_color))
+
+
+def render_button(width, height, text=None, radius=(8, 8, 8, 8), bootstyle="primary.TButton", background=None, hover=False, parent_background=None, font_size=10, colors=None, scale=1.0):
+    """
+    Render a RoundedButton offscreen.
+
+    The fill follows RoundedButton, including the darker hover color. Text is
+    drawn with the bundled Host Grotesk font when Pillow is installed and is
+    omitted otherwise.
+
+    Args:
+        width: Width in pixels
+        height: Height in pixels
+        text: Button text
+        radius: Corner radius in logical pixels (int for all corners, or tuple of 4)
+        bootstyle: ttkbootstrap style string (e.g., "primary.TButton")
+        background: Custom background color (overrides bootstyle color)
+        hover: Render the hover state
+        parent_background: Color behind the shape; None leaves it transparent
+        font_size: Text size in pixels
+        colors: Theme palette (defaults to theme.json)
+        scale: DPI scale applied to radius (see ThemeContext.scale)
+
+    Returns:
+        An OffscreenImage
+    """
+    colors = colors or load_theme_colors()
+    fill = resolve_color(bootstyle, background, colors)
+    if hover:
+        fill = darken_color(fill, 0.9)
+    radius = _scaled(_normalize_radius(radius), scale)
+    if not text or Image is None:
+        return OffscreenImage(width, height, _rasterize(width, height, radius, fill, parent_background))
+
+    def build():
+        image = Image.frombytes("RGBA", (width, height), _rasterize(width, height, radius, fill, parent_background))
+        draw = ImageDraw.Draw(image)
+        draw.text((width / 2, height / 2), text, fill=colors.get("selectfg", "#ffffff"), font=_font(font_size), anchor="mm")
+        return image.tobytes()
+
+    key = ("button", width, height, radius, fill, parent_background, text, font_size)
+    return OffscreenImage(width, height, raster_cache.get(key, build))
+
+
+def render_batch(variants):
+    """
+    Render many variants in one call.
+
+    Each variant is a dict of render_frame/render_button arguments plus an
+    optional "kind" ("frame" by default, or "button"). Identical variants are
+    rendered once and share their pixel buffer.
+
+    Returns:
+        A list of OffscreenImage objects in the order of variants
+    """
+    images = []
+    for variant in variants:
+        options = dict(variant)
+        kind = options.pop("kind", "frame")
+        render = render_button if kind == "button" else render_frame
+        images.append(render(**options))
+    return images
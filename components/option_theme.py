@@ -0,0 +1,173 @@
+import sys
+from tkinter import TclError
+from .theme_context import get_theme_context
+
+# Installed below the userDefault/interactive levels so an application's own
+# option_add() calls and per-widget options still win
+PRIORITY = "widgetDefault"
+
+# Class name of the RoundedListbox container, so its options do not leak
+# into other tk Frames and Listboxes
+LISTBOX_CLASS = "GhostListbox"
+
+# Used when the root has no ttkbootstrap style
+FALLBACK_COLORS = {
+    "secondary": "#222324",
+    "fg": "#ffffff",
+    "primary": "#433dfb",
+    "selectfg": "#ffffff",
+    "selectbg": "#555555",
+    "light": "#ADB5BD",
+    "inputbg": "#2f2f2f",
+    "inputfg": "#ffffff",
+}
+
+
+def _default_font():
+    return ("Host Grotesk", 10) if sys.platform != "darwin" else ("Host Grotesk",)
+
+
+def theme_palette(widget):
+    """
+    Resolve the colors used by menus and listboxes for the current theme.
+
+    Args:
+        widget: Any widget of the application
+
+    Returns:
+        A dict of menu_* and list_* colors
+    """
+    try:
+        colors = get_theme_context(widget).colors
+        get = colors.get
+        get("primary")
+    except:
+        get = FALLBACK_COLORS.get
+    return {
+        "menu_bg": get("secondary"),
+        "menu_fg": get("fg"),
+        "menu_active_bg": get("primary"),
+        "menu_active_fg": get("selectfg"),
+        "menu_disabled_fg": get("light"),
+        "list_bg": get("inputbg"),
+        "list_fg": get("inputfg"),
+        "list_select_bg": get("primary"),
+        "list_select_fg": get("selectfg"),
+        "list_muted_fg": get("light"),
+        "list_border": get("selectbg"),
+        "list_border_focus": get("primary"),
+    }
+
+
+def menu_options(palette):
+    """
+    Return the Menu configuration options for a palette.
+
+    Menus get these at creation instead of from the option database. Tk menus
+    have no -class option and Tk's menu bindings rely on the class Menu, so an
+    option database pattern would restyle every menu of the application.
+    """
+    return {
+        "background": palette["menu_bg"],
+        "foreground": palette["menu_fg"],
+        "activebackground": palette["menu_active_bg"],
+        "activeforeground": palette["menu_active_fg"],
+        "disabledforeground": palette["menu_disabled_fg"],
+        "selectcolor": palette["menu_active_bg"],
+        "activeborderwidth": 0,
+        "borderwidth": 0,
+        "relief": "flat",
+        "font": _default_font(),
+    }
+
+
+def _options(palette):
+    """Map option database patterns to values for a palette"""
+    font = _default_font()
+    listbox = f"*{LISTBOX_CLASS}"
+    return {
+        f"{listbox}.background": palette["list_border"],
+        f"{listbox}.highlightThickness": 0,
+        f"{listbox}.Frame.background": palette["list_border"],
+        f"{listbox}.Frame.highlightThickness": 2,
+        f"{listbox}.Frame.highlightBackground": palette["list_border"],
+        f"{listbox}.Frame.highlightColor": palette["list_border_focus"],
+        f"{listbox}*Listbox.background": palette["list_bg"],
+        f"{listbox}*Listbox.foreground": palette["list_fg"],
+        f"{listbox}*Listbox.selectBackground": palette["list_select_bg"],
+        f"{listbox}*Listbox.selectForeground": palette["list_select_fg"],
+        f"{listbox}*Listbox.highlightThickness": 0,
+        f"{listbox}*Listbox.relief": "flat",
+        f"{listbox}*Listbox.borderWidth": 0,
+        f"{listbox}*Listbox.activeStyle": "none",
+        f"{listbox}*Listbox.font": font,
+    }
+
+
+def install_option_theme(widget, force=False):
+    """
+    Install the Ghost listbox defaults in the Tk option database.
+
+    This runs once per interpreter; later calls return the installed palette.
+    Listboxes created afterwards pick the defaults up without per-instance
+    options; menus take theirs from the palette at creation (see
+    menu_options). A theme change re-installs them automatically (see
+    refresh_option_theme).
+
+    Args:
+        widget: Any widget of the application
+        force: Re-install even if the defaults are already present
+
+    Returns:
+        The palette dict that was installed
+    """
+    context = get_theme_context(widget)
+    if context.option_palette is not None and not force:
+        return context.option_palette
+    palette = theme_palette(context.root)
+    for pattern, value in _options(palette).items():
+        context.root.option_add(pattern, value, PRIORITY)
+    if context.option_palette is None:
+        context.on_theme_change(lambda context: refresh_option_theme(context.root))
+    context.option_palette = palette
+    return palette
+
+
+def refresh_option_theme(widget):
+    """
+    Re-install the defaults for the current theme and repaint existing widgets.
+
+    The option database is updated once; listboxes that already exist are
+    reconfigured because Tk only reads it at creation time, and menus are
+    repainted with the new palette.
+
+    Args:
+        widget: Any widget of the application
+
+    Returns:
+        The new palette dict
+    """
+    # Imported here to avoid a cycle, both components import this module
+    from .diagnostics import live_components
+    from .rounded_menu import RoundedMenu
+    from .rounded_listbox import RoundedListbox
+
+    palette = install_option_theme(widget, force=True)
+    for component in live_components():
+        if isinstance(component, (RoundedMenu, RoundedListbox)):
+            try:
+                component.apply_palette(palette)
+            except TclError:
+                pass
+    return palette
+
+
+def no_autostyle(cls):
+    """
+    Return the constructor option that keeps ttkbootstrap from repainting a tk widget.
+
+    ttkbootstrap 1.x wraps the tk widget constructors and configures explicit
+    colors after creation, which would override the option database. Newer
+    versions leave plain tk widgets alone and reject the option.
+    """
+    return {"autostyle": False} if getattr(cls.__init__, "__name__", "") == "__init__wrapper" else {}
@@ -0,0 +1,188 @@
+import json
+import os
+import sys
+import time
+from .theme_context import get_theme_context
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Top-level Tcl commands whose subcommand is worth reporting separately
+_ENSEMBLES = {"winfo", "wm", "pack", "grid", "place", "bind", "after", "image", "focus", "option", "ttk::style", "font", "tk"}
+
+
+def operation_name(args):
+    """
+    Name a Tcl call for statistics: "configure" for widget commands,
+    "winfo width" for ensembles, the command name otherwise.
+    """
+    if len(args) == 1 and isinstance(args[0], tuple):
+        args = args[0]
+    first = str(args[0]) if args else ""
+    if first.startswith(".") and len(args) > 1:
+        return str(args[1])
+    if first in _ENSEMBLES and len(args) > 1:
+        return f"{first} {args[1]}"
+    return first
+
+
+class _ProfilingTkApp:
+    """Forwards to a real tkapp while timing call() and eval()"""
+    def __init__(self, tkapp, profiler):
+        self._tkapp = tkapp
+        self._profiler = profiler
+
+    def call(self, *args):
+        start = time.perf_counter()
+        try:
+            return self._tkapp.call(*args)
+        finally:
+            self._profiler._record(args, start, time.perf_counter())
+
+    def eval(self, script):
+        start = time.perf_counter()
+        try:
+            return self._tkapp.eval(script)
+        finally:
+            self._profiler._record(("eval",), start, time.perf_counter())
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+    # Compare like the real tkapp so per-interpreter registries still match
+    def __eq__(self, other):
+        return self._tkapp == getattr(other, "_tkapp", other)
+
+    def __hash__(self):
+        return hash(self._tkapp)
+
+
+class TclProfiler:
+    """
+    Counts and times Python-to-Tcl calls and attributes them to components.
+
+    While running, every widget of the interpreter talks to Tcl through a
+    proxy. Each call() is charged to the innermost component method on the
+    Python stack (for example "RoundedFrame.on_resize"), or to
+    "(application)" when no component method issued it.
+
+    Usage:
+        with TclProfiler(root) as profiler:
+            build_ui()
+        print(profiler.report())
+        profiler.export_chrome_trace("trace.json")
+
+    Args:
+        root: The Tk root window
+        max_events: Maximum number of individual calls kept for the trace
+    """
+    def __init__(self, root, max_events=200000):
+        self.root = root
+        self.max_events = max_events
+        self.stats = {}
+        self.events = []
+        self._real_tk = None
+        self._proxy = None
+        self._origin = 0.0
+
+    def start(self):
+        """Route all Tcl calls of the interpreter through the profiler"""
+        if self._proxy is not None:
+            return
+        self._real_tk = self.root.tk
+        self._proxy = _ProfilingTkApp(self._real_tk, self)
+        self._origin = time.perf_counter()
+        self._swap(self._real_tk, self._proxy)
+
+    def stop(self):
+        """Restore direct Tcl calls"""
+        if self._proxy is None:
+            return
+        self._swap(self._proxy, self._real_tk)
+        self._proxy = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _swap(self, old, new):
+        """Replace the tkapp of every widget (and the ttk style) of the root"""
+        stack = [self.root]
+        while stack:
+            widget = stack.pop()
+            if widget.tk is old:
+                widget.tk = new
+            stack.extend(widget.children.values())
+        style = get_theme_context(self.root).style
+        if style is not None and getattr(style, "tk", None) is old:
+            style.tk = new
+
+    def _record(self, args, start, end):
+        operation = operation_name(args)
+        owner = self._owner(sys._getframe(2))
+        entry = self.stats.get(owner)
+        if entry is None:
+            entry = self.stats[owner] = {"calls": 0, "time": 0.0, "operations": {}}
+        duration = end - start
+        entry["calls"] += 1
+        entry["time"] += duration
+        operations = entry["operations"]
+        operations[operation] = operations.get(operation, 0) + 1
+
+        if len(self.events) < self.max_events:
+            self.events.append((owner, operation, start - self._origin, duration))
+
+    def _owner(self, frame):
+        """Name the innermost component method on the stack"""
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename.startswith(_PACKAGE_DIR) and "self" in frame.f_locals and not code.co_filename.endswith("profiler.py"):
+                qualname = getattr(code, "co_qualname", None)
+                return qualname or f"{type(frame.f_locals['self']).__name__}.{code.co_name}"
+            frame = frame.f_back
+        return "(application)"
+
+    def reset(self):
+        """Forget all collected statistics"""
+        self.stats.clear()
+        self.events.clear()
+        self._origin = time.perf_counter()
+
+    def report(self, limit=20):
+        """
+        Format the collected statistics, most expensive methods first.
+
+        Returns:
+            A plain-text table
+        """
+        lines = [f"{'method':<40} {'calls':>8} {'total ms':>10} {'us/call':>8}  top operations"]
+        ranked = sorted(self.stats.items(), key=lambda item: item[1]["time"], reverse=True)
+        for owner, entry in ranked[:limit]:
+            top = sorted(entry["operations"].items(), key=lambda item: item[1], reverse=True)[:3]
+            top_text = ", ".join(f"{name} x{count}" for name, count in top)
+            per_call = entry["time"] / entry["calls"] * 1e6
+            lines.append(f"{owner:<40} {entry['calls']:>8} {entry['time'] * 1000:>10.2f} {per_call:>8.1f}  {top_text}")
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path):
+        """Write the recorded calls as a Chrome trace (chrome://tracing, Perfetto)"""
+        trace = {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": operation,
+                    "cat": owner,
+                    "ph": "X",
+                    "ts": offset * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": os.getpid(),
+                    "tid": 1,
+                    "args": {"method": owner},
+                }
+                for owner, operation, offset, duration in self.events
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(trace, file)
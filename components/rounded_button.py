@@ -1,6 +1,12 @@
 import sys
 import ttkbootstrap as ttk
 from .rounded_frame import RoundedFrame
+from .async_bridge import wrap_command
+from .executor import submit
+from .colors import darken_color
+from .diagnostics import track
+from .theme_context import get_theme_context
+from .icon_atlas import get_icon_atlas
 
 class RoundedButton(ttk.Canvas):
     """
@@ -14,66 +20,235 @@ class RoundedButton(ttk.Canvas):
         radius: Corner radius (int for all corners, or tuple of 4)
         text: Button text
         image: Button image (PhotoImage)
-        command: Callback function when clicked
+        icon: Name of an icon registered with the shared IconAtlas (see
+            get_icon_atlas); used instead of image
+        icon_size: Icon size in logical pixels (default: 16)
+        command: Callback function when clicked (coroutine functions run on the asyncio bridge)
         bootstyle: ttkbootstrap style string
         padx: Internal horizontal padding
         pady: Internal vertical padding
         font: Font tuple (family, size, weight)
+        parent_background: Custom parent background color (skips the lookup)
+        execution: "sync" (default) runs command on the Tk thread; "thread" or
+            "process" runs it without arguments on a shared pool and shows a busy
+            state until it finishes
+        on_result: Called on the Tk thread with the command's return value
+        on_error: Called on the Tk thread with the command's exception
     """
     def __init__(self, parent, radius=(8, 8, 8, 8), text=None, image=None, command=None, **kwargs):
         canvas_kwargs = {}
         for key in kwargs:
-            if key not in ["padx", "pady", "bootstyle", "style"]:
+            if key not in ["padx", "pady", "bootstyle", "style", "execution", "on_result", "on_error", "parent_background", "icon", "icon_size"]:
                 canvas_kwargs[key] = kwargs[key]
         super().__init__(parent, highlightthickness=0, bd=0, **canvas_kwargs)
         
         bootstyle = kwargs.get("bootstyle") or kwargs.get("style") or "primary.TButton"
-        self.parent = parent
-        self.radius = radius if not isinstance(radius, int) else (radius, radius, radius, radius)
-        self.root = parent.winfo_toplevel()
-        self.style = self.root.style
-        self.padx = kwargs.get("padx", 2)
-        self.pady = kwargs.get("pady", 0 if sys.platform != "darwin" else 1)
+        self._init_state(parent, radius, command, kwargs)
 
-        self.configure(background=self._get_parent_background())
-
-        # Store the original background color
-        self.original_bg = self.style.colors.get(bootstyle.split(".")[0]) if kwargs.get("background") is None else kwargs.get("background")
+        self.configure(background=self._get_parent_background() if kwargs.get("parent_background") is None else kwargs.get("parent_background"))
 
         # Create the rounded frame
         self.frame = RoundedFrame(self, radius=radius, bootstyle=bootstyle, background=self.original_bg)
         self.frame.pack(fill=ttk.BOTH)
 
+        # Resolve a named icon through the shared atlas
+        self._set_icon(kwargs.get("icon"), self.icon_size)
+        if self.icon_image is not None:
+            image = self.icon_image
+
         # Create the label inside the rounded frame
         self.button = ttk.Label(
             self.frame, 
             text=text, 
             image=image, 
+            compound="left" if text and image else "none",
             style=bootstyle, 
             anchor="center", 
             borderwidth=0, 
             relief="flat", 
-            font=kwargs.get("font") or ("Host Grotesk", "10") if sys.platform != "darwin" else ("Host Grotesk", )
+            font=get_theme_context(parent).scaled_font(self.logical_font)
         )
         self.button.pack(fill=ttk.BOTH, expand=True, padx=self.padx, pady=self.pady)
 
-        # Bind events for clicking
-        if command:
-            self.button.bind("<Button-1>", command)
-            self.frame.bind("<Button-1>", command)
+        # Bind events for clicking and hover effects
+        self._bind_events()
+        track(self)
+
+    def _init_state(self, parent, radius, command, options, root=None):
+        """
+        Set up the Python-side state without any Tcl calls.
+
+        Shared by __init__ and the batch builder, which creates the Tcl
+        widgets itself. The icon starts unset; __init__ acquires it.
+
+        Args:
+            parent: The parent widget
+            radius: Corner radius (int or tuple of 4)
+            command: Callback function when clicked
+            options: The constructor keyword arguments
+            root: The toplevel, when the caller already knows it
+        """
+        bootstyle = options.get("bootstyle") or options.get("style") or "primary.TButton"
+        self.parent = parent
+        self.radius = radius if not isinstance(radius, int) else (radius, radius, radius, radius)
+        self.root = root or parent.winfo_toplevel()
+        self.style = get_theme_context(parent).style
+        # Padding is given in logical pixels and applied scaled
+        self.logical_padding = (
+            2 if options.get("padx") is None else options["padx"],
+            (0 if sys.platform != "darwin" else 1) if options.get("pady") is None else options["pady"],
+        )
+        self.padx, self.pady = get_theme_context(parent).scaled(self.logical_padding)
+
+        # Store the original background color
+        self.original_bg = self.style.colors.get(bootstyle.split(".")[0]) if options.get("background") is None else options.get("background")
+        # Pixel-sized fonts (negative sizes) are scaled like the padding
+        self.logical_font = options.get("font") or (("Host Grotesk", "10") if sys.platform != "darwin" else ("Host Grotesk", ))
+
+        self.icon = None
+        self.icon_size = options.get("icon_size", 16)
+        self.icon_image = None
+        self.command = command
+        self.execution = options.get("execution", "sync")
+        self.on_result = options.get("on_result")
+        self.on_error = options.get("on_error")
+        self.busy = False
+        # Bumped on release()/reset() so pool results of a previous use are dropped
+        self._generation = 0
+        self._bindings = []
 
-        # Bind events for hover effects
-        self.frame.bind("<Enter>", self._hover_enter)
-        self.frame.bind("<Leave>", self._hover_leave)
-        self.button.bind("<Enter>", self._hover_enter)
-        self.button.bind("<Leave>", self._hover_leave)
+    def _bind_events(self):
+        """Bind the click and hover handlers, remembering their function ids"""
+        handlers = [("<Enter>", self._hover_enter), ("<Leave>", self._hover_leave)]
+        if self.command:
+            handler = self._run_in_pool if self.execution != "sync" else wrap_command(self, self.command)
+            handlers.append(("<Button-1>", handler))
+        for widget in (self.frame, self.button):
+            for sequence, func in handlers:
+                self._bindings.append((widget, sequence, widget.bind(sequence, func)))
+
+    def _unbind_events(self):
+        """Remove the click and hover handlers and their Tcl commands"""
+        for widget, sequence, funcid in self._bindings:
+            widget.unbind(sequence, funcid)
+        self._bindings = []
+
+    def release(self):
+        """Detach handlers and restore the idle look (called when pooled)"""
+        self._unbind_events()
+        self._generation += 1
+        self.busy = False
+        self.frame.set_background(self.original_bg)
+        self.button.configure(background=self.original_bg, cursor="")
+        self.frame.configure(cursor="")
+
+    def reset(self, text=None, command=None, bootstyle=None, radius=None, image=None, background=None, icon=None, icon_size=None,
+              style=None, padx=None, pady=None, font=None, parent_background=None, execution="sync", on_result=None, on_error=None, **kwargs):
+        """
+        Reconfigure the button for reuse instead of creating a new one.
+
+        Accepts the same options as the constructor, so a WidgetPool can pass
+        the same arguments whether it creates or reuses a button. Appearance
+        options left at None keep their current value. The content and
+        behaviour options (text, image, icon, command, execution, on_result
+        and on_error) are reset like on a new button, so a reused button never
+        shows the label, image or handlers of its previous use.
+
+        Args:
+            text: New button text (None clears it)
+            command: New callback (the previous one is unbound)
+            bootstyle: New ttkbootstrap style string (style is an alias)
+            radius: New corner radius (int or tuple of 4)
+            image: New button image (None clears it)
+            background: Custom background color (overrides bootstyle color)
+            icon: New atlas icon name (the previous icon is released; None removes it)
+            icon_size: New icon size in logical pixels
+            padx: New internal horizontal padding
+            pady: New internal vertical padding
+            font: New font tuple
+            parent_background: New parent background color
+            execution: "sync", "thread" or "process" (see the constructor)
+            on_result: Called with the command's return value
+            on_error: Called with the command's exception
+            **kwargs: Canvas options, as for the constructor
+        """
+        self._unbind_events()
+        # Results of a command still running belong to the previous use
+        self._generation += 1
+        self.busy = False
+        bootstyle = bootstyle or style
+        if kwargs:
+            self.configure(**kwargs)
+        if parent_background is not None:
+            self.configure(background=parent_background)
+        if padx is not None or pady is not None:
+            self.logical_padding = (self.logical_padding[0] if padx is None else padx, self.logical_padding[1] if pady is None else pady)
+            self.padx, self.pady = get_theme_context(self).scaled(self.logical_padding)
+            self.button.pack_configure(padx=self.padx, pady=self.pady)
+        if font is not None:
+            self.logical_font = font
+            self.button.configure(font=get_theme_context(self).scaled_font(font))
+        if bootstyle is not None:
+            self.button.configure(style=bootstyle)
+            self.original_bg = self.style.colors.get(bootstyle.split(".")[0])
+        if background is not None:
+            self.original_bg = background
+        if radius is not None:
+            self.radius = radius if not isinstance(radius, int) else (radius, radius, radius, radius)
+            self.frame.set_corner_radius(self.radius)
+        self._set_icon(icon, icon_size or self.icon_size)
+        if self.icon_image is not None:
+            image = self.icon_image
+        self.frame.set_background(self.original_bg)
+        self.button.configure(
+            text=text or "",
+            image=image or "",
+            compound="left" if text and image else "none",
+            background=self.original_bg,
+            cursor="",
+        )
+        self.frame.configure(cursor="")
+        self.command = command
+        self.execution = execution
+        self.on_result = on_result
+        self.on_error = on_error
+        self._bind_events()
+
+    def _set_icon(self, icon, icon_size):
+        """Swap the atlas icon, releasing the previous one"""
+        if (icon, icon_size) == (self.icon, self.icon_size):
+            return
+        if self.icon_image is not None:
+            get_icon_atlas(self).release(self.icon_image)
+        self.icon = icon
+        self.icon_size = icon_size
+        self.icon_image = get_icon_atlas(self).acquire(icon, icon_size) if icon else None
+
+    def rescale(self):
+        """Apply a new DPI scale to the padding, font and icon (the frame rescales itself)"""
+        context = get_theme_context(self)
+        self.padx, self.pady = context.scaled(self.logical_padding)
+        self.button.pack_configure(padx=self.padx, pady=self.pady)
+        self.button.configure(font=context.scaled_font(self.logical_font))
+        if self.icon_image is not None:
+            # Acquire first, so an unchanged pixel size keeps the same image
+            atlas = get_icon_atlas(self)
+            previous = self.icon_image
+            self.icon_image = atlas.acquire(self.icon, self.icon_size)
+            atlas.release(previous)
+            self.button.configure(image=self.icon_image)
+
+    def destroy(self):
+        """Release the atlas icon before the button is destroyed"""
+        self._set_icon(None, self.icon_size)
+        super().destroy()
 
     def _get_parent_background(self):
         """Determines the background color of the parent widget"""
         parent = self.parent
         if isinstance(parent, ttk.Frame):
             style = parent.cget("style")
-            return self.style.lookup(style, "background")
+            return get_theme_context(self).lookup(style, "background")
         elif isinstance(parent, RoundedFrame):
             return parent.frame_background
         else:
@@ -84,20 +259,67 @@ class RoundedButton(ttk.Canvas):
 
     def _darken_color(self, hex_color, factor=0.9):
         """Darken color for hover effect"""
-        if not hex_color.startswith("#"):
-            return hex_color
+        return darken_color(hex_color, factor)
+
+    def _run_in_pool(self, event=None):
+        """Run the command on the shared pool, dropping clicks while it is busy"""
+        if self.busy:
+            return "break"
+        self._set_busy(True)
+        generation = self._generation
+        submit(
+            self,
+            self.command,
+            kind=self.execution,
+            on_result=lambda result: self._command_done(generation, result),
+            on_error=lambda error: self._command_failed(generation, error),
+        )
+        return "break"
+
+    def _command_done(self, generation, result):
+        """Deliver the pool result and leave the busy state (unless the button was reused meanwhile)"""
+        if generation != self._generation:
+            return
+        if self.winfo_exists():
+            self._set_busy(False)
+        if self.on_result:
+            self.on_result(result)
 
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (1, 3, 5))
-        darkened_rgb = tuple(max(0, int(value * factor)) for value in rgb)
-        return f"#{darkened_rgb[0]:02x}{darkened_rgb[1]:02x}{darkened_rgb[2]:02x}"
+    def _command_failed(self, generation, error):
+        """Deliver the pool exception and leave the busy state (unless the button was reused meanwhile)"""
+        if generation != self._generation:
+            return
+        if self.winfo_exists():
+            self._set_busy(False)
+        if self.on_error:
+            self.on_error(error)
+        else:
+            self.root.report_callback_exception(type(error), error, error.__traceback__)
+
+    def _set_busy(self, busy):
+        """Switch between the busy (disabled-looking) and normal visual state"""
+        self.busy = busy
+        if busy:
+            busy_color = self.style.colors.get("selectbg")
+            self.frame.set_background(busy_color)
+            self.button.configure(background=busy_color, cursor="watch")
+            self.frame.configure(cursor="watch")
+        else:
+            self.frame.set_background(self.original_bg)
+            self.button.configure(background=self.original_bg, cursor="")
+            self.frame.configure(cursor="")
 
     def _hover_enter(self, event=None):
         """Apply hover effect"""
+        if self.busy:
+            return
         hover_color = self._darken_color(self.original_bg, 0.9)
         self.frame.set_background(hover_color)
         self.button.configure(background=hover_color)
 
     def _hover_leave(self, event=None):
         """Reset to original color"""
+        if self.busy:
+            return
         self.frame.set_background(self.original_bg)
         self.button.configure(background=self.original_bg)
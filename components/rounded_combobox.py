@@ -1,6 +1,10 @@
 import sys
 import ttkbootstrap as ttk
 from tkinter import StringVar
+from .async_bridge import wrap_command
+from .colors import lighten_color
+from .diagnostics import track
+from .theme_context import get_theme_context
 
 
 class RoundedCombobox(ttk.Combobox):
@@ -14,7 +18,7 @@ class RoundedCombobox(ttk.Combobox):
         parent: The parent widget
         values: List of values for the dropdown
         textvariable: StringVar to bind the selected value
-        command: Callback function when value changes
+        command: Callback function when value changes (coroutine functions run on the asyncio bridge)
         state: Widget state ('normal' or 'readonly')
         width: Width of the combobox
         font: Font tuple (family, size, weight)
@@ -30,7 +34,7 @@ class RoundedCombobox(ttk.Combobox):
         
         self.parent = parent
         self.root = parent.winfo_toplevel()
-        self.style = self.root.style
+        self.style = get_theme_context(parent).style
         
         # Store the original background color
         self.original_bg = self.style.colors.get("inputbg")
@@ -52,9 +56,9 @@ class RoundedCombobox(ttk.Combobox):
         if "font" not in kwargs:
             kwargs["font"] = ("Host Grotesk", 10) if sys.platform != "darwin" else ("Host Grotesk",)
         
-        # Configure custom style
+        # Configure the shared custom style once per theme
         combobox_style = "Ghost.TCombobox"
-        self._configure_combobox_style(combobox_style)
+        get_theme_context(parent).derive_style(combobox_style, lambda style: self._configure_combobox_style(combobox_style))
         kwargs["style"] = combobox_style
         
         # Initialize the Combobox
@@ -67,11 +71,12 @@ class RoundedCombobox(ttk.Combobox):
         
         # Bind command if provided
         if command:
-            self.bind("<<ComboboxSelected>>", lambda e: command())
+            self.bind("<<ComboboxSelected>>", wrap_command(self, command, pass_event=False))
         
         # Bind hover effects
         self.bind("<Enter>", self._hover_enter)
         self.bind("<Leave>", self._hover_leave)
+        track(self)
 
     def _configure_combobox_style(self, style_name):
         """Configure custom combobox style matching the Ghost theme"""
@@ -125,12 +130,7 @@ class RoundedCombobox(ttk.Combobox):
 
     def _lighten_color(self, hex_color, factor=1.1):
         """Lighten color for hover effect"""
-        if not hex_color.startswith("#"):
-            return hex_color
-
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (1, 3, 5))
-        lightened_rgb = tuple(min(255, int(value * factor)) for value in rgb)
-        return f"#{lightened_rgb[0]:02x}{lightened_rgb[1]:02x}{lightened_rgb[2]:02x}"
+        return lighten_color(hex_color, factor)
 
     def _hover_enter(self, event=None):
         """Apply hover effect"""
@@ -1,4 +1,10 @@
+from tkinter import PhotoImage
 import ttkbootstrap as ttk
+from .geometry import outline_points
+from .shadow import shadow_slices
+from . import layout_monitor
+from .diagnostics import track
+from .theme_context import get_theme_context
 
 class RoundedFrame(ttk.Canvas):
     """
@@ -15,26 +21,29 @@ class RoundedFrame(ttk.Canvas):
         background: Custom background color (overrides bootstyle color)
         parent_background: Custom parent background color (for Canvas transparency)
         custom_size: If True, prevents automatic size propagation
-        min_width: Minimum width constraint
-        min_height: Minimum height constraint
+        min_width: Minimum width constraint (requested once, never from a Configure handler)
+        min_height: Minimum height constraint (requested once, never from a Configure handler)
+        corner_style: "smooth" (default, spline corners) or "arc" (true circular arcs)
+        segments: Number of segments per corner for the "arc" corner style
+        shadow: Drop shadow blur distance in logical pixels (0 disables). The
+            shadow is drawn inside the canvas, so the card is inset by the blur
+            plus the offset on every side
+        shadow_color: Drop shadow color
+        shadow_offset: Vertical drop shadow offset in logical pixels
+        shadow_opacity: Drop shadow opacity right under the card (0-1)
+        border: Border width in logical pixels (0 disables)
+        border_color: Border color
     """
     def __init__(self, parent, radius=(25, 25, 25, 25), **kwargs):
         canvas_kwargs = {}
         for key in kwargs:
-            if key not in ["padx", "pady", "bootstyle", "style", "background", "parent_background", "custom_size", "min_width", "min_height"]:
+            if key not in ["padx", "pady", "bootstyle", "style", "background", "parent_background", "custom_size", "min_width", "min_height", "corner_style", "segments", "shadow", "shadow_color", "shadow_offset", "shadow_opacity", "border", "border_color"]:
                 canvas_kwargs[key] = kwargs[key]
         super().__init__(parent, highlightthickness=0, bd=0, **canvas_kwargs)
         
-        bootstyle = kwargs.get("bootstyle") or kwargs.get("style") or "primary.TButton"
-        self.parent = parent
-        self.radius = radius if not isinstance(radius, int) else (radius, radius, radius, radius)
-        self.root = parent.winfo_toplevel()
-        self.style = self.root.style
-        self.frame_background = self.style.colors.get(bootstyle.split(".")[0]) if kwargs.get("background") is None else kwargs.get("background")
-        self.parent_background = self._get_parent_background() if kwargs.get("parent_background") is None else kwargs.get("parent_background")
-        
-        self.min_width = kwargs.get("min_width", 0)
-        self.min_height = kwargs.get("min_height", 0)
+        self._init_state(parent, radius, kwargs)
+        if self.parent_background is None:
+            self.parent_background = self._get_parent_background()
 
         if kwargs.get("custom_size"):
             self.pack_propagate(False)
@@ -43,8 +52,48 @@ class RoundedFrame(ttk.Canvas):
         self.configure(background=self.parent_background)
         self.inner_frame = ttk.Frame(self)
         self.create_window(0, 0, window=self.inner_frame, anchor="nw")
+        self._request_min_size()
 
         self.bind("<Configure>", self.on_resize)
+        track(self)
+
+    def _init_state(self, parent, radius, options, root=None):
+        """
+        Set up the Python-side state without any Tcl calls.
+
+        Shared by __init__ and the batch builder, which creates the Tcl
+        widgets itself. parent_background is left at None when not given.
+
+        Args:
+            parent: The parent widget
+            radius: Corner radius (int or tuple of 4) in logical pixels
+            options: The constructor keyword arguments
+            root: The toplevel, when the caller already knows it
+        """
+        bootstyle = options.get("bootstyle") or options.get("style") or "primary.TButton"
+        self.parent = parent
+        self.root = root or parent.winfo_toplevel()
+        self.style = get_theme_context(parent).style
+        self.logical_radius = radius if not isinstance(radius, int) else (radius, radius, radius, radius)
+        self.radius = get_theme_context(parent).scaled(self.logical_radius)
+        self.frame_background = self.style.colors.get(bootstyle.split(".")[0]) if options.get("background") is None else options.get("background")
+        self.parent_background = options.get("parent_background")
+
+        self.min_width = options.get("min_width", 0)
+        self.min_height = options.get("min_height", 0)
+        self.corner_style = options.get("corner_style", "smooth")
+        self.segments = options.get("segments", 8)
+        self.shadow = options.get("shadow", 0)
+        self.shadow_color = options.get("shadow_color", "#000000")
+        self.shadow_offset = options.get("shadow_offset", 0)
+        self.shadow_opacity = options.get("shadow_opacity", 0.35)
+        self.border = options.get("border", 0)
+        self.border_color = options.get("border_color") or self.style.colors.get("border")
+        self._shadow_items = None
+        self._shadow_slices = None
+        self._shadow_edges = None
+        self._drawn = None
+        self._min_size_pending = False
 
     def _get_parent_background(self):
         """Determines the background color of the parent widget"""
@@ -52,7 +101,7 @@ class RoundedFrame(ttk.Canvas):
         
         if isinstance(parent, ttk.Frame):
             style = parent.cget("style")
-            return self.style.lookup(style, "background")
+            return get_theme_context(self).lookup(style, "background")
         elif isinstance(parent, RoundedFrame):
             return parent.frame_background
         else:
@@ -61,52 +110,189 @@ class RoundedFrame(ttk.Canvas):
             except:
                 return self.style.colors.get("dark")
 
+    def _request_min_size(self):
+        """Raise the requested size to the minimum, if it is below it"""
+        self._min_size_pending = False
+        options = {}
+        if self.min_width and self.winfo_reqwidth() < self.min_width:
+            options["width"] = self.min_width
+        if self.min_height and self.winfo_reqheight() < self.min_height:
+            options["height"] = self.min_height
+        if options:
+            self.configure(**options)
+
+    def set_min_size(self, min_width=None, min_height=None):
+        """Change the minimum size constraint"""
+        if min_width is not None:
+            self.min_width = min_width
+        if min_height is not None:
+            self.min_height = min_height
+        self._request_min_size()
+        self.on_resize()
+
     def on_resize(self, event=None):
         """Redraws the rounded rectangle when the widget is resized"""
-        self.delete("all")
-
         width, height = self.winfo_width(), self.winfo_height()
+        if event is not None and layout_monitor.active_monitor is not None:
+            layout_monitor.active_monitor.record(self, width, height)
         if width < 2 or height < 2:
             return
 
-        # Enforce minimum size
-        if width < self.min_width:
-            width = self.min_width
-            self.configure(width=width)
-        if height < self.min_height:
-            height = self.min_height
-            self.configure(height=height)
-
-        width -= 1
-        height -= 1
-
-        radius_tl, radius_tr, radius_br, radius_bl = self.radius
-
-        # Create points for the rounded polygon (hexagonal-like smooth shape)
-        points = [
-            radius_tl, 0,
-            width - radius_tr, 0,
-            width, 0,
-            width, radius_tr,
-            width, height - radius_br,
-            width, height,
-            width - radius_br, height,
-            radius_bl, height,
-            0, height,
-            0, height - radius_bl,
-            0, radius_tl,
-            0, 0
-        ]
-        self.create_polygon(points, smooth=True, fill=self.frame_background, outline=self.frame_background)
+        # Enforce minimum size. The master decides the actual size, so only the
+        # requested size is corrected (once, after this pass) and the shape is
+        # drawn at the minimum meanwhile; reconfiguring from inside the
+        # Configure handler would start a feedback loop.
+        if width < self.min_width or height < self.min_height:
+            if not self._min_size_pending and (self.winfo_reqwidth() < self.min_width or self.winfo_reqheight() < self.min_height):
+                self._min_size_pending = True
+                self.after_idle(self._request_min_size)
+            width = max(width, self.min_width)
+            height = max(height, self.min_height)
+
+        context = get_theme_context(self)
+        blur = context.scaled(self.shadow) if self.shadow else 0
+        offset = context.scaled(self.shadow_offset) if blur else 0
+        border = max(1, context.scaled(self.border)) if self.border else 0
+
+        # Nothing to redraw when the shape is unchanged
+        state = (
+            width, height, self.radius, self.frame_background, self.corner_style, self.segments,
+            blur, offset, self.shadow_color, self.shadow_opacity, self.parent_background, border, self.border_color,
+        )
+        if state == self._drawn:
+            return
+        self._drawn = state
+        # Shadow slices persist across redraws and are only moved
+        self.delete("!shadow")
+
+        # The card is inset to leave room for the shadow
+        margin = blur + abs(offset)
+        width -= 1 + 2 * margin
+        height -= 1 + 2 * margin
+        if width < 1 or height < 1:
+            return
+        self._draw_shadow(margin, margin + offset, margin + width, margin + height + offset, blur)
+
+        # Create points for the rounded polygon (shared, memoized per size and radius);
+        # a border is stroked on the outline, so the path is inset by half its width
+        points = outline_points(width - border, height - border, self.radius, self.corner_style, self.segments)
+        polygon = self.create_polygon(
+            points, smooth=self.corner_style != "arc", fill=self.frame_background,
+            outline=self.border_color if border else self.frame_background, width=border or 1,
+        )
+        if margin or border:
+            self.move(polygon, margin + border / 2, margin + border / 2)
 
         try:
             self.itemconfig(self.inner_frame, width=width, height=height)
         except Exception:
             pass
+
+    def _draw_shadow(self, left, top, right, bottom, blur):
+        """
+        Place the nine shadow slices around the rectangle left, top, right, bottom.
+
+        The corner images and edge profiles come pre-blurred from the shared
+        cache; only the edge strips are refilled (tiled by Tk) to the new
+        length, and the slices are moved with coords().
+        """
+        if not blur:
+            if self._shadow_items is not None:
+                self.delete("shadow")
+                self._shadow_items = self._shadow_slices = self._shadow_edges = None
+            return
+
+        slices = shadow_slices(self, self.radius, blur, self.shadow_color, self.parent_background, self.shadow_opacity)
+        extent, inset = slices["extent"], slices["inset"]
+        size = extent + inset
+        across, down = right - left - 2 * inset, bottom - top - 2 * inset
+
+        if self._shadow_items is None:
+            self._shadow_edges = [PhotoImage(master=self) for _ in range(4)]
+            self._shadow_items = [self.create_image(0, 0, anchor="nw", tags="shadow") for _ in range(8)]
+            self._shadow_items.append(self.create_rectangle(0, 0, 0, 0, width=0, tags="shadow"))
+            self.tag_lower("shadow")
+        corners, edges, center = self._shadow_items[:4], self._shadow_items[4:8], self._shadow_items[8]
+
+        if slices is not self._shadow_slices:
+            self._shadow_slices = slices
+            for item, image in zip(corners, slices["corners"]):
+                self.itemconfigure(item, image=image)
+            for item, image in zip(edges, self._shadow_edges):
+                self.itemconfigure(item, image=image)
+            self.itemconfigure(center, fill=slices["center"])
+
+        if across < 1 or down < 1:
+            # Smaller than the corner tiles; a shadow would overlap itself
+            self.itemconfigure("shadow", state="hidden")
+            return
+        self.itemconfigure("shadow", state="normal")
+
+        positions = (
+            (left - extent, top - extent), (right - inset, top - extent),
+            (right - inset, bottom - inset), (left - extent, bottom - inset),
+        )
+        for item, (x, y) in zip(corners, positions):
+            self.coords(item, x, y)
+
+        strips = (
+            ("top", left + inset, top - extent, across, size),
+            ("right", right - inset, top + inset, size, down),
+            ("bottom", left + inset, bottom - inset, across, size),
+            ("left", left - extent, top + inset, size, down),
+        )
+        for item, image, (side, x, y, strip_width, strip_height) in zip(edges, self._shadow_edges, strips):
+            self.tk.call(image, "copy", slices["edges"][side], "-to", 0, 0, strip_width, strip_height, "-shrink")
+            self.coords(item, x, y)
+        self.coords(center, left + inset, top + inset, right - inset, bottom - inset)
         
     def set_corner_radius(self, radius):
-        """Update the corner radius and redraw"""
-        self.radius = radius
+        """Update the corner radius (in logical pixels) and redraw"""
+        self.logical_radius = radius if not isinstance(radius, int) else (radius, radius, radius, radius)
+        self.radius = get_theme_context(self).scaled(self.logical_radius)
+        self.on_resize()
+
+    def set_shadow(self, blur=None, color=None, offset=None, opacity=None):
+        """Update the drop shadow (blur and offset in logical pixels) and redraw"""
+        if blur is not None:
+            self.shadow = blur
+        if color is not None:
+            self.shadow_color = color
+        if offset is not None:
+            self.shadow_offset = offset
+        if opacity is not None:
+            self.shadow_opacity = opacity
+        self.on_resize()
+
+    def set_border(self, width=None, color=None):
+        """Update the border (width in logical pixels) and redraw"""
+        if width is not None:
+            self.border = width
+        if color is not None:
+            self.border_color = color
+        self.on_resize()
+
+    def rescale(self):
+        """Redraw for a new DPI scale (see ThemeContext.set_scale)"""
+        self.radius = get_theme_context(self).scaled(self.logical_radius)
+        self.on_resize()
+
+    def reset(self, bootstyle=None, background=None, radius=None):
+        """
+        Reconfigure the frame for reuse instead of creating a new one.
+
+        Args:
+            bootstyle: New ttkbootstrap style string
+            background: Custom background color (overrides bootstyle color)
+            radius: New corner radius (int or tuple of 4)
+        """
+        if bootstyle is not None:
+            self.frame_background = self.style.colors.get(bootstyle.split(".")[0])
+        if background is not None:
+            self.frame_background = background
+        if radius is not None:
+            self.logical_radius = radius if not isinstance(radius, int) else (radius, radius, radius, radius)
+            self.radius = get_theme_context(self).scaled(self.logical_radius)
         self.on_resize()
         
     def set_background(self, background):
@@ -1,6 +1,11 @@
-import sys
 from tkinter import Listbox, StringVar, END, Frame
 import ttkbootstrap as ttk
+from .diagnostics import track
+from .theme_context import get_theme_context
+from .selection import SelectionModel
+from .executor import submit
+from .scroll_engine import ScrollEngine
+from .option_theme import LISTBOX_CLASS, install_option_theme, no_autostyle
 
 
 class RoundedListbox(Frame):
@@ -8,7 +13,9 @@ class RoundedListbox(Frame):
     A custom listbox widget with Ghost theme styling and scrollbar.
     
     This component wraps a tkinter.Listbox with a scrollbar to match the Ghost theme
-    with proper color palette and border styling.
+    with proper color palette and border styling. Items and the selection are
+    mirrored in Python (see SelectionModel), so reading a large selection costs
+    no per-item Tcl calls.
     
     Args:
         parent: The parent widget
@@ -16,52 +23,48 @@ class RoundedListbox(Frame):
         height: Number of visible rows
         selectmode: Selection mode ('single', 'browse', 'multiple', 'extended')
         font: Font tuple (family, size, weight)
+        page_loader: Enables infinite scrolling; called on a worker thread with
+            the page number (0, 1, ...) and returns that page's values, or an
+            empty list once there are no more
+        prefetch: Scroll fraction (0-1) past which the next page is requested
+        max_pages: Keep at most this many pages loaded, dropping the oldest
+            ones once they are far above the viewport (None keeps everything)
+        smooth_scroll: Ease wheel scrolling over several frames
+        scroll_acceleration: Extra speed per frame of continuous wheel input
     """
-    def __init__(self, parent, values=None, height=6, selectmode="browse", **kwargs):
+    LOADING_TEXT = "Loading…"
+    # Number of key functions whose per-item keys are kept
+    KEY_CACHE_SIZE = 4
+
+    def __init__(self, parent, values=None, height=6, selectmode="browse", page_loader=None, prefetch=0.8, max_pages=None, smooth_scroll=False, scroll_acceleration=0.0, **kwargs):
         self.parent = parent
         self.root = parent.winfo_toplevel()
-        self.style = self.root.style
+        self.style = get_theme_context(parent).style
         self.custom_values = values or []
+        self.page_loader = page_loader
+        self.prefetch = prefetch
+        self.max_pages = max_pages
         
-        # Get Ghost theme colors
-        self.bg_color = self.style.colors.get("inputbg")
-        self.fg_color = self.style.colors.get("inputfg")
-        self.select_bg = self.style.colors.get("primary")
-        self.select_fg = self.style.colors.get("selectfg")
-        self.border_color = self.style.colors.get("selectbg")
-        self.border_color_focus = self.style.colors.get("primary")
+        # Colors come from the option database, installed once per root
+        self.apply_palette(install_option_theme(parent), configure=False)
         
         # Remove custom kwargs
         kwargs.pop("bootstyle", None)
         kwargs.pop("radius", None)
-        custom_font = kwargs.pop("font", None)
         
-        # Initialize the Frame container
-        super().__init__(parent, bg=self.border_color, highlightthickness=0)
+        # Initialize the Frame container; its class selects the themed options
+        super().__init__(parent, class_=LISTBOX_CLASS, **no_autostyle(Frame))
         
         # Create inner container for border effect
-        self.inner_frame = Frame(self, bg=self.border_color, highlightthickness=2,
-                                highlightbackground=self.border_color, highlightcolor=self.border_color_focus)
+        self.inner_frame = Frame(self, **no_autostyle(Frame))
         self.inner_frame.pack(fill="both", expand=True)
         
-        # Set default font
-        if custom_font is None:
-            custom_font = ("Host Grotesk", 10) if sys.platform != "darwin" else ("Host Grotesk",)
-        
         # Create the Listbox
         self.listbox = Listbox(
             self.inner_frame,
-            bg=self.bg_color,
-            fg=self.fg_color,
-            selectbackground=self.select_bg,
-            selectforeground=self.select_fg,
-            highlightthickness=0,
-            relief="flat",
-            borderwidth=0,
-            activestyle="none",
             height=height,
             selectmode=selectmode,
-            font=custom_font,
+            **no_autostyle(Listbox),
             **kwargs
         )
         self.listbox.pack(side="left", fill="both", expand=True)
@@ -71,12 +74,21 @@ class RoundedListbox(Frame):
         self.scrollbar.pack(side="right", fill="y")
         
         # Configure listbox to use scrollbar
-        self.listbox.configure(yscrollcommand=self.scrollbar.set)
+        self.listbox.configure(yscrollcommand=self._on_yscroll if page_loader else self.scrollbar.set)
+        
+        # Python mirror of the items and of the selection, so bulk reads need
+        # no per-item Tcl calls; mutate through this class to keep them in sync
+        self._items = list(self.custom_values)
+        self.selection_model = SelectionModel(len(self._items))
+        self._key_cache = {}
+        self._version = 0
+        self.sorted_by = None
+        self.groups = None
+        self.listbox.bind("<<ListboxSelect>>", self._sync_selection, add="+")
         
         # Insert initial values
-        if self.custom_values:
-            for value in self.custom_values:
-                self.listbox.insert(END, value)
+        if self._items:
+            self.listbox.insert(END, *self._items)
         
         # Bind events for hover and focus effects
         self.listbox.bind("<Enter>", self._on_enter)
@@ -84,7 +96,14 @@ class RoundedListbox(Frame):
         self.listbox.bind("<FocusIn>", self._on_focus_in)
         self.listbox.bind("<FocusOut>", self._on_focus_out)
         
-        # Prevent mouse wheel from propagating to parent
+        # Wheel deltas are coalesced and applied once per frame; the handler
+        # also stops the event from propagating to the parent
+        self.scroll_engine = ScrollEngine(
+            self,
+            scroll_units=lambda units: self.listbox.yview_scroll(units, "units"),
+            smooth=smooth_scroll,
+            acceleration=scroll_acceleration,
+        )
         self.listbox.bind("<MouseWheel>", self._on_mousewheel)
         self.listbox.bind("<Button-4>", self._on_mousewheel)
         self.listbox.bind("<Button-5>", self._on_mousewheel)
@@ -92,18 +111,50 @@ class RoundedListbox(Frame):
         # Track if mouse is over the widget
         self.is_hovering = False
 
+        # Paginated loading state
+        self.loading = False
+        self.exhausted = False
+        self.dropped_rows = 0
+        self._next_page = 0
+        self._page_sizes = []
+        self._generation = 0
+        if page_loader:
+            self._load_next_page()
+        track(self)
+
+    def apply_palette(self, palette, configure=True):
+        """
+        Adopt the colors of a theme palette (see option_theme.theme_palette).
+
+        Args:
+            palette: The palette dict
+            configure: Also repaint the existing widgets (after a theme change)
+        """
+        self.bg_color = palette["list_bg"]
+        self.fg_color = palette["list_fg"]
+        self.select_bg = palette["list_select_bg"]
+        self.select_fg = palette["list_select_fg"]
+        self.border_color = palette["list_border"]
+        self.border_color_focus = palette["list_border_focus"]
+        self.muted_fg = palette["list_muted_fg"]
+        if configure:
+            focused = self.is_hovering or self.focus_get() == self.listbox
+            self.configure(bg=self.border_color)
+            self.inner_frame.configure(
+                bg=self.border_color,
+                highlightbackground=self.border_color_focus if focused else self.border_color,
+                highlightcolor=self.border_color_focus,
+            )
+            self.listbox.configure(
+                bg=self.bg_color,
+                fg=self.fg_color,
+                selectbackground=self.select_bg,
+                selectforeground=self.select_fg,
+            )
+
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling - prevent propagation to parent"""
-        if sys.platform == "win32":
-            self.listbox.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        elif sys.platform == "darwin":
-            self.listbox.yview_scroll(int(-1 * event.delta), "units")
-        else:
-            if event.num == 4:
-                self.listbox.yview_scroll(-1, "units")
-            elif event.num == 5:
-                self.listbox.yview_scroll(1, "units")
-        return "break"  # Prevent event from propagating to parent
+        return self.scroll_engine.on_wheel(event)
 
     def _on_enter(self, event=None):
         """Handle mouse enter - change border to purple"""
@@ -126,38 +177,288 @@ class RoundedListbox(Frame):
         if not self.is_hovering:
             self.inner_frame.configure(highlightbackground=self.border_color)
 
+    def _sync_selection(self, event=None):
+        """Copy the widget selection into the model after user interaction"""
+        # The loading row is not an item
+        size = len(self._items)
+        self.selection_model.set_indices(index for index in self.listbox.curselection() if index < size)
+
+    def _on_yscroll(self, first, last):
+        """Forward to the scrollbar and request the next page near the end"""
+        self.scrollbar.set(first, last)
+        if float(last) >= self.prefetch and not self.loading and not self.exhausted:
+            self._load_next_page()
+
+    def _load_next_page(self):
+        """Show the loading row and fetch the next page on a worker thread"""
+        self.loading = True
+        self.listbox.insert(END, self.LOADING_TEXT)
+        self.listbox.itemconfigure(END, foreground=self.muted_fg, selectforeground=self.muted_fg)
+        generation = self._generation
+        submit(
+            self,
+            self.page_loader,
+            self._next_page,
+            on_result=lambda values: self._page_loaded(generation, values),
+            on_error=lambda error: self._page_failed(generation, error),
+        )
+
+    def _end_loading(self, generation):
+        """Remove the loading row; False if the result is stale or the widget is gone"""
+        if generation != self._generation or not self.winfo_exists():
+            return False
+        self.loading = False
+        self.listbox.delete(len(self._items), END)
+        return True
+
+    def _page_loaded(self, generation, values):
+        """Append a page in one batch and drop old pages above the viewport"""
+        if not self._end_loading(generation):
+            return
+        values = list(values or ())
+        if not values:
+            self.exhausted = True
+            return
+        self._next_page += 1
+        self._page_sizes.append(len(values))
+        self.insert(END, *values)
+        if self.max_pages and len(self._page_sizes) > self.max_pages:
+            self._drop_old_pages()
+        # The page may not fill the view, so check the position again
+        self.after_idle(self._check_prefetch)
+
+    def _check_prefetch(self):
+        if self.winfo_exists():
+            self._on_yscroll(*self.listbox.yview())
+
+    def _page_failed(self, generation, error):
+        """Stop loading; scrolling near the end again retries the page"""
+        if not self._end_loading(generation):
+            return
+        self.root.report_callback_exception(type(error), error, error.__traceback__)
+
+    def _drop_old_pages(self):
+        """Delete the oldest pages that lie entirely above the viewport"""
+        top = self.listbox.nearest(0)
+        # Keep one page of slack above the view so scrolling back up is smooth
+        drop = 0
+        while len(self._page_sizes) > self.max_pages and drop + self._page_sizes[0] + self._page_sizes[1] <= top:
+            drop += self._page_sizes.pop(0)
+        if drop:
+            self.delete(0, drop - 1)
+            self.dropped_rows += drop
+            self.listbox.yview(top - drop)
+
+    def reset_pages(self):
+        """Discard every loaded page and start again from page 0"""
+        self._generation += 1
+        self.loading = False
+        self.exhausted = False
+        self.dropped_rows = 0
+        self._next_page = 0
+        self._page_sizes = []
+        self.set_values([])
+        self._load_next_page()
+
+    def sort(self, key=None, reverse=False, on_done=None):
+        """
+        Sort the items on a worker thread and apply the order in one update.
+
+        Keys are computed once per item and cached per key function (pass the
+        same function again to reuse them); sorting again by the current order
+        returns immediately and the reverse of it needs no sorting.
+
+        Args:
+            key: Function mapping an item to its sort key (None sorts the items)
+            reverse: Sort in descending order
+            on_done: Called on the Tk thread once the new order is shown
+        """
+        if self.page_loader:
+            raise ValueError("Sorting is not supported together with page_loader")
+        if self.sorted_by == (key, reverse):
+            if on_done:
+                on_done()
+            return
+        if self.sorted_by == (key, not reverse):
+            self._permute(range(len(self._items) - 1, -1, -1))
+            self.sorted_by = (key, reverse)
+            if on_done:
+                on_done()
+            return
+        self._request_order(key, reverse, False, on_done)
+
+    def group_by(self, key, on_done=None):
+        """
+        Order the items so each group is contiguous, computing groups on a worker.
+
+        Afterwards self.groups lists (group, first, last) in group order.
+
+        Args:
+            key: Function mapping an item to its (sortable) group
+            on_done: Called on the Tk thread once the groups are shown
+        """
+        if self.page_loader:
+            raise ValueError("Grouping is not supported together with page_loader")
+        self._request_order(key, False, True, on_done)
+
+    def select_group(self, group):
+        """Add every item of a group (see group_by) to the selection"""
+        for name, first, last in self.groups or ():
+            if name == group:
+                self.selection_set(first, last)
+                return
+
+    def _request_order(self, key, reverse, grouped, on_done):
+        keys = self._key_cache.get(key)
+        version = self._version
+        submit(
+            self,
+            _compute_order,
+            list(self._items),
+            None if keys is None else list(keys),
+            key,
+            reverse,
+            grouped,
+            on_result=lambda result: self._apply_order(version, key, reverse, result, on_done),
+        )
+
+    def _apply_order(self, version, key, reverse, result, on_done):
+        """Apply a worker's permutation unless the items changed meanwhile"""
+        if version != self._version or not self.winfo_exists():
+            return
+        keys, order, groups = result
+        if key is not None:
+            self._key_cache.pop(key, None)
+            self._key_cache[key] = keys
+            while len(self._key_cache) > self.KEY_CACHE_SIZE:
+                self._key_cache.pop(next(iter(self._key_cache)))
+        self._permute(order)
+        self.sorted_by = (key, reverse)
+        self.groups = groups
+        if on_done:
+            on_done()
+
+    def _permute(self, order):
+        """Reorder items, cached keys and the selection, then refill the widget once"""
+        order = list(order)
+        items = self._items
+        self._items = [items[index] for index in order]
+        for cached in self._key_cache:
+            keys = self._key_cache[cached]
+            self._key_cache[cached] = [keys[index] for index in order]
+        count = self.selection_model.count()
+        if 0 < count < len(order):
+            position = [0] * len(order)
+            for new, old in enumerate(order):
+                position[old] = new
+            self.selection_model.set_indices(sorted(position[index] for index in self.selection_model.indices()))
+        self.listbox.delete(0, END)
+        if self._items:
+            self.listbox.insert(END, *self._items)
+        for first, last in self.selection_model.ranges():
+            self.listbox.selection_set(first, last)
+        self._order_changed()
+
+    def _order_changed(self):
+        """Invalidate the known order and any sort still running"""
+        self._version += 1
+        self.sorted_by = None
+        self.groups = None
+
+    def _index(self, index, insert=False):
+        """
+        Resolve a Tk index ("end", "active", "@x,y", ...) to an int.
+
+        Like Tk, "end" is the position after the last item for insert and
+        the last item everywhere else.
+        """
+        if isinstance(index, int):
+            return index
+        if index == END:
+            return len(self._items) if insert else len(self._items) - 1
+        return self.listbox.index(index)
+
     def set_values(self, values):
         """Replace all items in the listbox"""
+        self._items = list(values)
+        self.selection_model = SelectionModel(len(self._items))
+        self._key_cache.clear()
+        self._order_changed()
         self.listbox.delete(0, END)
-        for value in values:
-            self.listbox.insert(END, value)
+        if self._items:
+            self.listbox.insert(END, *self._items)
     
     def get_selected(self):
         """Get the currently selected item(s)"""
-        selection = self.listbox.curselection()
-        if not selection:
+        count = self.selection_model.count()
+        if not count:
             return None
-        if len(selection) == 1:
-            return self.listbox.get(selection[0])
-        return [self.listbox.get(i) for i in selection]
+        if count == 1:
+            return self._items[next(self.selection_model.indices())]
+        return self.get_selected_values()
     
     def get_selected_index(self):
         """Get the index of the currently selected item(s)"""
-        selection = self.listbox.curselection()
-        if not selection:
+        count = self.selection_model.count()
+        if not count:
             return None
-        if len(selection) == 1:
-            return selection[0]
-        return list(selection)
+        if count == 1:
+            return next(self.selection_model.indices())
+        return list(self.selection_model.indices())
+
+    def get_selected_values(self):
+        """Return the selected items as a list, read from the Python model"""
+        values = []
+        for first, last in self.selection_model.ranges():
+            values.extend(self._items[first:last + 1])
+        return values
+
+    def selected_count(self):
+        """Return the number of selected items"""
+        return self.selection_model.count()
+
+    def select_all(self):
+        """Select every item"""
+        self.selection_model.select_all()
+        # Resolved index: while a page loads, the widget's "end" is the loading row
+        if self._items:
+            self.listbox.selection_set(0, len(self._items) - 1)
+
+    def select_range(self, first, last):
+        """Add the items from first to last (inclusive) to the selection"""
+        self.selection_set(first, last)
+
+    def invert_selection(self):
+        """Select exactly the items that are not selected"""
+        self.selection_model.invert()
+        self.listbox.selection_clear(0, END)
+        for first, last in self.selection_model.ranges():
+            self.listbox.selection_set(first, last)
     
     # Delegate common Listbox methods to the internal listbox
     def insert(self, index, *elements):
         """Insert elements at the given index"""
-        return self.listbox.insert(index, *elements)
+        position = max(0, min(self._index(index, insert=True), len(self._items)))
+        self._items[position:position] = elements
+        self.selection_model.insert(position, len(elements))
+        for key, keys in self._key_cache.items():
+            keys[position:position] = [key(element) for element in elements]
+        self._order_changed()
+        return self.listbox.insert(position, *elements)
     
     def delete(self, first, last=None):
         """Delete elements from first to last index"""
-        return self.listbox.delete(first, last)
+        start = max(0, self._index(first))
+        end = min(self._index(first if last is None else last), len(self._items) - 1)
+        if start > end:
+            return None
+        del self._items[start:end + 1]
+        for keys in self._key_cache.values():
+            del keys[start:end + 1]
+        self._order_changed()
+        self.selection_model.remove(start, end)
+        # Resolved indices: while a page loads, the widget's "end" is the loading row
+        return self.listbox.delete(start, end)
     
     def get(self, first, last=None):
         """Get elements from first to last index"""
@@ -165,16 +466,43 @@ class RoundedListbox(Frame):
     
     def curselection(self):
         """Return tuple of selected indices"""
-        return self.listbox.curselection()
+        return tuple(self.selection_model.indices())
     
     def selection_set(self, first, last=None):
         """Set selection to items between first and last"""
+        first, last = self._index(first), self._index(first if last is None else last)
+        self.selection_model.select(first, last)
         return self.listbox.selection_set(first, last)
     
     def selection_clear(self, first, last=None):
         """Clear selection between first and last"""
+        first, last = self._index(first), self._index(first if last is None else last)
+        self.selection_model.deselect(first, last)
         return self.listbox.selection_clear(first, last)
     
     def size(self):
         """Return the number of items in the listbox"""
-        return self.listbox.size()
\ No newline at end of file
+        return len(self._items)
+
+
+def _compute_order(items, keys, key, reverse, grouped):
+    """
+    Compute the sort permutation (and group bounds) off the Tk thread.
+
+    Returns:
+        (keys, order, groups) where keys are in the original item order
+    """
+    if keys is None and key is not None:
+        keys = [key(item) for item in items]
+    source = keys if keys is not None else items
+    order = sorted(range(len(items)), key=source.__getitem__, reverse=reverse)
+    groups = None
+    if grouped:
+        groups = []
+        for position, index in enumerate(order):
+            if groups and groups[-1][0] == source[index]:
+                groups[-1][2] = position
+            else:
+                groups.append([source[index], position, position])
+        groups = [tuple(group) for group in groups]
+    return keys, order, groups
@@ -1,6 +1,7 @@
-import sys
 from tkinter import Menu
-import ttkbootstrap as ttk
+from .diagnostics import track
+from .theme_context import get_theme_context
+from .option_theme import install_option_theme, menu_options, no_autostyle
 
 
 class RoundedMenu(Menu):
@@ -13,83 +14,93 @@ class RoundedMenu(Menu):
     Args:
         parent: The parent widget
         tearoff: Whether the menu can be torn off (default: 0)
+        provider: Callable receiving the menu that adds its items; it runs when
+            the menu is first posted instead of at construction
+        cache: Keep the provided items between posts (default: True); when
+            False, or after invalidate(), the items are rebuilt on the next post
+        postcommand: Still supported, called after the provider
         **kwargs: Additional Menu configuration options
     """
-    def __init__(self, parent, tearoff=0, **kwargs):
+    def __init__(self, parent, tearoff=0, provider=None, cache=True, **kwargs):
         self.parent = parent
         self.root = parent.winfo_toplevel()
-        
-        # Try to get style colors, fallback to defaults if not available
-        try:
-            self.style = self.root.style
-            self.bg_color = self.style.colors.get("secondary")
-            self.fg_color = self.style.colors.get("fg")
-            self.active_bg = self.style.colors.get("primary")
-            self.active_fg = self.style.colors.get("selectfg")
-            self.disabled_fg = self.style.colors.get("light")
-        except:
-            # Fallback colors if style is not available
-            self.bg_color = "#222324"
-            self.fg_color = "#ffffff"
-            self.active_bg = "#433dfb"
-            self.active_fg = "#ffffff"
-            self.disabled_fg = "#ADB5BD"
-        
-        # Set default font
-        if "font" not in kwargs:
-            kwargs["font"] = ("Host Grotesk", 10) if sys.platform != "darwin" else ("Host Grotesk",)
-        
-        # Initialize Menu with Ghost theme colors
-        super().__init__(
-            parent,
-            tearoff=tearoff,
-            bg=self.bg_color,
-            fg=self.fg_color,
-            activebackground=self.active_bg,
-            activeforeground=self.active_fg,
-            activeborderwidth=0,
-            borderwidth=0,
-            relief="flat",
-            disabledforeground=self.disabled_fg,
-            **kwargs
-        )
-    
-    def add_command(self, **kwargs):
-        """Add a command item to the menu with Ghost theme styling"""
-        # Set default accelerator color if not provided
-        if "accelerator" in kwargs and "foreground" not in kwargs:
-            kwargs["foreground"] = self.fg_color
-        super().add_command(**kwargs)
-    
-    def add_cascade(self, **kwargs):
-        """Add a cascade (submenu) to the menu"""
-        # If a menu is provided, ensure it's also styled
-        if "menu" in kwargs:
-            submenu = kwargs["menu"]
-            if isinstance(submenu, Menu):
-                submenu.configure(
-                    bg=self.bg_color,
-                    fg=self.fg_color,
-                    activebackground=self.active_bg,
-                    activeforeground=self.active_fg,
-                    activeborderwidth=0,
-                    borderwidth=0,
-                    relief="flat",
-                    disabledforeground=self.disabled_fg
-                )
-        super().add_cascade(**kwargs)
-    
-    def add_checkbutton(self, **kwargs):
-        """Add a checkbutton item to the menu"""
-        if "selectcolor" not in kwargs:
-            kwargs["selectcolor"] = self.active_bg
-        super().add_checkbutton(**kwargs)
-    
-    def add_radiobutton(self, **kwargs):
-        """Add a radiobutton item to the menu"""
-        if "selectcolor" not in kwargs:
-            kwargs["selectcolor"] = self.active_bg
-        super().add_radiobutton(**kwargs)
+        self.style = get_theme_context(parent).style
+        self.provider = provider
+        self.cache = cache
+        self.user_postcommand = kwargs.pop("postcommand", None)
+        self._populated = False
+        # Submenus the provider created, destroyed before it runs again
+        self._provided_children = []
+
+        # Colors and font are passed with the creation command, so styling
+        # costs no extra Tcl calls and leaves other menus of the app alone
+        palette = install_option_theme(parent)
+        self.apply_palette(palette, configure=False)
+        options = dict(menu_options(palette), **kwargs)
+
+        if provider is not None:
+            options["postcommand"] = self._on_post
+        elif self.user_postcommand is not None:
+            options["postcommand"] = self.user_postcommand
+        super().__init__(parent, tearoff=tearoff, **no_autostyle(Menu), **options)
+        track(self)
+
+    def _on_post(self):
+        """Populate the menu from its provider right before Tk posts it"""
+        if not (self.cache and self._populated):
+            self.populate()
+        if self.user_postcommand is not None:
+            self.user_postcommand()
+
+    def populate(self):
+        """Rebuild the items from the provider now, destroying the submenus it created last time"""
+        # The tearoff entry, if any, is entry 0 and stays
+        first = 1 if self.cget("tearoff") else 0
+        if self.index("end") is not None:
+            self.delete(first, "end")
+        for child in self._provided_children:
+            child.destroy()
+        existing = set(self.children.values())
+        self.provider(self)
+        self._provided_children = [child for child in self.children.values() if child not in existing]
+        self._populated = True
+
+    def invalidate(self):
+        """Rebuild the items from the provider the next time the menu is posted"""
+        self._populated = False
+
+    def add_lazy_cascade(self, label, provider, cache=True, **kwargs):
+        """
+        Add a cascade whose submenu is built by provider on first post.
+
+        Args:
+            label: The cascade label
+            provider: Callable receiving the submenu that adds its items
+            cache: Keep the items between posts (see RoundedMenu)
+            **kwargs: Additional add_cascade options
+
+        Returns:
+            The (still empty) submenu
+        """
+        submenu = RoundedMenu(self, provider=provider, cache=cache)
+        self.add_cascade(label=label, menu=submenu, **kwargs)
+        return submenu
+
+    def apply_palette(self, palette, configure=True):
+        """
+        Adopt the colors of a theme palette (see option_theme.theme_palette).
+
+        Args:
+            palette: The palette dict
+            configure: Also repaint the existing menu (after a theme change)
+        """
+        self.bg_color = palette["menu_bg"]
+        self.fg_color = palette["menu_fg"]
+        self.active_bg = palette["menu_active_bg"]
+        self.active_fg = palette["menu_active_fg"]
+        self.disabled_fg = palette["menu_disabled_fg"]
+        if configure:
+            self.configure(**menu_options(palette))
 
 
 def create_menubar(root):
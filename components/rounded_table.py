@@ -0,0 +1,438 @@
+import numbers
+import sys
+from array import array
+from tkinter import Canvas
+import ttkbootstrap as ttk
+from .rounded_frame import RoundedFrame
+from .scroll_engine import ScrollEngine
+from .theme_context import get_theme_context
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _sort_key(value):
+    """Order mixed column values: numbers, then strings, then other types by name, None last"""
+    if value is None:
+        return (3, "", 0)
+    if isinstance(value, numbers.Real):
+        return (0, "", value)
+    if isinstance(value, str):
+        return (1, "", value)
+    return (2, type(value).__name__, value)
+
+
+def _sorted_rows(values, length):
+    """Return the row indices sorted by a list column (stable, never raises on mixed types)"""
+    try:
+        return sorted(range(length), key=lambda row: _sort_key(values[row]))
+    except TypeError:
+        # Values of one type that do not compare with each other
+        return sorted(range(length), key=lambda row: _sort_key(values[row])[:2] + (str(values[row]),))
+
+
+class ColumnStore:
+    """
+    Column-oriented storage for table data.
+
+    Integer and float columns are kept in compact arrays (NumPy when it is
+    installed, the stdlib array module otherwise); any other column is a plain
+    list. Sort permutations are cached per column until the data changes.
+
+    Args:
+        columns: Column names
+        rows: Optional iterable of row sequences
+    """
+    def __init__(self, columns, rows=None):
+        self.columns = list(columns)
+        self.data = [[] for _ in self.columns]
+        self.length = 0
+        self._sort_cache = {}
+        if rows is not None:
+            self.set_rows(rows)
+
+    def set_rows(self, rows):
+        """Replace all data from an iterable of rows (each with one value per column)"""
+        rows = list(rows)
+        width = len(self.columns)
+        for index, row in enumerate(rows):
+            if len(row) != width:
+                raise ValueError(f"Row {index} has {len(row)} values, expected {width}")
+        if rows:
+            self.set_columns([list(column) for column in zip(*rows)])
+        else:
+            self.set_columns([[] for _ in self.columns])
+
+    def set_columns(self, columns):
+        """Replace all data from one sequence per column"""
+        if len(columns) != len(self.columns):
+            raise ValueError(f"Expected {len(self.columns)} columns, got {len(columns)}")
+        self.data = [self._pack(values) for values in columns]
+        self.length = len(self.data[0]) if self.data else 0
+        self._sort_cache.clear()
+
+    def _pack(self, values):
+        """Store a column in the most compact container that fits its values"""
+        if np is not None and isinstance(values, np.ndarray):
+            return values
+        if not len(values):
+            return list(values)
+        # Decide from the whole column, so NumPy and array store the same data
+        # alike (NumPy would silently truncate a later float into int64)
+        typecode = "q"
+        for value in values:
+            if isinstance(value, bool) or not isinstance(value, numbers.Real):
+                return list(values)
+            if typecode == "q" and not isinstance(value, numbers.Integral):
+                typecode = "d"
+        try:
+            if np is not None:
+                packed = np.asarray(values, dtype=np.int64 if typecode == "q" else np.float64)
+            else:
+                packed = array(typecode, values)
+        except (TypeError, ValueError, OverflowError):
+            return list(values)
+        return packed
+
+    def __len__(self):
+        return self.length
+
+    def value(self, column, row):
+        """Return the value at a column index and storage row"""
+        return self.data[column][row]
+
+    def sort_permutation(self, column, reverse=False):
+        """
+        Return the row order sorted by a column.
+
+        The ascending permutation is computed once per column and cached;
+        the descending order is derived from it.
+        """
+        key = (column, reverse)
+        permutation = self._sort_cache.get(key)
+        if permutation is not None:
+            return permutation
+
+        if reverse:
+            permutation = self.sort_permutation(column)[::-1]
+        else:
+            values = self.data[column]
+            if np is not None and isinstance(values, np.ndarray):
+                permutation = np.argsort(values, kind="stable")
+            else:
+                permutation = array("q", _sorted_rows(values, self.length))
+        self._sort_cache[key] = permutation
+        return permutation
+
+
+class RoundedTable(RoundedFrame):
+    """
+    A virtualized multi-column table inside a Ghost-styled rounded frame.
+
+    Data lives in a ColumnStore and only the rows inside the viewport exist as
+    canvas items. Scrolling moves the canvas view and recycles the row slots
+    that left the viewport, so the cost of a scroll step is proportional to
+    the number of rows that entered it, not to the size of the table.
+
+    Args:
+        parent: The parent widget
+        columns: Column names
+        rows: Optional iterable of row sequences
+        widths: Optional list of column widths in logical pixels (default: equal split)
+        row_height: Height of each row in logical pixels (scaled for DPI)
+        radius: Corner radius (int for all corners, or tuple of 4)
+        font: Font tuple (family, size, weight)
+        smooth_scroll: Ease wheel scrolling over several frames
+        **kwargs: Additional RoundedFrame options (bootstyle, background, ...)
+    """
+    def __init__(self, parent, columns, rows=None, widths=None, row_height=24, radius=15, **kwargs):
+        custom_font = kwargs.pop("font", None)
+        smooth_scroll = kwargs.pop("smooth_scroll", False)
+        kwargs.setdefault("bootstyle", "dark.TFrame")
+        super().__init__(parent, radius=radius, **kwargs)
+
+        self.store = ColumnStore(columns, rows)
+        self.logical_sizes = (row_height, widths)
+        self.row_height = get_theme_context(self).scaled(row_height)
+        self.widths = get_theme_context(self).scaled(widths) if widths else None
+        # Pixel-sized fonts (negative sizes) are scaled like the row height
+        self.logical_font = custom_font or (("Host Grotesk", 10) if sys.platform != "darwin" else ("Host Grotesk",))
+        self._scale_fonts()
+
+        self.fg_color = self.style.colors.get("fg")
+        self.muted_fg = self.style.colors.get("light")
+        self.select_bg = self.style.colors.get("primary")
+        self.stripe_bg = self.style.colors.get("secondary")
+
+        self.sort_column = None
+        self.sort_reverse = False
+        self.order = None
+        self.selected = None
+
+        self._offset = 0
+        self._slots = []
+        self._slot_rows = {}
+        self._column_x = []
+
+        pad = max(self.radius) // 2
+        self.header = Canvas(self, height=self.row_height, bg=self.frame_background, highlightthickness=0, bd=0)
+        self.header.pack(side="top", fill="x", padx=pad, pady=(pad, 0))
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side="right", fill="y", pady=pad, padx=(0, pad))
+        self.body = Canvas(self, bg=self.frame_background, highlightthickness=0, bd=0, yscrollincrement=1)
+        self.body.pack(side="left", fill="both", expand=True, padx=(pad, 0), pady=(0, pad))
+
+        self.body.bind("<Configure>", self._on_body_resize)
+        self.body.bind("<Button-1>", self._on_click)
+        self.header.bind("<Button-1>", self._on_header_click)
+        self.scroll_engine = ScrollEngine(
+            self,
+            scroll_pixels=lambda pixels: self.scroll_to(self._offset + pixels),
+            unit=self.row_height,
+            step=3,
+            smooth=smooth_scroll,
+        )
+        self.body.bind("<MouseWheel>", self._on_mousewheel)
+        self.body.bind("<Button-4>", self._on_mousewheel)
+        self.body.bind("<Button-5>", self._on_mousewheel)
+
+    # Data
+
+    def set_rows(self, rows):
+        """Replace the table contents"""
+        self.store.set_rows(rows)
+        self._data_changed()
+
+    def set_columns(self, columns):
+        """Replace the table contents from one sequence per column"""
+        self.store.set_columns(columns)
+        self._data_changed()
+
+    def _data_changed(self):
+        self.order = None
+        if self.sort_column is not None:
+            self.order = self.store.sort_permutation(self.sort_column, self.sort_reverse)
+        self.selected = None
+        self._offset = min(self._offset, self._max_offset())
+        self._rebuild()
+
+    def sort_by(self, column, reverse=False):
+        """Sort the view by a column index (None restores storage order)"""
+        self.sort_column = column
+        self.sort_reverse = reverse
+        self.order = None if column is None else self.store.sort_permutation(column, reverse)
+        self.selected = None
+        self._draw_header()
+        self._refresh_rows()
+
+    def storage_row(self, row):
+        """Map a view row to its storage row"""
+        return row if self.order is None else int(self.order[row])
+
+    def get_row(self, row):
+        """Return the values of a view row as a tuple"""
+        index = self.storage_row(row)
+        return tuple(column[index] for column in self.store.data)
+
+    # Scrolling
+
+    def yview(self, *args):
+        """Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"/"pages")"""
+        if not args:
+            total = self._content_height()
+            view = self.body.winfo_height()
+            return (self._offset / total, min(1.0, (self._offset + view) / total)) if total else (0.0, 1.0)
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * self._content_height()))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            step = self.row_height if args[2] == "units" else max(self.row_height, self.body.winfo_height() - self.row_height)
+            self.scroll_to(self._offset + amount * step)
+
+    def scroll_to(self, offset):
+        """Scroll so that the given pixel offset is at the top of the viewport"""
+        offset = max(0, min(int(offset), self._max_offset()))
+        if offset == self._offset:
+            return
+        self._offset = offset
+        self.body.yview_moveto(offset / max(1, self._content_height()))
+        self._assign_slots()
+        self._update_scrollbar()
+
+    def see(self, row):
+        """Scroll the minimum amount needed to show a view row"""
+        top = row * self.row_height
+        view = self.body.winfo_height()
+        if top < self._offset:
+            self.scroll_to(top)
+        elif top + self.row_height > self._offset + view:
+            self.scroll_to(top + self.row_height - view)
+
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch, coalesced per frame"""
+        return self.scroll_engine.on_wheel(event)
+
+    def _content_height(self):
+        return len(self.store) * self.row_height
+
+    def _max_offset(self):
+        return max(0, self._content_height() - max(1, self.body.winfo_height()))
+
+    def _update_scrollbar(self):
+        self.scrollbar.set(*self.yview())
+
+    # Rendering
+
+    def rescale(self):
+        """Apply a new DPI scale to the frame, rows, columns and fonts"""
+        super().rescale()
+        pad = max(self.radius) // 2
+        self.header.pack_configure(padx=pad, pady=(pad, 0))
+        self.scrollbar.pack_configure(pady=pad, padx=(0, pad))
+        self.body.pack_configure(padx=(pad, 0), pady=(0, pad))
+        # Keep the first visible row at the top
+        first = self._offset // self.row_height
+        row_height, widths = self.logical_sizes
+        self.row_height = get_theme_context(self).scaled(row_height)
+        self.widths = get_theme_context(self).scaled(widths) if widths else None
+        self._scale_fonts()
+        self.scroll_engine.unit = self.row_height
+        self.header.configure(height=self.row_height)
+        self._offset = first * self.row_height
+        self._rebuild()
+
+    def _scale_fonts(self):
+        self.font = get_theme_context(self).scaled_font(self.logical_font)
+        self.header_font = (self.font[0], self.font[1] if len(self.font) > 1 else 10, "bold")
+
+    def _on_body_resize(self, event=None):
+        self._rebuild()
+
+    def _rebuild(self):
+        """Recreate the row slots for the current viewport size"""
+        width, height = self.body.winfo_width(), self.body.winfo_height()
+        if width < 2 or height < 2:
+            return
+
+        count = len(self.store.columns)
+        widths = self.widths or [width / count] * count
+        self._column_x = []
+        x = 0
+        for column_width in widths:
+            self._column_x.append(x)
+            x += column_width
+
+        self.body.delete("all")
+        self.body.configure(scrollregion=(0, 0, width, max(height, self._content_height())))
+        self._slots = []
+        self._slot_rows = {}
+        for slot in range(height // self.row_height + 2):
+            tag = f"slot{slot}"
+            background = self.body.create_rectangle(0, 0, width, self.row_height, width=0, fill=self.frame_background, state="hidden", tags=(tag,))
+            cells = [
+                self.body.create_text(x + 8, self.row_height / 2, anchor="w", font=self.font, fill=self.fg_color, state="hidden", tags=(tag,))
+                for x in self._column_x
+            ]
+            self._slots.append({"tag": tag, "row": None, "y": 0, "background": background, "cells": cells, "texts": [None] * count})
+
+        self._offset = min(self._offset, self._max_offset())
+        self.body.yview_moveto(self._offset / max(1, self._content_height()))
+        self._draw_header()
+        self._assign_slots()
+        self._update_scrollbar()
+
+    def _draw_header(self):
+        self.header.delete("all")
+        self.header.configure(bg=self.frame_background)
+        for index, (name, x) in enumerate(zip(self.store.columns, self._column_x)):
+            if index == self.sort_column:
+                name = f"{name} {'▼' if self.sort_reverse else '▲'}"
+            self.header.create_text(x + 8, self.row_height / 2, anchor="w", text=name, font=self.header_font, fill=self.muted_fg)
+
+    def _assign_slots(self):
+        """Give the slots that left the viewport to the rows that entered it"""
+        if not self._slots:
+            return
+        first = self._offset // self.row_height
+        last = min(len(self.store), first + len(self._slots))
+        wanted = set(range(first, last))
+
+        free = []
+        for slot in self._slots:
+            row = slot["row"]
+            if row is not None and row in wanted:
+                wanted.discard(row)
+            else:
+                if row is not None:
+                    self._slot_rows.pop(row, None)
+                free.append(slot)
+
+        for row in sorted(wanted):
+            slot = free.pop()
+            self._place_slot(slot, row)
+        for slot in free:
+            if slot["row"] is not None:
+                slot["row"] = None
+                self.body.itemconfigure(slot["tag"], state="hidden")
+
+    def _place_slot(self, slot, row):
+        """Move a slot to a view row and update only the cells that changed"""
+        y = row * self.row_height
+        if slot["row"] is None:
+            self.body.itemconfigure(slot["tag"], state="normal")
+        self.body.move(slot["tag"], 0, y - slot["y"])
+        slot["y"] = y
+        slot["row"] = row
+        self._slot_rows[row] = slot
+
+        self.body.itemconfigure(slot["background"], fill=self._row_background(row))
+        index = self.storage_row(row)
+        for column, (item, values) in enumerate(zip(slot["cells"], self.store.data)):
+            text = str(values[index])
+            if slot["texts"][column] != text:
+                slot["texts"][column] = text
+                self.body.itemconfigure(item, text=text)
+
+    def _refresh_rows(self):
+        """Redraw the visible rows in place (after sorting or selection)"""
+        for slot in self._slots:
+            if slot["row"] is not None:
+                self._place_slot(slot, slot["row"])
+
+    def _row_background(self, row):
+        if row == self.selected:
+            return self.select_bg
+        return self.stripe_bg if row % 2 else self.frame_background
+
+    # Interaction
+
+    def _on_header_click(self, event):
+        if not self._column_x:
+            return
+        for column in range(len(self._column_x) - 1, -1, -1):
+            if event.x >= self._column_x[column]:
+                break
+        reverse = not self.sort_reverse if column == self.sort_column else False
+        self.sort_by(column, reverse)
+
+    def _on_click(self, event):
+        row = int(self.body.canvasy(event.y)) // self.row_height
+        if 0 <= row < len(self.store):
+            self.select(row)
+
+    def select(self, row):
+        """Select a view row and emit <<TableSelect>>"""
+        previous, self.selected = self.selected, row
+        for changed in (previous, row):
+            slot = self._slot_rows.get(changed)
+            if slot is not None:
+                self.body.itemconfigure(slot["background"], fill=self._row_background(changed))
+        self.event_generate("<<TableSelect>>")
+
+    def get_selected(self):
+        """Return the values of the selected row, or None"""
+        if self.selected is None:
+            return None
+        return self.get_row(self.selected)
@@ -0,0 +1,129 @@
+import math
+import sys
+import time
+
+
+def wheel_notches(event):
+    """Convert a wheel event to notches (positive scrolls down, may be fractional)"""
+    if event.num == 4:
+        return -1.0
+    if event.num == 5:
+        return 1.0
+    if sys.platform == "darwin":
+        return -float(event.delta)
+    return -event.delta / 120
+
+
+class ScrollEngine:
+    """
+    Coalesces mouse wheel events and applies them once per frame.
+
+    Touchpads send many small wheel events per gesture; instead of scrolling
+    (and redrawing) for each one, the deltas are summed and applied in a
+    single scroll call per frame. Fractional deltas carry over, so slow
+    high-resolution scrolling is not lost. Optionally the distance is spread
+    over a few frames (smooth) and consecutive frames of input speed it up
+    (acceleration).
+
+    Args:
+        widget: Widget used to schedule frames
+        scroll_units: Callable scrolling by a whole number of units (e.g. lines)
+        scroll_pixels: Callable scrolling by whole pixels; used instead of
+            scroll_units when given
+        unit: Pixels per unit (only used with scroll_pixels)
+        step: Units per wheel notch
+        smooth: Ease each scroll over several frames instead of jumping
+        acceleration: Extra speed per consecutive frame of wheel input (0 disables)
+        frame_ms: Frame interval in milliseconds
+    """
+    MAX_MULTIPLIER = 4.0
+    # Fraction of the remaining distance applied per frame when smooth
+    EASING = 0.35
+
+    def __init__(self, widget, scroll_units=None, scroll_pixels=None, unit=1, step=1, smooth=False, acceleration=0.0, frame_ms=16):
+        if scroll_units is None and scroll_pixels is None:
+            raise ValueError("ScrollEngine needs scroll_units or scroll_pixels")
+        self.widget = widget
+        self.scroll_units = scroll_units
+        self.scroll_pixels = scroll_pixels
+        self.unit = unit
+        self.step = step
+        self.smooth = smooth
+        self.acceleration = acceleration
+        self.frame_ms = frame_ms
+        self._pending = 0.0
+        self._remaining = 0.0
+        self._streak = 0
+        self._last_input = 0.0
+        self._after = None
+
+    def on_wheel(self, event):
+        """Wheel event handler; bind it to <MouseWheel>, <Button-4> and <Button-5>"""
+        self._pending += wheel_notches(event)
+        if self._after is None:
+            self._after = self.widget.after(self.frame_ms, self._frame)
+        return "break"
+
+    def stop(self):
+        """Cancel any scroll still in progress"""
+        if self._after is not None:
+            try:
+                self.widget.after_cancel(self._after)
+            except Exception:
+                pass
+        self._after = None
+        self._pending = 0.0
+        self._remaining = 0.0
+
+    def _frame(self):
+        self._after = None
+        if self._pending:
+            now = time.perf_counter()
+            # Input in back-to-back frames counts as one accelerating gesture
+            self._streak = self._streak + 1 if now - self._last_input < 3 * self.frame_ms / 1000 else 1
+            self._last_input = now
+            multiplier = min(self.MAX_MULTIPLIER, 1 + self.acceleration * (self._streak - 1))
+            distance = self._pending * self.step * multiplier
+            self._remaining += distance * self.unit if self.scroll_pixels else distance
+            self._pending = 0.0
+
+        amount = self._remaining
+        if self.smooth and abs(amount) >= 1:
+            amount = math.copysign(max(1.0, abs(amount) * self.EASING), amount)
+        whole = int(amount)
+        if whole:
+            self._remaining -= whole
+            try:
+                (self.scroll_pixels or self.scroll_units)(whole)
+            except Exception:
+                # The widget was destroyed mid-scroll
+                self._remaining = 0.0
+                return
+        if self.smooth and abs(self._remaining) >= 1:
+            self._after = self.widget.after(self.frame_ms, self._frame)
+
+
+def attach_scroll_engine(scrolled_frame, unit=20, step=3, smooth=True, acceleration=0.5):
+    """
+    Route the wheel events of a ttkbootstrap ScrolledFrame through a ScrollEngine.
+
+    ScrolledFrame binds its own _on_mousewheel when the pointer enters it, so
+    replacing that method on the instance is enough.
+
+    Args:
+        scrolled_frame: The ScrolledFrame
+        unit: Pixels per unit
+        step: Units per wheel notch
+        smooth: Ease scrolling over several frames
+        acceleration: Extra speed per consecutive frame of wheel input
+
+    Returns:
+        The ScrollEngine
+    """
+    def scroll_pixels(pixels):
+        first = scrolled_frame.vscroll.get()[0]
+        scrolled_frame.yview_moveto(first + pixels / max(1, scrolled_frame.winfo_height()))
+
+    engine = ScrollEngine(scrolled_frame, scroll_pixels=scroll_pixels, unit=unit, step=step, smooth=smooth, acceleration=acceleration)
+    scrolled_frame._on_mousewheel = engine.on_wheel
+    return engine
@@ -0,0 +1,151 @@
+from bisect import bisect_left, bisect_right
+
+
+class SelectionModel:
+    """
+    A selection over item indices stored as sorted, disjoint ranges.
+
+    Memory and most operations scale with the number of ranges, not the
+    number of selected items, so selecting all of a very large list is a
+    single range. Ranges are half-open internally; the public methods use
+    inclusive first/last like Tk.
+
+    Args:
+        size: Number of items the selection covers
+    """
+    def __init__(self, size=0):
+        self.size = size
+        self._starts = []
+        self._ends = []
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, index):
+        position = bisect_right(self._starts, index) - 1
+        return position >= 0 and index < self._ends[position]
+
+    def count(self):
+        """Return the number of selected items"""
+        return self._count
+
+    def ranges(self):
+        """Return the selection as a list of inclusive (first, last) tuples"""
+        return [(start, end - 1) for start, end in zip(self._starts, self._ends)]
+
+    def indices(self):
+        """Yield every selected index in ascending order"""
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end)
+
+    def clear(self):
+        """Deselect everything"""
+        self._starts = []
+        self._ends = []
+        self._count = 0
+
+    def select_all(self):
+        """Select every item"""
+        self._starts = [0] if self.size else []
+        self._ends = [self.size] if self.size else []
+        self._count = self.size
+
+    def select(self, first, last=None):
+        """Select the items from first to last (inclusive)"""
+        if not self.size:
+            return
+        first, last = self._clamp(first, last)
+        start, end = min(first, last), max(first, last) + 1
+        # Ranges that overlap or touch [start, end) are merged into one
+        i = bisect_left(self._ends, start)
+        j = bisect_right(self._starts, end)
+        if i < j:
+            start = min(start, self._starts[i])
+            end = max(end, self._ends[j - 1])
+        self._replace(i, j, [(start, end)])
+
+    def deselect(self, first, last=None):
+        """Deselect the items from first to last (inclusive)"""
+        if not self.size:
+            return
+        first, last = self._clamp(first, last)
+        start, end = min(first, last), max(first, last) + 1
+        i = bisect_right(self._ends, start)
+        j = bisect_left(self._starts, end)
+        if i >= j:
+            return
+        pieces = []
+        if self._starts[i] < start:
+            pieces.append((self._starts[i], start))
+        if self._ends[j - 1] > end:
+            pieces.append((end, self._ends[j - 1]))
+        self._replace(i, j, pieces)
+
+    def invert(self):
+        """Select exactly the items that are not selected"""
+        starts, ends = [], []
+        position = 0
+        for start, end in zip(self._starts, self._ends):
+            if start > position:
+                starts.append(position)
+                ends.append(start)
+            position = end
+        if position < self.size:
+            starts.append(position)
+            ends.append(self.size)
+        self._starts, self._ends = starts, ends
+        self._count = self.size - self._count
+
+    def set_indices(self, indices):
+        """Replace the selection with the given ascending indices (e.g. curselection())"""
+        starts, ends = [], []
+        for index in indices:
+            if ends and index == ends[-1]:
+                ends[-1] += 1
+            else:
+                starts.append(index)
+                ends.append(index + 1)
+        self._starts, self._ends = starts, ends
+        self._count = sum(end - start for start, end in zip(starts, ends))
+
+    def insert(self, index, count):
+        """Make room for count new, unselected items at index"""
+        self.size += count
+        position = bisect_right(self._ends, index)
+        if position < len(self._starts) and self._starts[position] < index:
+            # The insertion splits a selected range
+            self._starts.insert(position + 1, index)
+            self._ends.insert(position + 1, self._ends[position])
+            self._ends[position] = index
+            position += 1
+        for k in range(position, len(self._starts)):
+            self._starts[k] += count
+            self._ends[k] += count
+
+    def remove(self, first, last):
+        """Drop the items from first to last (inclusive) and shift the rest down"""
+        count = last - first + 1
+        if count <= 0:
+            return
+        self.deselect(first, last)
+        self.size -= count
+        position = bisect_left(self._starts, first)
+        for k in range(position, len(self._starts)):
+            self._starts[k] -= count
+            self._ends[k] -= count
+        # A range ending at first can now touch one that started after last
+        if 0 < position < len(self._starts) and self._ends[position - 1] == self._starts[position]:
+            self._ends[position - 1] = self._ends.pop(position)
+            del self._starts[position]
+
+    def _clamp(self, first, last):
+        """Clamp indices into the list like Tk does ("end" is the last item)"""
+        last = first if last is None else last
+        return max(0, min(first, self.size - 1)), max(0, min(last, self.size - 1))
+
+    def _replace(self, i, j, pieces):
+        removed = sum(self._ends[k] - self._starts[k] for k in range(i, j))
+        self._starts[i:j] = [start for start, _ in pieces]
+        self._ends[i:j] = [end for _, end in pieces]
+        self._count += sum(end - start for start, end in pieces) - removed
@@ -0,0 +1,112 @@
+import math
+from tkinter import PhotoImage, TclError
+from .theme_context import get_theme_context
+
+
+def shadow_alpha(distance, blur, opacity):
+    """
+    Opacity of a blurred shape's shadow at a signed distance from its edge.
+
+    A Gaussian blur of a straight edge is an erfc ramp; blur is about two
+    standard deviations, and negative distances lie inside the shape.
+    """
+    sigma = max(blur / 2, 0.5)
+    return opacity * 0.5 * math.erfc(distance / (sigma * math.sqrt(2)))
+
+
+def _blend(color, background, alpha):
+    """Mix color over background, as Tk photos have no partial transparency"""
+    return "#{:02x}{:02x}{:02x}".format(*(round(b + (c - b) * alpha) for c, b in zip(color, background)))
+
+
+def _rgb(widget, color, fallback):
+    """Resolve any Tk color (name, #rgb, system color) to 8-bit (r, g, b)"""
+    try:
+        return tuple(channel >> 8 for channel in widget.winfo_rgb(color))
+    except TclError:
+        return fallback
+
+
+def _corner_rows(radius, blur, extent, inset, opacity):
+    """Alpha rows of the top-left corner tile of a rounded rectangle's shadow"""
+    size = extent + inset
+    rows = []
+    for i in range(size):
+        y = i + 0.5 - extent
+        row = []
+        for j in range(size):
+            x = j + 0.5 - extent
+            dx, dy = radius - x, radius - y
+            distance = math.hypot(max(dx, 0.0), max(dy, 0.0)) + min(max(dx, dy), 0.0) - radius
+            row.append(shadow_alpha(distance, blur, opacity))
+        rows.append(row)
+    return rows
+
+
+def _photo(master, rows, color, background):
+    """Build a PhotoImage from alpha rows with a single put()"""
+    image = PhotoImage(master=master, width=len(rows[0]), height=len(rows))
+    data = " ".join("{" + " ".join(_blend(color, background, alpha) for alpha in row) + "}" for row in rows)
+    image.put(data, to=(0, 0))
+    return image
+
+
+def _build_slices(master, radius, blur, color, background, opacity):
+    # Tiles reach extent pixels outside the shape and inset pixels inside it,
+    # far enough in that the edge profiles no longer depend on the corner
+    extent = blur
+    inset = max(max(radius), blur)
+    rgb = _rgb(master, color, (0, 0, 0))
+    # An empty style lookup falls back to the theme background
+    background_rgb = _rgb(master, background, None) or _rgb(master, get_theme_context(master).colors.get("bg") or "white", (255, 255, 255))
+
+    corners = []
+    for corner, corner_radius in enumerate(radius):
+        rows = _corner_rows(corner_radius, blur, extent, inset, opacity)
+        # Mirror the top-left tile into TR, BR and BL orientation
+        if corner in (1, 2):
+            rows = [row[::-1] for row in rows]
+        if corner in (2, 3):
+            rows = rows[::-1]
+        corners.append(_photo(master, rows, rgb, background_rgb))
+
+    # Edge profiles: one pixel long, tiled to the frame length on resize
+    profile = [shadow_alpha(extent - i - 0.5, blur, opacity) for i in range(extent + inset)]
+    edges = {
+        "top": _photo(master, [[alpha] for alpha in profile], rgb, background_rgb),
+        "bottom": _photo(master, [[alpha] for alpha in profile[::-1]], rgb, background_rgb),
+        "left": _photo(master, [profile], rgb, background_rgb),
+        "right": _photo(master, [profile[::-1]], rgb, background_rgb),
+    }
+    return {
+        "corners": corners,
+        "edges": edges,
+        "center": _blend(rgb, background_rgb, shadow_alpha(-inset, blur, opacity)),
+        "extent": extent,
+        "inset": inset,
+    }
+
+
+def shadow_slices(widget, radius, blur, color, background, opacity):
+    """
+    Return the cached nine-slice images of a rounded rectangle's shadow.
+
+    The corners are pre-blurred images, the edges one-pixel profiles meant to
+    be tiled, and the center a flat color. They are generated once per
+    (radius, blur, color, background, opacity) in display pixels, so each DPI
+    scale gets its own entry, and are shared by all frames of the interpreter.
+
+    Args:
+        widget: Any widget of the interpreter
+        radius: Tuple of 4 corner radii in pixels (TL, TR, BR, BL)
+        blur: Blur distance in pixels
+        color: Shadow color
+        background: Color the shadow is blended onto (the parent background)
+        opacity: Shadow opacity right under the shape (0-1)
+
+    Returns:
+        A dict with corners, edges, center, extent and inset
+    """
+    context = get_theme_context(widget)
+    key = ("shadow", tuple(radius), blur, color, background, opacity)
+    return context.shadow_cache.get(key, lambda: _build_slices(context.root, tuple(radius), blur, color, background, opacity))
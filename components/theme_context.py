@@ -0,0 +1,182 @@
+import sys
+from tkinter import TclError
+import ttkbootstrap as ttk
+from .geometry import GeometryCache
+
+# One context per Tk interpreter, keyed by the interpreter (widget.tk)
+_contexts = {}
+
+# Bindtag carried by the root window only. <<ThemeChanged>> reaches every
+# widget and a <Destroy> binding on the root also sees each child, since the
+# root is a bindtag of all its descendants; binding on this tag instead runs
+# the handlers for the root's own events only.
+BINDTAG = "GhostThemeContext"
+
+
+class ThemeContext:
+    """
+    Theme state shared by every window of one Tk interpreter.
+
+    Components resolve it from any widget in O(1) with get_theme_context(),
+    so Toplevels need no style attribute of their own and opening a window
+    does not repeat any theme setup. The ttk style, cached style lookups,
+    derived styles and the per-interpreter helpers (dispatcher, asyncio
+    bridge, icon atlas, option database palette, shadow images) all live
+    here.
+
+    The context also owns the DPI scale: the Tk scaling factor relative to
+    96 DPI, read once. Components keep radii and paddings in logical (96 DPI)
+    pixels and draw them scaled; font sizes in points are already scaled by
+    Tk itself.
+
+    Args:
+        root: The Tk root window
+    """
+    def __init__(self, root):
+        self.root = root
+        self.tk = root.tk
+        # Apps attach their ttkbootstrap Style to the root; Style is a singleton otherwise
+        self.style = getattr(root, "style", None) or ttk.Style()
+        self.theme = self._theme_name()
+        self.scale = self._read_scale()
+        self._rescale_pending = False
+        self.dispatcher = None
+        self.asyncio_bridge = None
+        self.icon_atlas = None
+        self.option_palette = None
+        # Pre-blurred shadow slices; images belong to one interpreter
+        self.shadow_cache = GeometryCache(64)
+        self._loaded_theme_files = set()
+        self._lookups = {}
+        self._derived = set()
+        self._theme_listeners = []
+        root.bindtags((BINDTAG,) + root.bindtags())
+        root.bind_class(BINDTAG, "<<ThemeChanged>>", self._on_theme_changed)
+        root.bind_class(BINDTAG, "<Destroy>", self._on_destroy)
+
+    @property
+    def colors(self):
+        """The color palette of the current theme"""
+        return self.style.colors
+
+    def use_theme(self, theme, path=None):
+        """
+        Load a user theme file (once per interpreter) and activate a theme.
+
+        Args:
+            theme: Theme name
+            path: Optional JSON theme file defining it
+        """
+        if path is not None and path not in self._loaded_theme_files:
+            self.style.load_user_themes(path)
+            self._loaded_theme_files.add(path)
+        if self._theme_name() != theme:
+            self.style.theme_use(theme)
+
+    def lookup(self, style, option):
+        """Cached style.lookup(); cleared whenever ttk styles change"""
+        key = (style, option)
+        value = self._lookups.get(key)
+        if value is None:
+            value = self._lookups[key] = self.style.lookup(style, option)
+        return value
+
+    def derive_style(self, name, build):
+        """
+        Configure a derived ttk style once per theme.
+
+        Args:
+            name: The derived style name, e.g. "Ghost.TCombobox"
+            build: Called with the ttk style the first time name is needed
+        """
+        if name not in self._derived:
+            build(self.style)
+            self._derived.add(name)
+
+    def scaled(self, value):
+        """Convert a logical pixel value (or a tuple of them) to display pixels"""
+        if isinstance(value, (tuple, list)):
+            return tuple(self.scaled(item) for item in value)
+        return int(round(value * self.scale))
+
+    def scaled_font(self, font):
+        """Scale a font tuple given in pixels (negative size); point sizes pass through"""
+        if isinstance(font, (tuple, list)) and len(font) > 1 and isinstance(font[1], int) and font[1] < 0:
+            return (font[0], -self.scaled(-font[1])) + tuple(font[2:])
+        return font
+
+    def set_scale(self, scale=None):
+        """
+        Change the DPI scale, e.g. after the window moved to another monitor.
+
+        Every component is rescaled in a single idle pass, however often this
+        is called meanwhile. Geometry and image caches are keyed by pixel
+        size, so returning to a previous scale reuses their entries.
+
+        Args:
+            scale: New scale (default: re-read the Tk scaling factor)
+        """
+        scale = self._read_scale() if scale is None else scale
+        if scale == self.scale:
+            return
+        self.scale = scale
+        if not self._rescale_pending:
+            self._rescale_pending = True
+            self.root.after_idle(self._rescale)
+
+    def _read_scale(self):
+        if sys.platform == "darwin":
+            # Tk on macOS works in points; the system handles Retina scaling
+            return 1.0
+        try:
+            return max(1.0, float(self.tk.call("tk", "scaling")) / (96 / 72))
+        except TclError:
+            return 1.0
+
+    def _rescale(self):
+        # Imported here because diagnostics depends on this module
+        from .diagnostics import live_components
+
+        self._rescale_pending = False
+        for component in live_components():
+            rescale = getattr(component, "rescale", None)
+            if rescale is not None and component.tk == self.tk:
+                try:
+                    rescale()
+                except TclError:
+                    pass
+
+    def on_theme_change(self, callback):
+        """Call callback(context) after every switch to another theme"""
+        self._theme_listeners.append(callback)
+
+    def _theme_name(self):
+        try:
+            return self.style.theme_use()
+        except Exception:
+            return None
+
+    def _on_theme_changed(self, event):
+        # <<ThemeChanged>> also follows each "ttk::style configure", so only
+        # a real switch notifies the listeners
+        self._lookups.clear()
+        theme = self._theme_name()
+        if theme == self.theme:
+            return
+        self.theme = theme
+        self._derived.clear()
+        for callback in list(self._theme_listeners):
+            callback(self)
+
+    def _on_destroy(self, event):
+        _contexts.pop(self.tk, None)
+        if self.asyncio_bridge is not None:
+            self.asyncio_bridge.close()
+
+
+def get_theme_context(widget):
+    """Return the ThemeContext of the interpreter owning widget (any window)"""
+    context = _contexts.get(widget.tk)
+    if context is None:
+        context = _contexts[widget.tk] = ThemeContext(widget._root())
+    return context
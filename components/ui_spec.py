@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import ttkbootstrap as ttk
+from .offscreen import THEME_PATH, load_theme_colors
+from .rounded_frame import RoundedFrame
+from .rounded_button import RoundedButton
+from .rounded_combobox import RoundedCombobox
+from .rounded_listbox import RoundedListbox
+from .card_grid import CardGrid
+
+LAYOUT_PATH = os.path.join(os.path.dirname(THEME_PATH), "layout.json")
+
+# Bump when the plan format changes so stale caches are recompiled
+PLAN_VERSION = 1
+
+WIDGET_TYPES = {
+    "RoundedFrame": RoundedFrame,
+    "RoundedButton": RoundedButton,
+    "RoundedCombobox": RoundedCombobox,
+    "RoundedListbox": RoundedListbox,
+    "CardGrid": CardGrid,
+    "Frame": ttk.Frame,
+    "Label": ttk.Label,
+    "Separator": ttk.Separator,
+    "Entry": ttk.Entry,
+    "Checkbutton": ttk.Checkbutton,
+}
+
+# Components that paint their own surface and accept parent_background
+_SURFACES = {"RoundedFrame", "RoundedButton", "CardGrid"}
+# ttk widgets whose background must match the surface they sit on
+_TRANSPARENT = {"Label"}
+
+GEOMETRY_MANAGERS = ("pack", "grid", "place")
+
+
+class ConstructionPlan:
+    """
+    A compiled, flat list of widget construction steps.
+
+    Every step already carries its resolved colors, fonts and parent
+    background, so replaying it costs one constructor call and one geometry
+    call per widget with no follow-up configure() or style lookups.
+
+    Args:
+        sections: Dict mapping section names to lists of steps
+    """
+    def __init__(self, sections):
+        self.sections = sections
+
+    def replay(self, parent, section, handlers=None):
+        """
+        Build a section of the plan under parent.
+
+        Args:
+            parent: The container widget
+            section: Name of the section in the spec
+            handlers: Object whose attributes provide "command" callbacks
+
+        Returns:
+            A dict mapping step ids to the created widgets
+        """
+        widgets = []
+        named = {}
+        for step in self.sections[section]:
+            options = dict(step["options"])
+            if "command" in step:
+                options["command"] = getattr(handlers, step["command"])
+            master = parent if step["parent"] < 0 else widgets[step["parent"]]
+            widget = WIDGET_TYPES[step["type"]](master, **options)
+            if step["geometry"]:
+                getattr(widget, step["geometry"])(**step["layout"])
+            widgets.append(widget)
+            if step.get("id"):
+                named[step["id"]] = widget
+        return named
+
+    def to_json(self):
+        return {"version": PLAN_VERSION, "sections": self.sections}
+
+
+def _resolve(value, colors, fonts):
+    """Resolve "$color" and "@font" references"""
+    if isinstance(value, str):
+        if value.startswith("$"):
+            return colors[value[1:]]
+        if value.startswith("@"):
+            return fonts[value[1:]]
+    return value
+
+
+def compile_spec(spec, colors):
+    """
+    Compile a declarative layout spec into a ConstructionPlan.
+
+    Args:
+        spec: The parsed layout spec (see layout.json)
+        colors: Theme palette used to resolve "$name" colors and bootstyles
+
+    Returns:
+        A ConstructionPlan
+    """
+    fonts = spec.get("fonts", {})
+    root_background = _resolve(spec.get("parent_background", "$bg"), colors, fonts)
+    sections = {}
+
+    for name, nodes in spec["sections"].items():
+        steps = []
+
+        def emit(node, parent_index, parent_surface):
+            kind = node["type"]
+            if kind not in WIDGET_TYPES:
+                raise ValueError(f"Unknown widget type {kind!r} in section {name!r}")
+            options = {key: _resolve(value, colors, fonts) for key, value in node.get("options", {}).items()}
+            step = {"type": kind, "parent": parent_index, "options": options, "geometry": None, "layout": {}}
+            if "command" in options:
+                step["command"] = options.pop("command")
+            if node.get("id"):
+                step["id"] = node["id"]
+            for manager in GEOMETRY_MANAGERS:
+                if manager in node:
+                    step["geometry"] = manager
+                    step["layout"] = node[manager]
+                    break
+
+            surface = parent_surface
+            if kind in _SURFACES:
+                options.setdefault("parent_background", parent_surface)
+                if kind == "RoundedFrame":
+                    bootstyle = options.get("bootstyle") or options.get("style") or "primary.TButton"
+                    options.setdefault("background", colors.get(bootstyle.split(".")[0]))
+                    surface = options["background"]
+            elif kind == "Frame":
+                surface = colors.get("bg")
+            elif kind in _TRANSPARENT and parent_surface is not None:
+                options.setdefault("background", parent_surface)
+
+            steps.append(step)
+            index = len(steps) - 1
+            for child in node.get("children", ()):
+                emit(child, index, surface)
+
+        for node in nodes:
+            emit(node, -1, root_background)
+        sections[name] = steps
+
+    return ConstructionPlan(sections)
+
+
+def load_plan(spec_path=LAYOUT_PATH, theme_path=THEME_PATH, theme="ghost", cache_dir=None):
+    """
+    Load a construction plan, compiling the spec only when it changed.
+
+    The compiled plan is cached as JSON (in __pycache__ next to the spec by
+    default) and keyed by a hash of the spec, the theme file and the theme
+    name, so editing either file invalidates it.
+
+    Returns:
+        A ConstructionPlan
+    """
+    with open(spec_path, "rb") as file:
+        spec_bytes = file.read()
+    with open(theme_path, "rb") as file:
+        theme_bytes = file.read()
+    digest = hashlib.sha256(spec_bytes + b"\0" + theme_bytes + b"\0" + theme.encode() + bytes([PLAN_VERSION])).hexdigest()
+
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(spec_path)), "__pycache__")
+    cache_path = os.path.join(cache_dir, os.path.basename(spec_path) + ".plan.json")
+    try:
+        with open(cache_path, encoding="utf-8") as file:
+            cached = json.load(file)
+        if cached.get("key") == digest and cached.get("version") == PLAN_VERSION:
+            return ConstructionPlan(cached["sections"])
+    except (OSError, ValueError):
+        pass
+
+    plan = compile_spec(json.loads(spec_bytes.decode("utf-8")), load_theme_colors(theme_path, theme))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as file:
+            json.dump(dict(plan.to_json(), key=digest), file)
+    except OSError:
+        # A read-only install still works, it just compiles every time
+        pass
+    return plan
@@ -0,0 +1,119 @@
+import inspect
+from collections import OrderedDict
+
+
+class WidgetPool:
+    """
+    Keeps released components for reuse instead of destroying them.
+
+    Tk widgets cannot move to another parent, so idle widgets are bucketed by
+    parent and only handed out for the same parent again. Released widgets are
+    unmapped and their handlers detached (via their release() method); on
+    acquire they are reconfigured with reset() instead of being rebuilt.
+
+    Args:
+        factory: Component class or callable(parent, **options) creating a new widget
+        max_size: Maximum number of idle widgets kept across all parents
+        policy: "lru" reuses the most recently released widget and evicts the
+            least recently released one; "fifo" reuses and evicts in release order
+    """
+    def __init__(self, factory, max_size=64, policy="lru"):
+        if policy not in ("lru", "fifo"):
+            raise ValueError(f"Unknown eviction policy: {policy!r}")
+        self.factory = factory
+        self.max_size = max_size
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._idle = OrderedDict()
+
+    def acquire(self, parent, **options):
+        """
+        Return a widget for parent, reusing an idle one when possible.
+
+        Args:
+            parent: The parent widget
+            **options: Passed to reset() on reuse or to the factory on creation
+
+        Raises:
+            TypeError: If reset() does not accept the options, whether or not
+                an idle widget is available
+        """
+        self._check_options(options)
+        key = str(parent)
+        candidates = [widget_id for widget_id, (parent_key, _) in self._idle.items() if parent_key == key]
+        if self.policy == "lru":
+            candidates.reverse()
+        for widget_id in candidates:
+            _, widget = self._idle.pop(widget_id)
+            if not widget.winfo_exists():
+                continue
+            self.hits += 1
+            widget.reset(**options)
+            return widget
+        self.misses += 1
+        return self.factory(parent, **options)
+
+    def _check_options(self, options):
+        """Reject options reset() would not accept, so a miss fails like a hit"""
+        reset = getattr(self.factory, "reset", None)
+        if reset is None or not options:
+            return
+        try:
+            signature = inspect.signature(reset)
+        except (TypeError, ValueError):
+            return
+        # Unbound when the factory is a class: bind a placeholder for self
+        arguments = (None,) if inspect.isclass(self.factory) else ()
+        try:
+            signature.bind_partial(*arguments, **options)
+        except TypeError as error:
+            raise TypeError(f"{getattr(self.factory, '__name__', self.factory)}.reset() {error}") from None
+
+    def release(self, widget):
+        """Unmap a widget and keep it for reuse (or destroy it if the pool is full)"""
+        manager = widget.winfo_manager()
+        if manager == "pack":
+            widget.pack_forget()
+        elif manager == "grid":
+            widget.grid_forget()
+        elif manager == "place":
+            widget.place_forget()
+        release = getattr(widget, "release", None)
+        if release is not None:
+            release()
+
+        self._idle[id(widget)] = (str(widget.master), widget)
+        while len(self._idle) > self.max_size:
+            _, (_, evicted) = self._idle.popitem(last=False)
+            self.evictions += 1
+            evicted.destroy()
+
+    def resize(self, max_size):
+        """Change the maximum pool size, evicting idle widgets if needed"""
+        self.max_size = max_size
+        while len(self._idle) > self.max_size:
+            _, (_, evicted) = self._idle.popitem(last=False)
+            self.evictions += 1
+            evicted.destroy()
+
+    def clear(self):
+        """Destroy every idle widget"""
+        while self._idle:
+            _, (_, widget) = self._idle.popitem(last=False)
+            if widget.winfo_exists():
+                widget.destroy()
+
+    def __len__(self):
+        return len(self._idle)
+
+    def stats(self):
+        """Return reuse statistics as a dict"""
+        return {
+            "idle": len(self._idle),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -21,7 +21,7 @@ import sys
 import ttkbootstrap as ttk
 from ttkbootstrap.utility import enable_high_dpi_awareness
 from ttkbootstrap.scrolled import ScrolledFrame
-from components import RoundedFrame, RoundedButton, RoundedCombobox, RoundedListbox, RoundedMenu, create_menubar
+from components import attach_scroll_engine, load_plan, CardGrid, RoundedFrame, RoundedButton, RoundedCombobox, RoundedListbox, create_menubar
 
 
 class GhostTemplateShowcase:
@@ -48,6 +48,9 @@ class GhostTemplateShowcase:
         # Create menubar
         self.create_menubar()
         
+        # Compiled layout plan for the declarative sections (cached on disk)
+        self.layout_plan = load_plan()
+        
     def setup_theme(self):
         """Load and configure the Ghost theme"""
         self.root.style = ttk.Style()
@@ -98,72 +101,49 @@ class GhostTemplateShowcase:
         self.root.geometry(f"{self.size[0]}x{self.size[1]}+{x}+{y}")
     
     def create_menubar(self):
-        """Create a themed menubar"""
+        """Create a themed menubar (menus are built the first time they open)"""
         menubar = create_menubar(self.root)
-        
-        # File menu
-        file_menu = RoundedMenu(menubar)
+        self.show_toolbar = ttk.BooleanVar(value=True)
+        self.show_statusbar = ttk.BooleanVar(value=True)
+        menubar.add_lazy_cascade(label="File", provider=self.build_file_menu)
+        menubar.add_lazy_cascade(label="Edit", provider=self.build_edit_menu)
+        menubar.add_lazy_cascade(label="View", provider=self.build_view_menu)
+        menubar.add_lazy_cascade(label="Help", provider=self.build_help_menu)
+
+    def build_file_menu(self, file_menu):
+        """Populate the File menu"""
         file_menu.add_command(label="New", accelerator="Ctrl+N", command=self.on_menu_click)
         file_menu.add_command(label="Open", accelerator="Ctrl+O", command=self.on_menu_click)
         file_menu.add_command(label="Save", accelerator="Ctrl+S", command=self.on_menu_click)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
-        menubar.add_cascade(label="File", menu=file_menu)
-        
-        # Edit menu
-        edit_menu = RoundedMenu(menubar)
+
+    def build_edit_menu(self, edit_menu):
+        """Populate the Edit menu"""
         edit_menu.add_command(label="Undo", accelerator="Ctrl+Z", command=self.on_menu_click)
         edit_menu.add_command(label="Redo", accelerator="Ctrl+Y", command=self.on_menu_click)
         edit_menu.add_separator()
         edit_menu.add_command(label="Cut", accelerator="Ctrl+X", command=self.on_menu_click)
         edit_menu.add_command(label="Copy", accelerator="Ctrl+C", command=self.on_menu_click)
         edit_menu.add_command(label="Paste", accelerator="Ctrl+V", command=self.on_menu_click)
-        menubar.add_cascade(label="Edit", menu=edit_menu)
-        
-        # View menu with checkbuttons
-        view_menu = RoundedMenu(menubar)
-        self.show_toolbar = ttk.BooleanVar(value=True)
-        self.show_statusbar = ttk.BooleanVar(value=True)
+
+    def build_view_menu(self, view_menu):
+        """Populate the View menu"""
         view_menu.add_checkbutton(label="Toolbar", variable=self.show_toolbar, command=self.on_menu_click)
         view_menu.add_checkbutton(label="Status Bar", variable=self.show_statusbar, command=self.on_menu_click)
-        menubar.add_cascade(label="View", menu=view_menu)
-        
-        # Help menu
-        help_menu = RoundedMenu(menubar)
+
+    def build_help_menu(self, help_menu):
+        """Populate the Help menu"""
         help_menu.add_command(label="Documentation", command=self.on_menu_click)
         help_menu.add_command(label="About", command=self.on_menu_click)
-        menubar.add_cascade(label="Help", menu=help_menu)
     
     def on_menu_click(self):
         """Example menu callback"""
         print("Menu item clicked!")
         
     def create_header_section(self, parent):
-        """Create the header showcase section"""
-        # Main header container with rounded corners
-        header = RoundedFrame(parent, radius=15, bootstyle="secondary.TFrame")
-        header.pack(fill=ttk.BOTH, expand=False, pady=(0, 10))
-        
-        # Title
-        title = ttk.Label(
-            header, 
-            text="Ghost Theme Template", 
-            font=("Host Grotesk", 18, "bold")
-        )
-        title.configure(background=self.root.style.colors.get("secondary"))
-        title.pack(pady=(15, 5), padx=15)
-        
-        # Subtitle
-        subtitle = ttk.Label(
-            header, 
-            text="A beautiful, reusable tkinter theme with hexagonal boxes", 
-            font=("Host Grotesk", 10)
-        )
-        subtitle.configure(
-            background=self.root.style.colors.get("secondary"), 
-            foreground="lightgrey"
-        )
-        subtitle.pack(pady=(0, 15), padx=15)
+        """Create the header showcase section (declared in layout.json)"""
+        self.layout_plan.replay(parent, "header", handlers=self)
         
     def create_color_palette_section(self, parent):
         """Display the color palette"""
@@ -174,9 +154,9 @@ class GhostTemplateShowcase:
         )
         section_title.pack(pady=(10, 10), anchor=ttk.W)
         
-        # Color palette container
-        palette_frame = ttk.Frame(parent)
-        palette_frame.pack(fill=ttk.BOTH, expand=False, pady=(0, 10))
+        # Color palette: every swatch is drawn on one shared canvas
+        palette = CardGrid(parent, columns=4, card_height=56, gap=10, radius=10)
+        palette.pack(fill=ttk.X, expand=False, pady=(0, 10))
         
         colors = [
             ("Primary", "primary", "#433dfb"),
@@ -189,26 +169,8 @@ class GhostTemplateShowcase:
             ("Background", "bg", "#121111"),
         ]
         
-        for i, (name, style, hex_code) in enumerate(colors):
-            color_box = RoundedFrame(
-                palette_frame, 
-                radius=10, 
-                bootstyle=f"{style}.TFrame"
-            )
-            color_box.grid(row=i // 4, column=i % 4, padx=5, pady=5, sticky=ttk.NSEW)
-            
-            label = ttk.Label(
-                color_box, 
-                text=f"{name}\n{hex_code}", 
-                font=("Host Grotesk", 8),
-                anchor="center"
-            )
-            label.configure(background=self.root.style.colors.get(style))
-            label.pack(fill=ttk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Configure grid weights for even distribution
-        for i in range(4):
-            palette_frame.grid_columnconfigure(i, weight=1)
+        for name, style, hex_code in colors:
+            palette.add_card(style, title=name, value=hex_code, bootstyle=f"{style}.TFrame")
             
     def create_components_section(self, parent):
         """Showcase different component variations"""
@@ -410,21 +372,8 @@ class GhostTemplateShowcase:
         checkbutton.pack(padx=15, pady=(0, 15), anchor=ttk.W)
         
     def create_footer(self, parent):
-        """Create footer with usage information"""
-        footer = RoundedFrame(parent, radius=10, bootstyle="dark.TFrame")
-        footer.pack(fill=ttk.X, pady=(10, 0))
-        
-        footer_text = ttk.Label(
-            footer,
-            text="💡 Free to use in any project • Customize colors in theme.json",
-            font=("Host Grotesk", 9),
-            anchor="center"
-        )
-        footer_text.configure(
-            background=self.root.style.colors.get("dark"),
-            foreground="lightgrey"
-        )
-        footer_text.pack(pady=10, padx=15)
+        """Create footer with usage information (declared in layout.json)"""
+        self.layout_plan.replay(parent, "footer", handlers=self)
         
     def on_button_click(self, event=None):
         """Example button callback"""
@@ -435,6 +384,7 @@ class GhostTemplateShowcase:
         # Create scrollable container
         scrolled_container = ScrolledFrame(self.root, autohide=True)
         scrolled_container.pack(fill=ttk.BOTH, expand=True)
+        attach_scroll_engine(scrolled_container)
         
         # Main container with padding
         main_container = ttk.Frame(scrolled_container)
@@ -0,0 +1,56 @@
+"""
+Shared test fixtures.
+
+ttkbootstrap keeps one Style per process, so every test module shares a
+single FakeRoot; each test builds its widgets in a fresh container frame
+that is destroyed afterwards.
+"""
+
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ttkbootstrap as ttk
+from components import FakeRoot
+
+_root = None
+
+
+def fake_root():
+    """Return the FakeRoot shared by every test"""
+    global _root
+    if _root is None:
+        _root = FakeRoot()
+    return _root
+
+
+def wait_for(condition, timeout=2):
+    """Wait until condition() is true, for results delivered by worker threads"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+class FakeRootTestCase(unittest.TestCase):
+    """A test case with a FakeRoot (self.root, self.fake) and a container frame"""
+    def setUp(self):
+        self.root = fake_root()
+        self.fake = self.root.fake
+        self.container = ttk.Frame(self.root)
+        # Idle callbacks scheduled while creating the root must not run in a test
+        self.fake.pending.clear()
+        self.fake.reset_counts()
+
+    def tearDown(self):
+        self.container.destroy()
+        # Callbacks left over by one test must not run in the next
+        self.fake.pending.clear()
+
+    def calls(self, *prefix):
+        """Return the logged calls whose words after the widget path start with prefix"""
+        return [call for call in self.fake.log if call[1:1 + len(prefix)] == prefix]
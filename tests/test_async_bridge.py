@@ -0,0 +1,120 @@
+"""
+TkDispatcher and AsyncioBridge tests.
+
+Worker threads are real; the Tk thread is the test thread driving the
+FakeRoot with run_pending().
+"""
+
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+from support import FakeRootTestCase
+from components.async_bridge import AsyncioBridge, get_dispatcher, wrap_command
+
+
+def in_thread(func, *args):
+    """Run func(*args) on a worker thread and wait for it"""
+    thread = threading.Thread(target=func, args=args)
+    thread.start()
+    thread.join()
+
+
+class TkDispatcherTest(FakeRootTestCase):
+    def setUp(self):
+        super().setUp()
+        self.dispatcher = get_dispatcher(self.root)
+        self.fake.run_pending()
+
+    def test_nothing_is_scheduled_while_idle(self):
+        self.fake.pending.clear()
+        self.assertEqual(self.fake.run_pending(), 0)
+        self.assertEqual(self.fake.pending, {})
+
+    def test_calls_from_the_tk_thread_run_when_idle(self):
+        calls = []
+        self.dispatcher.call_soon(calls.append, 1)
+        self.assertEqual(calls, [])
+        self.fake.run_pending(idle_only=True)
+        self.assertEqual(calls, [1])
+
+    def test_calls_from_a_worker_wake_the_tk_thread(self):
+        calls = []
+        in_thread(self.dispatcher.call_soon, calls.append, 1)
+        self.assertEqual(calls, [1])
+        self.assertEqual(self.fake.pending, {})
+
+    def test_lost_wakeups_are_retried_once(self):
+        calls = []
+        with mock.patch.object(self.root, "event_generate", side_effect=RuntimeError) as generate:
+            for value in range(3):
+                in_thread(self.dispatcher.call_soon, calls.append, value)
+            # The first failure stops the workers from trying again
+            self.assertEqual(generate.call_count, 1)
+        self.assertEqual(calls, [])
+        # The next drain on the Tk thread picks the calls up and arms the retry
+        self.dispatcher.call_soon(calls.append, 3)
+        self.fake.run_pending(idle_only=True)
+        self.assertEqual(calls, [0, 1, 2, 3])
+        self.assertEqual(len(self.fake.pending), 1)
+        # The retry re-enables wakeups and does not re-arm itself
+        self.fake.run_pending()
+        self.assertEqual(self.fake.pending, {})
+        in_thread(self.dispatcher.call_soon, calls.append, 4)
+        self.assertEqual(calls[-1], 4)
+
+    def test_errors_are_reported(self):
+        with mock.patch.object(self.root, "report_callback_exception") as report:
+            self.dispatcher.call_soon(lambda: 1 / 0)
+            self.fake.run_pending()
+        self.assertIs(report.call_args[0][0], ZeroDivisionError)
+
+
+class AsyncioBridgeTest(FakeRootTestCase):
+    def setUp(self):
+        super().setUp()
+        self.bridge = AsyncioBridge(self.root)
+
+    def tearDown(self):
+        self.bridge.close()
+        self.bridge._thread.join(1)
+        super().tearDown()
+
+    def test_results_are_delivered(self):
+        async def answer():
+            return 42
+
+        results = []
+        future = self.bridge.create_task(answer(), on_done=results.append)
+        self.assertEqual(future.result(1), 42)
+        self.fake.run_pending()
+        self.assertEqual(results, [42])
+
+    def test_destroying_the_owner_cancels_its_tasks(self):
+        async def forever():
+            await asyncio.sleep(60)
+
+        future = self.bridge.create_task(forever(), owner=self.container)
+        self.container.destroy()
+        self.assertTrue(future.cancelled())
+        self.assertEqual(self.bridge._tasks, {})
+
+    def test_close_stops_the_loop(self):
+        self.bridge.close()
+        self.bridge._thread.join(1)
+        self.assertFalse(self.bridge._thread.is_alive())
+
+
+class WrapCommandTest(FakeRootTestCase):
+    def test_plain_commands(self):
+        command = print
+        self.assertIs(wrap_command(self.container, command), command)
+        calls = []
+        wrapped = wrap_command(self.container, lambda: calls.append(1), pass_event=False)
+        wrapped(object())
+        self.assertEqual(calls, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
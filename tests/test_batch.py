@@ -0,0 +1,62 @@
+"""
+BatchBuilder tests.
+"""
+
+import unittest
+
+from support import FakeRootTestCase
+from components import RoundedButton, RoundedFrame, build_buttons, build_frames
+from components.batch import tcl_quote
+
+
+class TclQuoteTest(unittest.TestCase):
+    def test_quoting(self):
+        self.assertEqual(tcl_quote("plain"), "plain")
+        self.assertEqual(tcl_quote(""), "{}")
+        self.assertEqual(tcl_quote("a b"), "a\\ b")
+        self.assertEqual(tcl_quote("[x]$y"), "\\[x\\]\\$y")
+        self.assertEqual(tcl_quote(("Host Grotesk", 10)), "Host\\\\\\ Grotesk\\ 10")
+
+
+class BatchBuilderTest(FakeRootTestCase):
+    def dispatch_commands(self):
+        return self.root.tk.splitlist(self.root.tk.call("info", "commands", "*batch_dispatch"))
+
+    def test_buttons_are_built_with_one_script_and_one_command(self):
+        before = len(self.dispatch_commands())
+        clicks = []
+        buttons = build_buttons(self.container, [{"text": f"Button {index}", "command": clicks.append} for index in range(5)])
+        self.assertTrue(all(isinstance(button, RoundedButton) for button in buttons))
+        self.assertEqual(len(self.dispatch_commands()), before + 1)
+        self.assertEqual(buttons[2].button.cget("text"), "Button 2")
+        self.fake.fire(buttons[3].button, "<Button-1>")
+        self.assertEqual(len(clicks), 1)
+        self.fake.fire(buttons[3].button, "<Enter>")
+        self.assertNotEqual(buttons[3].frame.frame_background, buttons[3].original_bg)
+
+    def test_dispatch_command_goes_with_the_last_component(self):
+        before = len(self.dispatch_commands())
+        first, second = build_buttons(self.container, [{"text": "a"}, {"text": "b"}])
+        first.destroy()
+        self.assertEqual(len(self.dispatch_commands()), before + 1)
+        second.destroy()
+        self.assertEqual(len(self.dispatch_commands()), before)
+
+    def test_frames_with_labels(self):
+        frames = build_frames(self.container, [{"text": "Card", "geometry": ("pack", {"side": "left"})}, {}])
+        self.assertTrue(all(isinstance(frame, RoundedFrame) for frame in frames))
+        label, = [child for child in frames[0].children.values() if child.widgetName == "ttk::label"]
+        self.assertEqual(label.cget("text"), "Card")
+        self.assertEqual(len([child for child in frames[1].children.values() if child.widgetName == "ttk::label"]), 0)
+        self.assertIn(("pack", frames[0]._w, "-side", "left"), self.fake.log)
+        self.fake.set_size(frames[0], 80, 40)
+        self.assertEqual(frames[0]._drawn[:2], (80, 40))
+
+    def test_empty_batch(self):
+        before = len(self.dispatch_commands())
+        self.assertEqual(build_buttons(self.container, []), [])
+        self.assertEqual(len(self.dispatch_commands()), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+CardGrid tests.
+"""
+
+import unittest
+
+from support import FakeRootTestCase
+from components import CardGrid
+
+
+class CardGridTest(FakeRootTestCase):
+    def setUp(self):
+        super().setUp()
+        self.clicked = []
+        self.grid = CardGrid(self.container, columns=4, card_height=60, gap=10, command=self.clicked.append)
+        for index in range(10):
+            self.grid.add_card(index, title=f"Card {index}", value=str(index))
+
+    def test_cards_share_one_canvas(self):
+        self.assertEqual(len(self.calls("create", "polygon")), 10)
+        self.assertEqual(len([call for call in self.fake.log if call[0] == "canvas"]), 1)
+
+    def test_layout_runs_once_per_width(self):
+        self.fake.set_size(self.grid, 430, 200)
+        self.assertEqual(len(self.calls("coords")), 30)
+        self.assertEqual(int(self.grid.cget("height")), 3 * 60 + 2 * 10)
+        self.fake.reset_counts()
+        self.fake.set_size(self.grid, 430, 500)
+        self.assertEqual(self.calls("coords"), [])
+
+    def test_card_at_and_click(self):
+        self.fake.set_size(self.grid, 430, 200)
+        # Cards are 100 pixels wide with 10 pixel gaps
+        self.assertEqual(self.grid.card_at(115, 75), 5)
+        self.assertIsNone(self.grid.card_at(105, 10))
+        self.assertIsNone(self.grid.card_at(400, 150))
+        self.fake.fire(self.grid, "<Button-1>", x=330, y=75)
+        self.assertEqual(self.clicked, [7])
+
+    def test_remove_reflows_the_following_cards(self):
+        self.fake.set_size(self.grid, 430, 200)
+        self.fake.reset_counts()
+        self.grid.remove_card(8)
+        self.assertEqual(len(self.calls("coords")), 3)
+        self.assertEqual(self.grid.card_at(0, 140), 9)
+        with self.assertRaises(ValueError):
+            self.grid.add_card(9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Resource accounting and leak detection tests.
+"""
+
+import gc
+import unittest
+
+from support import FakeRootTestCase
+from components import RoundedButton, RoundedFrame, diff_snapshots, find_leaks, snapshot
+from components.diagnostics import track_binding, track_command
+
+
+class DiagnosticsTest(FakeRootTestCase):
+    def leaks_of(self, component):
+        path = component._w
+        return [leak for leak in find_leaks() if leak["path"] == path]
+
+    def test_snapshot_diff_counts_new_components(self):
+        before = snapshot(self.root)
+        frames = [RoundedFrame(self.container) for _ in range(3)]
+        changes = diff_snapshots(before, snapshot(self.root))
+        self.assertEqual(changes["components"], {"RoundedFrame": 3})
+        self.assertGreater(changes["component_resources"]["tcl_commands"], 0)
+        self.assertEqual(len(frames), 3)
+
+    def test_clean_destroy_is_not_reported(self):
+        button = RoundedButton(self.container, text="OK", command=print)
+        path = button._w
+        button.destroy()
+        del button
+        gc.collect()
+        self.assertEqual([leak for leak in find_leaks() if leak["path"] == path], [])
+
+    def test_referenced_components_are_reported(self):
+        frame = RoundedFrame(self.container)
+        frame.destroy()
+        leak, = self.leaks_of(frame)
+        self.assertEqual(leak["type"], "RoundedFrame")
+        self.assertEqual(leak["commands"], [])
+
+    def test_bindings_on_other_widgets_are_reported(self):
+        frame = RoundedFrame(self.container)
+        funcid = self.container.bind("<Map>", lambda event: None, add="+")
+        track_binding(frame, self.container, "<Map>", funcid)
+        frame.destroy()
+        leak, = self.leaks_of(frame)
+        self.assertEqual(leak["bindings"], [(self.container._w, "<Map>")])
+
+    def test_shared_commands_are_reported_while_routed(self):
+        class Router:
+            handlers = {}
+
+        router = Router()
+        frame = RoundedFrame(self.container)
+        name = self.root.register(lambda: None)
+        router.handlers[1] = frame
+        track_command(frame, name, owner=router, key=1)
+        frame.destroy()
+        self.assertEqual(self.leaks_of(frame)[0]["commands"], [name])
+        del router.handlers[1]
+        self.assertEqual(self.leaks_of(frame)[0]["commands"], [])
+        self.root.deletecommand(name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Shared worker pool tests.
+
+Results come back through the TkDispatcher; on a FakeRoot the wakeup
+delivers them on the worker thread as soon as they are queued.
+"""
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from support import FakeRootTestCase, wait_for
+from components import RoundedButton, in_flight_count, submit
+from components.async_bridge import get_dispatcher
+
+
+class SubmitTest(FakeRootTestCase):
+    def test_result_is_delivered_after_the_count_drops(self):
+        results = []
+        release = threading.Event()
+        submit(self.container, release.wait, on_result=lambda result: results.append((result, in_flight_count())))
+        self.assertEqual(in_flight_count(), 1)
+        release.set()
+        wait_for(lambda: results)
+        self.assertEqual(results, [(True, 0)])
+
+    def test_count_drops_before_the_tk_thread_drains(self):
+        results = []
+        with mock.patch.object(self.root, "event_generate", side_effect=RuntimeError):
+            submit(self.container, lambda: 1, on_result=results.append).result(1)
+            wait_for(lambda: in_flight_count() == 0)
+        self.assertEqual(results, [])
+        # The next drain delivers the result and the retry restores wakeups
+        get_dispatcher(self.root).call_soon(lambda: None)
+        self.fake.run_pending(idle_only=True)
+        self.fake.run_pending()
+        self.assertEqual(results, [1])
+
+    def test_errors_go_to_on_error(self):
+        errors = []
+        submit(self.container, lambda: 1 / 0, on_error=errors.append)
+        wait_for(lambda: errors)
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            submit(self.container, print, kind="fiber")
+        self.assertEqual(in_flight_count(), 0)
+
+
+class ButtonExecutionTest(FakeRootTestCase):
+    def test_clicks_are_dropped_while_busy(self):
+        release = threading.Event()
+        runs, results = [], []
+
+        def command():
+            runs.append(1)
+            release.wait(1)
+            return len(runs)
+
+        button = RoundedButton(self.container, text="Run", command=command, execution="thread", on_result=results.append)
+        self.fake.fire(button.button, "<Button-1>")
+        self.assertTrue(button.busy)
+        self.fake.fire(button.button, "<Button-1>")
+        release.set()
+        wait_for(lambda: results)
+        self.assertEqual(results, [1])
+        self.assertFalse(button.busy)
+        self.assertEqual(button.frame.frame_background, button.original_bg)
+
+    def test_reset_ignores_a_stale_result(self):
+        release = threading.Event()
+        results = []
+        button = RoundedButton(self.container, text="Run", command=release.wait, execution="thread", on_result=results.append)
+        self.fake.fire(button.button, "<Button-1>")
+        button.release()
+        release.set()
+        wait_for(lambda: in_flight_count() == 0)
+        time.sleep(0.01)
+        self.assertEqual(results, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
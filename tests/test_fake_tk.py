@@ -0,0 +1,82 @@
+"""Tests of the FakeTkApp test double itself"""
+
+import unittest
+from tkinter import END, Listbox
+
+from support import FakeRootTestCase
+from components import RoundedButton, RoundedFrame
+
+
+class FakeTkTest(FakeRootTestCase):
+    def test_widget_options_round_trip(self):
+        listbox = Listbox(self.container, height=4)
+        listbox.configure(width=12)
+        self.assertEqual(str(listbox.cget("height")), "4")
+        self.assertEqual(str(listbox.cget("width")), "12")
+        self.assertTrue(listbox.winfo_exists())
+        listbox.destroy()
+        self.assertFalse(self.root.tk.call("winfo", "exists", str(listbox)))
+
+    def test_listbox_rows(self):
+        listbox = Listbox(self.container)
+        listbox.insert(END, "a", "b", "c")
+        listbox.insert(0, "z")
+        self.assertEqual(listbox.size(), 4)
+        self.assertEqual(listbox.get(0, END), ("z", "a", "b", "c"))
+        self.assertEqual(listbox.get(1), "a")
+        listbox.delete(1, END)
+        self.assertEqual(listbox.get(0, END), ("z",))
+        self.assertEqual(listbox.index(END), 1)
+
+    def test_bindings_run_and_break(self):
+        seen = []
+        frame = RoundedFrame(self.container)
+        frame.bind("<Enter>", lambda event: seen.append(event.widget) or "break")
+        self.fake.fire(frame, "<Enter>")
+        self.assertEqual(seen, [frame])
+
+    def test_events_follow_the_bindtags(self):
+        seen = []
+        frame = RoundedFrame(self.container)
+        self.assertEqual(frame.bindtags()[1:], ("Canvas", ".", "all"))
+        frame.bind_class("TestTag", "<Enter>", lambda event: seen.append("tag"))
+        self.fake.fire(frame, "<Enter>")
+        self.assertEqual(seen, [])
+        frame.bindtags(("TestTag",) + frame.bindtags())
+        self.fake.fire(frame, "<Enter>")
+        self.assertEqual(seen, ["tag"])
+
+    def test_button_hover(self):
+        clicks = []
+        button = RoundedButton(self.container, text="OK", command=clicks.append)
+        self.fake.fire(button.button, "<Enter>")
+        self.assertNotEqual(button.frame.frame_background, button.original_bg)
+        self.fake.fire(button.button, "<Leave>")
+        self.assertEqual(button.frame.frame_background, button.original_bg)
+        self.fake.fire(button.button, "<Button-1>")
+        self.assertEqual(len(clicks), 1)
+
+    def test_after_runs_when_pending_callbacks_run(self):
+        seen = []
+        self.root.after(1000, seen.append, "timer")
+        self.root.after_idle(seen.append, "idle")
+        self.assertEqual(self.fake.run_pending(idle_only=True), 1)
+        self.assertEqual(seen, ["idle"])
+        self.fake.run_pending()
+        self.assertEqual(seen, ["idle", "timer"])
+
+    def test_info_commands_pattern(self):
+        name = self.root.register(lambda: None)
+        self.assertEqual(self.root.tk.splitlist(self.root.tk.call("info", "commands", name)), (name,))
+        self.assertEqual(self.root.tk.splitlist(self.root.tk.call("info", "commands", "no_such_*")), ())
+
+    def test_measure_counts_calls_per_instance(self):
+        self.root.measure("frame", lambda: RoundedFrame(self.container), count=3)
+        entry = self.root.measurements["frame"]
+        self.assertEqual(entry["instances"], 3)
+        self.assertGreater(entry["calls"], 0)
+        self.assertIn("frame", self.root.report())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Outline geometry and cache tests.
+"""
+
+import unittest
+
+from components.geometry import GeometryCache, arc_rect_points, drawn_outline, outline_points, spline_points
+
+
+class GeometryTest(unittest.TestCase):
+    def test_outline_points_are_memoized(self):
+        first = outline_points(100, 50, (10, 10, 10, 10))
+        self.assertIs(first, outline_points(100, 50, [10, 10, 10, 10]))
+        self.assertEqual(len(first), 24)
+
+    def test_arc_points_stay_on_the_circle(self):
+        points = arc_rect_points(100, 50, (10, 10, 10, 10), segments=4)
+        self.assertEqual(len(points), 8 * 5)
+        for x, y in zip(points[0:10:2], points[1:10:2]):
+            self.assertAlmostEqual((x - 10) ** 2 + (y - 10) ** 2, 100)
+
+    def test_arc_radius_is_limited_to_half_the_size(self):
+        points = arc_rect_points(20, 10, (50, 50, 50, 50))
+        self.assertTrue(all(0 <= x <= 20 for x in points[0::2]))
+        self.assertTrue(all(0 <= y <= 10 for y in points[1::2]))
+
+    def test_spline_of_a_square_stays_inside(self):
+        points = spline_points(outline_points(40, 30, (8, 8, 8, 8)), steps=4)
+        self.assertEqual(len(points), 12 * 4 * 2)
+        self.assertTrue(all(0 <= x <= 40 for x in points[0::2]))
+        self.assertTrue(all(0 <= y <= 30 for y in points[1::2]))
+        # The corner is cut, but less than a circular arc would
+        self.assertNotIn((0, 0), list(zip(points[0::2], points[1::2])))
+
+    def test_drawn_outline_keeps_arc_points(self):
+        radius = (6, 6, 6, 6)
+        self.assertIs(drawn_outline(30, 20, radius, "arc", 3), outline_points(30, 20, radius, "arc", 3))
+
+    def test_cache_evicts_the_least_recently_used(self):
+        cache = GeometryCache(2)
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        cache.get("a", lambda: 0)
+        cache.get("c", lambda: 3)
+        self.assertEqual(cache.get("a", lambda: 0), 1)
+        self.assertEqual(cache.get("b", lambda: 0), 0)
+        self.assertEqual(cache.info(), {"hits": 2, "misses": 4, "size": 2, "maxsize": 2})
+        cache.resize(1)
+        self.assertEqual(cache.info()["size"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
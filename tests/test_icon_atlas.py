@@ -0,0 +1,113 @@
+"""
+IconAtlas tests.
+
+The sheets are written to a temporary directory with Pillow; without it the
+atlas needs Tk to read the files, which the FakeRoot does not model.
+"""
+
+import os
+import tempfile
+import unittest
+
+from support import FakeRootTestCase
+from components import IconAtlas, RoundedButton, get_icon_atlas, get_theme_context
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class IconAtlasTest(FakeRootTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.sheet = os.path.join(cls.directory.name, "sheet.png")
+        # Four 16x16 cells in a row, then three in the next
+        Image.new("RGBA", (64, 32), (255, 255, 255, 255)).save(cls.sheet)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def setUp(self):
+        super().setUp()
+        self.atlas = IconAtlas(self.root, spare=1)
+        self.atlas.add_sheet(self.sheet, ["open", "save", None, "close", "cut", "copy", "paste"], 16)
+
+    def tearDown(self):
+        for key in list(self.atlas._images):
+            self.atlas._delete(key)
+        super().tearDown()
+
+    def test_sheet_cells(self):
+        self.assertEqual(self.atlas.names(), ["open", "save", "close", "cut", "copy", "paste"])
+        self.assertEqual(self.atlas._icons["close"][1:], (48, 0, 16, 16))
+        self.assertEqual(self.atlas._icons["copy"][1:], (16, 16, 16, 16))
+        with self.assertRaises(KeyError):
+            self.atlas.acquire("print")
+
+    def test_images_are_shared_and_reference_counted(self):
+        first = self.atlas.acquire("open")
+        second = self.atlas.acquire("open")
+        self.assertIs(first, second)
+        self.assertEqual(self.atlas.info(), {"icons": 6, "images": 1, "unused": 0, "references": 2})
+        self.atlas.release(first)
+        self.assertEqual(self.atlas.info()["references"], 1)
+        self.atlas.release(second)
+        self.assertEqual(self.atlas.info(), {"icons": 6, "images": 1, "unused": 1, "references": 0})
+        # An unused image is reused instead of rendered again
+        self.assertIs(self.atlas.acquire("open"), first)
+
+    def test_unused_images_beyond_the_spare_pool_are_deleted(self):
+        images = [self.atlas.acquire(name) for name in ("open", "save", "cut")]
+        self.fake.reset_counts()
+        for image in images:
+            self.atlas.release(image)
+        self.assertEqual(self.atlas.info()["images"], 1)
+        self.assertEqual([call[2] for call in self.calls("delete")], [str(images[0]), str(images[1])])
+        self.atlas.clear()
+        self.assertEqual(self.atlas.info()["images"], 0)
+
+    def test_each_size_and_scale_has_its_own_image(self):
+        small = self.atlas.acquire("save", 16)
+        large = self.atlas.acquire("save", 32)
+        self.assertIsNot(small, large)
+        self.assertEqual((large.width(), large.height()), (32, 32))
+        context = get_theme_context(self.root)
+        try:
+            context.scale = 2.0
+            self.assertIs(self.atlas.acquire("save", 16), large)
+        finally:
+            context.scale = 1.0
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class ButtonIconTest(FakeRootTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        sheet = os.path.join(self.directory.name, "toolbar.png")
+        Image.new("RGBA", (32, 16), (0, 0, 0, 255)).save(sheet)
+        self.atlas = get_icon_atlas(self.root)
+        self.atlas.add_sheet(sheet, ["toolbar-new", "toolbar-delete"], 16)
+
+    def tearDown(self):
+        super().tearDown()
+        self.atlas.clear()
+        self.directory.cleanup()
+
+    def test_buttons_share_one_image_per_icon(self):
+        buttons = [RoundedButton(self.container, icon=("toolbar-new", "toolbar-delete")[index % 2]) for index in range(50)]
+        self.assertIs(buttons[0].icon_image, buttons[2].icon_image)
+        self.assertEqual(len({str(button.icon_image) for button in buttons}), 2)
+        self.assertEqual(self.atlas.info()["references"], 50)
+        buttons[0].reset(icon="toolbar-delete")
+        self.assertIs(buttons[0].icon_image, buttons[1].icon_image)
+        self.container.destroy()
+        self.assertEqual(self.atlas.info()["references"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
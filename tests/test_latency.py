@@ -0,0 +1,79 @@
+"""
+Latency histogram, tracer and overlay tests.
+"""
+
+import unittest
+
+from support import FakeRootTestCase
+from components import LatencyHistogram, LatencyOverlay, LatencyTracer
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_percentiles_are_bucket_bounds(self):
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.record(0.001)
+        histogram.record(0.5)
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.percentile(50), 0.001, delta=0.001 * 0.12)
+        self.assertEqual(histogram.percentile(100), 0.5)
+        self.assertAlmostEqual(histogram.mean(), (0.099 + 0.5) / 100)
+
+    def test_empty(self):
+        self.assertEqual(LatencyHistogram().percentile(99), 0.0)
+
+
+class LatencyTracerTest(FakeRootTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tracer = LatencyTracer().install()
+
+    def tearDown(self):
+        self.tracer.uninstall()
+        super().tearDown()
+
+    def test_bindings_and_after_callbacks_are_timed_by_name(self):
+        def on_click(event):
+            pass
+
+        def later():
+            pass
+
+        self.container.bind("<Button-1>", on_click)
+        self.fake.fire(self.container, "<Button-1>")
+        self.root.after(10, later)
+        self.fake.run_pending()
+        names = {row["name"]: row["count"] for row in self.tracer.summary()}
+        self.assertEqual(names[on_click.__qualname__], 1)
+        self.assertEqual(names[later.__qualname__], 1)
+        self.assertIn(later.__qualname__, self.tracer.report())
+
+    def test_lag_monitor_reschedules_until_stopped(self):
+        self.tracer.start_lag_monitor(self.root)
+        self.fake.run_pending()
+        self.fake.run_pending()
+        self.assertEqual(self.tracer.lag.count, 2)
+        # The heartbeat itself is not reported as a handler
+        self.assertEqual(self.tracer.summary(), [])
+        self.tracer.stop_lag_monitor()
+        self.assertEqual(self.fake.pending, {})
+
+    def test_uninstall_stops_timing(self):
+        self.tracer.uninstall()
+        self.root.after(10, lambda: None)
+        self.fake.run_pending()
+        self.assertEqual(self.tracer.handlers, {})
+
+    def test_overlay_refreshes_until_destroyed(self):
+        self.tracer.record("handler", 0.002)
+        overlay = LatencyOverlay(self.container, self.tracer, refresh=100)
+        self.fake.run_pending()
+        self.assertIn("handler", overlay.label.cget("text"))
+        self.assertEqual(len(self.fake.pending), 1)
+        overlay.destroy()
+        self.assertEqual(self.fake.pending, {})
+        self.assertNotIn(overlay._update, self.tracer.ignored)
+
+
+if __name__ == "__main__":
+    unittest.main()
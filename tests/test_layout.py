@@ -0,0 +1,66 @@
+"""
+RoundedFrame minimum size and Configure loop monitor tests.
+"""
+
+import unittest
+
+from support import FakeRootTestCase
+from components import ConfigureLoopMonitor, RoundedFrame, install_layout_monitor, uninstall_layout_monitor
+
+
+class MinimumSizeTest(FakeRootTestCase):
+    def test_minimum_is_requested_at_construction(self):
+        frame = RoundedFrame(self.container, min_width=200, min_height=100)
+        self.assertEqual((frame.winfo_reqwidth(), frame.winfo_reqheight()), (200, 100))
+
+    def test_configure_handler_does_not_reconfigure(self):
+        frame = RoundedFrame(self.container, min_width=200, min_height=100)
+        self.fake.reset_counts()
+        self.fake.set_size(frame, 150, 80)
+        self.assertEqual(self.calls("configure"), [])
+        # Drawn at the minimum meanwhile
+        self.assertEqual(frame._drawn[:2], (200, 100))
+        self.assertEqual(self.fake.pending, {})
+
+    def test_lowered_request_is_raised_once_when_idle(self):
+        frame = RoundedFrame(self.container, min_width=200, min_height=100)
+        frame.configure(width=50)
+        for width in (150, 160, 170):
+            self.fake.set_size(frame, width, 80)
+        self.assertEqual(len(self.fake.pending), 1)
+        self.fake.run_pending(idle_only=True)
+        self.assertEqual(frame.winfo_reqwidth(), 200)
+
+    def test_frame_draws_once_per_size(self):
+        frame = RoundedFrame(self.container, radius=10, border=1)
+        self.fake.set_size(frame, 120, 80)
+        self.assertEqual(len(self.calls("create", "polygon")), 1)
+        self.fake.set_size(frame, 120, 80)
+        self.assertEqual(len(self.calls("create", "polygon")), 1)
+
+
+class ConfigureLoopMonitorTest(FakeRootTestCase):
+    def tearDown(self):
+        uninstall_layout_monitor()
+        super().tearDown()
+
+    def test_bursts_are_reported_once(self):
+        reports = []
+        monitor = ConfigureLoopMonitor(threshold=3, window=60, reporter=reports.append)
+        for size in (10, 20, 10, 20, 10, 20):
+            monitor.record(self.container, size, size)
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0]["path"], str(self.container))
+        self.assertEqual(reports[0]["sizes"], [(10, 10), (20, 20)])
+
+    def test_frames_report_to_the_installed_monitor(self):
+        reports = []
+        install_layout_monitor(threshold=2, window=60, reporter=reports.append)
+        frame = RoundedFrame(self.container)
+        for width in (100, 101, 100):
+            self.fake.set_size(frame, width, 50)
+        self.assertEqual([report["path"] for report in reports], [str(frame)])
+
+
+if __name__ == "__main__":
+    unittest.main()
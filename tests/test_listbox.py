@@ -0,0 +1,272 @@
+"""
+SelectionModel and RoundedListbox tests.
+"""
+
+import threading
+import time
+import unittest
+from tkinter import END
+from unittest import mock
+
+from support import FakeRootTestCase, wait_for
+from components import RoundedListbox, SelectionModel, in_flight_count
+
+
+class SelectionModelTest(unittest.TestCase):
+    def test_select_merges_touching_ranges(self):
+        model = SelectionModel(10)
+        model.select(2, 3)
+        model.select(4, 5)
+        model.select(8)
+        self.assertEqual(model.ranges(), [(2, 5), (8, 8)])
+        self.assertEqual(model.count(), 5)
+
+    def test_deselect_splits_a_range(self):
+        model = SelectionModel(10)
+        model.select_all()
+        model.deselect(3, 4)
+        self.assertEqual(model.ranges(), [(0, 2), (5, 9)])
+        self.assertNotIn(3, model)
+        self.assertIn(5, model)
+
+    def test_invert(self):
+        model = SelectionModel(6)
+        model.select(1, 2)
+        model.invert()
+        self.assertEqual(model.ranges(), [(0, 0), (3, 5)])
+        self.assertEqual(model.count(), 4)
+
+    def test_insert_and_remove_shift_the_selection(self):
+        model = SelectionModel(6)
+        model.select(2, 4)
+        model.insert(3, 2)
+        self.assertEqual(model.ranges(), [(2, 2), (5, 6)])
+        model.remove(3, 4)
+        self.assertEqual(model.ranges(), [(2, 4)])
+        self.assertEqual(model.size, 6)
+
+
+class ListboxTestCase(FakeRootTestCase):
+    def assertMirrored(self, listbox):
+        """The widget rows are the mirrored items, plus the loading row while a page loads"""
+        rows = list(listbox.listbox.get(0, END))
+        if listbox.loading:
+            self.assertEqual(rows.pop(), listbox.LOADING_TEXT)
+        self.assertEqual(rows, [str(item) for item in listbox._items])
+
+
+class RoundedListboxTest(ListboxTestCase):
+    def test_listbox_mirror(self):
+        listbox = RoundedListbox(self.container, values=["a", "b", "c"], selectmode="extended")
+        listbox.insert(END, "d", "e")
+        listbox.insert(0, "z")
+        self.assertEqual(listbox.listbox.get(0, END), ("z", "a", "b", "c", "d", "e"))
+        listbox.selection_set(1, 2)
+        listbox.delete(0)
+        self.assertEqual(listbox.get_selected_values(), ["a", "b"])
+        self.assertMirrored(listbox)
+
+    def test_listbox_delete_end_removes_the_last_item(self):
+        listbox = RoundedListbox(self.container, values=["a", "b", "c"])
+        listbox.delete(END)
+        self.assertEqual(listbox.listbox.get(0, END), ("a", "b"))
+        listbox.delete(1, END)
+        self.assertEqual(listbox.listbox.get(0, END), ("a",))
+        listbox.delete(0, END)
+        listbox.delete(END)
+        self.assertEqual(listbox.size(), 0)
+        self.assertMirrored(listbox)
+
+    def test_set_values_and_sort_keep_the_mirror(self):
+        listbox = RoundedListbox(self.container, values=["b", "c", "a"], selectmode="extended")
+        listbox.selection_set(0)
+        listbox.set_values(["y", "x"])
+        self.assertMirrored(listbox)
+        self.assertEqual(listbox.get_selected_values(), [])
+
+
+class PageLoader:
+    """
+    Serve pages of three values; pages past the last one are empty.
+
+    Each request waits until the test releases it, so the result is always
+    delivered from the worker thread.
+    """
+    def __init__(self, pages):
+        self.pages = pages
+        self.gates = []
+
+    def __call__(self, page):
+        gate = threading.Event()
+        self.gates.append(gate)
+        gate.wait(2)
+        return [f"{page}.{index}" for index in range(3)] if page < self.pages else []
+
+    def release(self, request=None):
+        """Let a page request return, by default the oldest one still waiting"""
+        if request is None:
+            wait_for(lambda: not all(gate.is_set() for gate in self.gates))
+            request = next(index for index, gate in enumerate(self.gates) if not gate.is_set())
+        wait_for(lambda: len(self.gates) > request)
+        self.gates[request].set()
+
+
+class PaginationTest(ListboxTestCase):
+    def load(self, listbox, loader):
+        """Serve the page being loaded and wait until the prefetch check is scheduled"""
+        self.assertTrue(listbox.loading)
+        count = listbox._next_page + 1
+        loader.release()
+        wait_for(lambda: listbox.exhausted or listbox._next_page >= count and self.fake.pending)
+
+    def load_next(self, listbox, loader):
+        """Let the prefetch check request the next page and serve it"""
+        self.fake.run_pending()
+        self.load(listbox, loader)
+
+    def test_pages_load_until_exhausted(self):
+        loader = PageLoader(2)
+        listbox = RoundedListbox(self.container, page_loader=loader)
+        self.assertMirrored(listbox)
+        self.load(listbox, loader)
+        self.assertEqual(listbox._items, ["0.0", "0.1", "0.2"])
+        self.load_next(listbox, loader)
+        self.load_next(listbox, loader)
+        self.assertTrue(listbox.exhausted)
+        self.assertFalse(listbox.loading)
+        self.assertEqual(len(loader.gates), 3)
+        self.assertEqual(listbox.size(), 6)
+        self.assertMirrored(listbox)
+
+    def test_select_all_skips_the_loading_row(self):
+        loader = PageLoader(2)
+        listbox = RoundedListbox(self.container, page_loader=loader, selectmode="extended")
+        self.load(listbox, loader)
+        self.fake.run_pending()
+        self.assertTrue(listbox.loading)
+        self.assertMirrored(listbox)
+        self.fake.reset_counts()
+        listbox.select_all()
+        self.assertEqual([call[3:] for call in self.calls("selection", "set")], [(0, 2)])
+        self.assertEqual(listbox.get_selected_values(), ["0.0", "0.1", "0.2"])
+        self.load(listbox, loader)
+        self.assertMirrored(listbox)
+
+    def test_max_pages_drops_pages_above_the_view(self):
+        loader = PageLoader(3)
+        listbox = RoundedListbox(self.container, page_loader=loader, max_pages=2)
+        # Two pages lie above the view
+        with mock.patch.object(listbox.listbox, "nearest", return_value=6):
+            self.load(listbox, loader)
+            self.load_next(listbox, loader)
+            self.load_next(listbox, loader)
+            self.load_next(listbox, loader)
+        self.assertTrue(listbox.exhausted)
+        # One page of slack stays above the view
+        self.assertEqual(listbox.dropped_rows, 3)
+        self.assertEqual(listbox._page_sizes, [3, 3])
+        self.assertEqual(listbox._items, ["1.0", "1.1", "1.2", "2.0", "2.1", "2.2"])
+        self.assertMirrored(listbox)
+
+    def test_reset_pages_ignores_a_stale_page(self):
+        loader = PageLoader(1)
+        listbox = RoundedListbox(self.container, page_loader=loader)
+        wait_for(lambda: loader.gates)
+        listbox.reset_pages()
+        loader.release(1)
+        wait_for(lambda: self.fake.pending)
+        loader.release(0)
+        wait_for(lambda: in_flight_count() == 0)
+        time.sleep(0.01)
+        self.assertEqual(listbox._items, ["0.0", "0.1", "0.2"])
+        self.assertEqual(listbox._page_sizes, [3])
+        self.assertMirrored(listbox)
+
+
+class SortTest(ListboxTestCase):
+    VALUES = ["pear", "Apple", "fig", "banana", "Cherry"]
+
+    def wait_done(self, done):
+        """Wait for on_done; a result ready before submit returns is drained when idle"""
+        def finished():
+            self.fake.run_pending(idle_only=True)
+            return done
+        wait_for(finished)
+
+    def sort(self, listbox, key=None, reverse=False):
+        done = []
+        listbox.sort(key, reverse, on_done=lambda: done.append(True))
+        self.wait_done(done)
+
+    def test_sort_keeps_the_selection(self):
+        listbox = RoundedListbox(self.container, values=self.VALUES, selectmode="extended")
+        listbox.selection_set(1)
+        listbox.selection_set(3)
+        self.sort(listbox, str.lower)
+        self.assertEqual(listbox._items, ["Apple", "banana", "Cherry", "fig", "pear"])
+        self.assertEqual(listbox.get_selected_values(), ["Apple", "banana"])
+        self.assertEqual(listbox.sorted_by, (str.lower, False))
+        self.assertMirrored(listbox)
+
+    def test_keys_are_computed_once(self):
+        calls = []
+
+        def key(item):
+            calls.append(item)
+            return item.lower()
+
+        listbox = RoundedListbox(self.container, values=self.VALUES)
+        self.sort(listbox, key)
+        self.assertEqual(len(calls), 5)
+        # The current order and its reverse need no worker
+        done = []
+        listbox.sort(key, on_done=lambda: done.append(True))
+        listbox.sort(key, reverse=True, on_done=lambda: done.append(True))
+        self.assertEqual(done, [True, True])
+        self.assertEqual(listbox._items, ["pear", "fig", "Cherry", "banana", "Apple"])
+        # Sorting by another key and back reuses the cached keys
+        self.sort(listbox, len)
+        self.sort(listbox, key)
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(listbox._items, ["Apple", "banana", "Cherry", "fig", "pear"])
+        self.assertMirrored(listbox)
+
+    def test_a_stale_order_is_ignored(self):
+        release = threading.Event()
+
+        def key(item):
+            release.wait(2)
+            return item
+
+        listbox = RoundedListbox(self.container, values=self.VALUES)
+        done = []
+        listbox.sort(key, on_done=lambda: done.append(True))
+        listbox.insert(END, "date")
+        release.set()
+        wait_for(lambda: in_flight_count() == 0)
+        time.sleep(0.01)
+        self.fake.run_pending(idle_only=True)
+        self.assertEqual(done, [])
+        self.assertEqual(listbox._items, self.VALUES + ["date"])
+        self.assertIsNone(listbox.sorted_by)
+        self.assertMirrored(listbox)
+
+    def test_group_by(self):
+        listbox = RoundedListbox(self.container, values=self.VALUES, selectmode="extended")
+        done = []
+        listbox.group_by(len, on_done=lambda: done.append(True))
+        self.wait_done(done)
+        self.assertEqual(listbox.groups, [(3, 0, 0), (4, 1, 1), (5, 2, 2), (6, 3, 4)])
+        listbox.select_group(6)
+        self.assertEqual(sorted(listbox.get_selected_values()), ["Cherry", "banana"])
+        self.assertMirrored(listbox)
+
+    def test_paginated_listboxes_cannot_be_sorted(self):
+        listbox = RoundedListbox(self.container, page_loader=lambda page: [])
+        with self.assertRaises(ValueError):
+            listbox.sort()
+        with self.assertRaises(ValueError):
+            listbox.group_by(len)
+
+if __name__ == "__main__":
+    unittest.main()
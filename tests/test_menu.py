@@ -0,0 +1,76 @@
+"""
+RoundedMenu lazy population tests.
+"""
+
+import unittest
+
+from support import FakeRootTestCase
+from components import RoundedMenu
+
+
+class LazyMenuTest(FakeRootTestCase):
+    def setUp(self):
+        super().setUp()
+        self.runs = 0
+
+    def provider(self, menu):
+        self.runs += 1
+        for index in range(3):
+            menu.add_command(label=f"Item {index}", command=lambda: None)
+
+    def post(self, menu):
+        """Run the menu's -postcommand like Tk does before posting it"""
+        self.fake.commands[str(menu.cget("postcommand"))]()
+
+    def entries(self, menu):
+        return self.fake.widgets[menu._w].get("entries", [])
+
+    def test_items_are_built_on_first_post(self):
+        menu = RoundedMenu(self.container, provider=self.provider)
+        self.assertEqual((self.runs, self.entries(menu)), (0, []))
+        self.post(menu)
+        self.post(menu)
+        self.assertEqual(self.runs, 1)
+        self.assertEqual(len(self.entries(menu)), 3)
+
+    def test_invalidate_rebuilds_without_growing(self):
+        menu = RoundedMenu(self.container, provider=self.provider)
+        self.post(menu)
+        commands = len(self.fake.commands)
+        menu.invalidate()
+        self.post(menu)
+        self.assertEqual(self.runs, 2)
+        self.assertEqual(len(self.entries(menu)), 3)
+        # The callbacks of the replaced items were deleted
+        self.assertEqual(len(self.fake.commands), commands)
+
+    def test_uncached_menus_rebuild_on_every_post(self):
+        posted = []
+        menu = RoundedMenu(self.container, provider=self.provider, cache=False, postcommand=lambda: posted.append(self.runs))
+        self.post(menu)
+        self.post(menu)
+        self.assertEqual(posted, [1, 2])
+
+    def test_lazy_cascade(self):
+        menubar = RoundedMenu(self.container)
+        lazy = menubar.add_lazy_cascade("Lazy", self.provider)
+        self.assertEqual(self.entries(menubar)[0][0], "cascade")
+        self.assertEqual(self.entries(lazy), [])
+        self.post(lazy)
+        self.assertEqual(len(self.entries(lazy)), 3)
+
+    def test_provided_submenus_are_destroyed_on_rebuild(self):
+        def provider(menu):
+            menu.add_cascade(label="More", menu=RoundedMenu(menu))
+
+        menu = RoundedMenu(self.container, provider=provider)
+        self.post(menu)
+        first, = menu._provided_children
+        menu.invalidate()
+        self.post(menu)
+        self.assertEqual(len(menu._provided_children), 1)
+        self.assertFalse(first.winfo_exists())
+        self.assertEqual(len(menu.children), 1)
+
+if __name__ == "__main__":
+    unittest.main()
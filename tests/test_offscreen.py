@@ -0,0 +1,60 @@
+"""
+Offscreen rendering tests.
+"""
+
+import unittest
+
+from components import render_batch, render_frame
+from components.offscreen import RasterCache
+
+
+class OffscreenTest(unittest.TestCase):
+    def test_corners_show_the_parent_background(self):
+        image = render_frame(40, 30, radius=10, background="#ff0000", parent_background="#000000")
+        self.assertEqual(image.pixel(0, 0), (0, 0, 0, 255))
+        self.assertEqual(image.pixel(20, 15), (255, 0, 0, 255))
+        self.assertEqual(image.pixel(0, 15), (255, 0, 0, 255))
+
+    def test_transparent_background(self):
+        image = render_frame(40, 30, radius=10, background="#ff0000")
+        self.assertEqual(image.pixel(0, 0)[3], 0)
+        self.assertTrue(image.to_png().startswith(b"\x89PNG"))
+
+    def test_border_and_scale(self):
+        image = render_frame(40, 30, radius=4, background="#ff0000", parent_background="#000000", border=1, border_color="#00ff00", scale=2.0)
+        self.assertEqual(image.pixel(20, 15), (255, 0, 0, 255))
+        # A 2 pixel border (1 logical pixel at scale 2) mostly covers the first column
+        red, green, blue, _ = image.pixel(1, 15)
+        self.assertGreater(green, red)
+
+    def test_corner_styles_differ(self):
+        smooth = render_frame(40, 30, radius=12, background="#ff0000", parent_background="#000000")
+        arc = render_frame(40, 30, radius=12, background="#ff0000", parent_background="#000000", corner_style="arc")
+        self.assertNotEqual(smooth.pixels, arc.pixels)
+
+    def test_identical_variants_share_a_buffer(self):
+        first, second = render_batch([{"width": 30, "height": 20, "background": "#123456"}] * 2)
+        self.assertIs(first.pixels, second.pixels)
+
+
+class RasterCacheTest(unittest.TestCase):
+    def test_bounded_by_bytes(self):
+        cache = RasterCache(maxbytes=10)
+        for key in "abc":
+            cache.get(key, lambda: b"x" * 4)
+        self.assertEqual(cache.info()["size"], 2)
+        self.assertEqual(cache.nbytes, 8)
+        # The oldest buffer was evicted
+        self.assertEqual(cache.get("a", lambda: b"new!"), b"new!")
+
+    def test_oversized_buffers_are_not_kept(self):
+        cache = RasterCache(maxbytes=10)
+        cache.get("small", lambda: b"x")
+        cache.get("large", lambda: b"x" * 11)
+        self.assertEqual(cache.info()["size"], 1)
+        cache.resize(maxbytes=0)
+        self.assertEqual((cache.info()["size"], cache.nbytes), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Option database theme tests.
+"""
+
+import unittest
+from tkinter import Menu
+
+from support import FakeRootTestCase
+from components import RoundedListbox, RoundedMenu, install_option_theme, refresh_option_theme
+from components.option_theme import LISTBOX_CLASS, menu_options
+
+
+class OptionThemeTest(FakeRootTestCase):
+    def option_patterns(self):
+        return [call[2] for call in self.fake.log if call[:2] == ("option", "add")]
+
+    def test_only_ghost_listboxes_are_matched(self):
+        install_option_theme(self.root, force=True)
+        patterns = self.option_patterns()
+        self.assertTrue(patterns)
+        self.assertTrue(all(pattern.startswith(f"*{LISTBOX_CLASS}") for pattern in patterns))
+
+    def test_listbox_container_uses_the_ghost_class(self):
+        listbox = RoundedListbox(self.container, values=["a"])
+        self.assertEqual(listbox.winfo_class(), LISTBOX_CLASS)
+
+    def test_menus_are_styled_at_creation_only(self):
+        palette = install_option_theme(self.root)
+        self.fake.reset_counts()
+        menu = RoundedMenu(self.container)
+        create, = [call for call in self.fake.log if call[:2] == ("menu", menu._w)]
+        self.assertIn(palette["menu_bg"], create)
+        self.assertEqual(self.calls("configure"), [])
+        plain = Menu(self.container)
+        self.assertNotIn(palette["menu_bg"], [call for call in self.fake.log if call[:2] == ("menu", plain._w)][0])
+
+    def test_refresh_repaints_menus(self):
+        menu = RoundedMenu(self.container)
+        palette = dict(install_option_theme(self.root), menu_bg="#123456")
+        menu.apply_palette(palette)
+        self.assertEqual(menu.cget("background"), "#123456")
+        refresh_option_theme(self.root)
+        self.assertEqual(menu.cget("background"), menu_options(install_option_theme(self.root))["background"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+TclProfiler tests.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from support import FakeRootTestCase
+from components import RoundedFrame, TclProfiler
+from components.profiler import operation_name
+
+
+class OperationNameTest(unittest.TestCase):
+    def test_names(self):
+        self.assertEqual(operation_name((".!frame", "configure", "-bg", "red")), "configure")
+        self.assertEqual(operation_name(("winfo", "width", ".")), "winfo width")
+        self.assertEqual(operation_name((("update",),)), "update")
+
+
+class TclProfilerTest(FakeRootTestCase):
+    def test_calls_are_charged_to_component_methods(self):
+        with TclProfiler(self.root) as profiler:
+            frame = RoundedFrame(self.container)
+            self.fake.set_size(frame, 100, 50)
+            self.root.call("winfo", "width", ".")
+        owners = set(profiler.stats)
+        self.assertIn("RoundedFrame.on_resize", owners)
+        self.assertEqual(profiler.stats["(application)"]["operations"].get("winfo width"), 1)
+        self.assertIn("create", profiler.stats["RoundedFrame.on_resize"]["operations"])
+        self.assertIn("RoundedFrame.on_resize", profiler.report())
+
+    def test_stop_restores_direct_calls(self):
+        with TclProfiler(self.root) as profiler:
+            frame = RoundedFrame(self.container)
+        self.assertIs(frame.tk, self.fake)
+        self.assertIs(self.container.tk, self.fake)
+        calls = sum(entry["calls"] for entry in profiler.stats.values())
+        frame.configure(width=10)
+        self.assertEqual(sum(entry["calls"] for entry in profiler.stats.values()), calls)
+
+    def test_chrome_trace(self):
+        with TclProfiler(self.root) as profiler:
+            RoundedFrame(self.container)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            profiler.export_chrome_trace(path)
+            with open(path, encoding="utf-8") as file:
+                events = json.load(file)["traceEvents"]
+        self.assertEqual(len(events), len(profiler.events))
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+DPI scaling tests.
+"""
+
+import unittest
+
+from support import FakeRootTestCase
+from components import RoundedButton, RoundedFrame, geometry_cache_info, get_theme_context
+
+
+class ScalingTest(FakeRootTestCase):
+    def setUp(self):
+        super().setUp()
+        self.context = get_theme_context(self.root)
+
+    def tearDown(self):
+        self.context.set_scale(1.0)
+        self.fake.run_pending(idle_only=True)
+        super().tearDown()
+
+    def test_components_are_created_at_the_current_scale(self):
+        self.context.scale = 2.0
+        frame = RoundedFrame(self.container, radius=10)
+        button = RoundedButton(self.container, text="OK", padx=4, pady=3, font=("Host Grotesk", -12))
+        self.assertEqual(frame.radius, (20, 20, 20, 20))
+        self.assertEqual((button.padx, button.pady), (8, 6))
+        self.assertEqual(button.button.cget("font"), "{Host Grotesk} -24")
+
+    def test_set_scale_rescales_once_per_idle_pass(self):
+        frame = RoundedFrame(self.container, radius=10)
+        button = RoundedButton(self.container, text="OK", padx=4, pady=3)
+        self.context.set_scale(2.0)
+        self.context.set_scale(1.5)
+        self.assertEqual(frame.radius, (10, 10, 10, 10))
+        self.assertEqual(self.fake.run_pending(idle_only=True), 1)
+        self.assertEqual(frame.radius, (15, 15, 15, 15))
+        self.assertEqual((button.padx, button.pady), (6, 4))
+        # The logical values are kept, so scaling back is exact
+        self.context.set_scale(1.0)
+        self.fake.run_pending(idle_only=True)
+        self.assertEqual(frame.radius, (10, 10, 10, 10))
+        self.assertEqual((button.padx, button.pady), (4, 3))
+
+    def test_an_unchanged_scale_schedules_nothing(self):
+        self.context.set_scale(self.context.scale)
+        self.assertEqual(self.fake.pending, {})
+
+    def test_returning_to_a_scale_reuses_the_cached_outlines(self):
+        frame = RoundedFrame(self.container, radius=12)
+        self.fake.set_size(frame, 120, 80)
+        frame.on_resize()
+        misses = geometry_cache_info()["misses"]
+        self.context.set_scale(2.0)
+        self.fake.run_pending(idle_only=True)
+        self.assertGreater(geometry_cache_info()["misses"], misses)
+        misses = geometry_cache_info()["misses"]
+        self.context.set_scale(1.0)
+        self.fake.run_pending(idle_only=True)
+        self.context.set_scale(2.0)
+        self.fake.run_pending(idle_only=True)
+        self.assertEqual(geometry_cache_info()["misses"], misses)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+ScrollEngine tests.
+
+The engine is tested directly with stand-in timers; the widgets using it
+are built on a FakeRoot.
+"""
+
+import unittest
+from types import SimpleNamespace
+
+from support import FakeRootTestCase
+from components import RoundedListbox, ScrollEngine, attach_scroll_engine
+
+
+class _Timers:
+    """Stands in for the widget a ScrollEngine schedules its frames on"""
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+        return len(self.callbacks)
+
+    def after_cancel(self, after_id):
+        pass
+
+    def run(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+class ScrollEngineTest(unittest.TestCase):
+    def test_wheel_events_are_coalesced_per_frame(self):
+        timers, scrolled = _Timers(), []
+        engine = ScrollEngine(timers, scroll_units=scrolled.append, step=1)
+        for _ in range(3):
+            self.assertEqual(engine.on_wheel(SimpleNamespace(num=5, delta=0)), "break")
+        self.assertEqual(len(timers.callbacks), 1)
+        timers.run()
+        self.assertEqual(scrolled, [3])
+
+    def test_fractional_deltas_carry_over(self):
+        timers, scrolled = _Timers(), []
+        engine = ScrollEngine(timers, scroll_units=scrolled.append)
+        for _ in range(2):
+            engine.on_wheel(SimpleNamespace(num=0, delta=-60))
+            timers.run()
+        self.assertEqual(scrolled, [1])
+
+    def test_pixels_use_the_unit(self):
+        timers, scrolled = _Timers(), []
+        engine = ScrollEngine(timers, scroll_pixels=scrolled.append, unit=20, step=2)
+        engine.on_wheel(SimpleNamespace(num=4, delta=0))
+        timers.run()
+        self.assertEqual(scrolled, [-40])
+
+    def test_smooth_scrolling_spreads_the_distance(self):
+        timers, scrolled = _Timers(), []
+        engine = ScrollEngine(timers, scroll_units=scrolled.append, step=10, smooth=True)
+        engine.on_wheel(SimpleNamespace(num=5, delta=0))
+        while timers.callbacks:
+            timers.run()
+        self.assertGreater(len(scrolled), 1)
+        self.assertEqual(sum(scrolled), 10)
+
+    def test_stop_cancels_a_scroll(self):
+        timers, scrolled = _Timers(), []
+        engine = ScrollEngine(timers, scroll_units=scrolled.append)
+        engine.on_wheel(SimpleNamespace(num=5, delta=0))
+        engine.stop()
+        engine._frame()
+        self.assertEqual(scrolled, [])
+
+    def test_attach_scroll_engine(self):
+        moves = []
+        timers = _Timers()
+        frame = SimpleNamespace(
+            after=timers.after,
+            after_cancel=timers.after_cancel,
+            vscroll=SimpleNamespace(get=lambda: (0.25, 0.5)),
+            yview_moveto=moves.append,
+            winfo_height=lambda: 200,
+        )
+        engine = attach_scroll_engine(frame, unit=20, step=1, smooth=False)
+        self.assertEqual(frame._on_mousewheel(SimpleNamespace(num=5, delta=0)), "break")
+        timers.run()
+        self.assertIs(engine.widget, frame)
+        self.assertEqual(moves, [0.25 + 20 / 200])
+
+
+class ListboxWheelTest(FakeRootTestCase):
+    def test_wheel_events_scroll_once_per_frame(self):
+        listbox = RoundedListbox(self.container, values=[str(index) for index in range(100)])
+        self.fake.reset_counts()
+        for _ in range(3):
+            self.fake.fire(listbox.listbox, "<MouseWheel>", D=-120)
+        self.assertEqual(self.calls("yview"), [])
+        self.fake.run_pending()
+        self.assertEqual([call[2:] for call in self.calls("yview")], [("scroll", 3, "units")])
+
+
+if __name__ == "__main__":
+    unittest.main()
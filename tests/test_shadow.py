@@ -0,0 +1,74 @@
+"""
+Drop shadow and border tests.
+"""
+
+import unittest
+
+from support import FakeRootTestCase
+from components import RoundedFrame, get_theme_context
+from components.shadow import shadow_alpha, shadow_slices
+
+
+class ShadowAlphaTest(unittest.TestCase):
+    def test_profile(self):
+        self.assertAlmostEqual(shadow_alpha(0, 8, 0.4), 0.2)
+        self.assertAlmostEqual(shadow_alpha(-50, 8, 0.4), 0.4)
+        self.assertAlmostEqual(shadow_alpha(50, 8, 0.4), 0.0)
+        profile = [shadow_alpha(distance, 8, 0.4) for distance in range(-8, 9)]
+        self.assertEqual(profile, sorted(profile, reverse=True))
+
+
+class ShadowTest(FakeRootTestCase):
+    def frame(self, **kwargs):
+        frame = RoundedFrame(self.container, radius=10, background="#336699", parent_background="#ffffff", **kwargs)
+        self.fake.set_size(frame, 200, 120)
+        frame.on_resize()
+        return frame
+
+    def test_slices_are_cached_and_shared(self):
+        cache = get_theme_context(self.root).shadow_cache
+        cache.clear()
+        first = self.frame(shadow=6)
+        second = self.frame(shadow=6)
+        self.assertIs(first._shadow_slices, second._shadow_slices)
+        self.assertEqual(cache.info()["size"], 1)
+        self.assertIs(shadow_slices(self.root, (10, 10, 10, 10), 6, "#000000", "#ffffff", 0.35), first._shadow_slices)
+        self.frame(shadow=4)
+        self.assertEqual(cache.info()["size"], 2)
+
+    def test_resize_only_moves_the_slices(self):
+        frame = self.frame(shadow=6)
+        self.fake.reset_counts()
+        self.fake.set_size(frame, 300, 160)
+        frame.on_resize()
+        self.assertEqual(self.calls("create", "image"), [])
+        self.assertEqual(self.fake.operations.get("image create", 0), 0)
+        self.assertEqual(len(self.calls("coords")), 9)
+        # The card is inset by the blur (the offset is 0)
+        self.assertEqual(self.calls("move")[0][3:], (6, 6))
+
+    def test_small_frames_hide_the_shadow(self):
+        frame = self.frame(shadow=6)
+        self.fake.reset_counts()
+        self.fake.set_size(frame, 24, 24)
+        frame.on_resize()
+        self.assertIn(("itemconfigure", "shadow", "-state", "hidden"), [call[1:] for call in self.fake.log])
+
+    def test_removing_the_shadow_deletes_the_slices(self):
+        frame = self.frame(shadow=6)
+        frame.set_shadow(blur=0)
+        self.assertIsNone(frame._shadow_items)
+        self.assertIn(("delete", "shadow"), [call[1:] for call in self.fake.log])
+
+    def test_border_is_stroked_on_the_outline(self):
+        frame = self.frame(border=2, border_color="#ff0000")
+        self.fake.reset_counts()
+        frame.set_border(color="#00ff00")
+        polygon = self.calls("create", "polygon")[0]
+        self.assertEqual(polygon[polygon.index("-outline") + 1], "#00ff00")
+        self.assertEqual(polygon[polygon.index("-width") + 1], 2)
+        self.assertEqual(self.calls("move")[0][3:], (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+"""
+Smoke test of the stress harness (benchmarks/stress_test.py) on the FakeRoot.
+"""
+
+import unittest
+from types import SimpleNamespace
+
+from support import FakeRootTestCase
+from benchmarks import stress_test
+
+
+class StressHarnessTest(FakeRootTestCase):
+    def test_build_and_run_the_sequences(self):
+        args = SimpleNamespace(frames=10, depth=3, buttons=12, lists=2, rows=30)
+        ui = stress_test.build_ui(self.container, args)
+        self.assertEqual(len(ui.frames), 10)
+        self.assertEqual(max(level for _, level in ui.frames), 2)
+        self.assertEqual(len(ui.buttons), 12)
+        self.assertEqual([listbox.size() for listbox in ui.listboxes], [30, 30])
+        self.assertEqual(len(ui.comboboxes), 2)
+        for sequence in (stress_test.resize_sequence, stress_test.scroll_sequence):
+            self.assertEqual(sequence(self.root, ui, 5, True).count, 5)
+        self.assertEqual(stress_test.hover_sequence(self.root, ui, 5).count, 5)
+        self.assertGreater(stress_test.count_widgets(self.container), 10 + 12 + 2 * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
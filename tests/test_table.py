@@ -0,0 +1,82 @@
+"""
+ColumnStore and RoundedTable tests.
+"""
+
+import unittest
+
+from support import FakeRootTestCase
+from components import ColumnStore, RoundedTable, get_theme_context
+
+
+class ColumnStoreTest(unittest.TestCase):
+    def test_numeric_columns_are_packed(self):
+        store = ColumnStore(["id", "name", "score"], [(2, "b", 1.5), (1, "a", 2)])
+        self.assertEqual(len(store), 2)
+        self.assertNotIsInstance(store.data[0], list)
+        self.assertIsInstance(store.data[1], list)
+        # A float anywhere makes the whole column float
+        self.assertEqual(float(store.value(2, 1)), 2.0)
+
+    def test_sort_permutation_is_cached(self):
+        store = ColumnStore(["id"], [(3,), (1,), (2,)])
+        ascending = store.sort_permutation(0)
+        self.assertEqual(list(ascending), [1, 2, 0])
+        self.assertIs(store.sort_permutation(0), ascending)
+        self.assertEqual(list(store.sort_permutation(0, reverse=True)), [0, 2, 1])
+
+    def test_mixed_values_sort_without_errors(self):
+        store = ColumnStore(["value"], [("b",), (None,), (2,), ("a",), (1,)])
+        self.assertEqual([store.value(0, row) for row in store.sort_permutation(0)], [1, 2, "a", "b", None])
+
+    def test_ragged_rows_are_rejected(self):
+        store = ColumnStore(["a", "b"])
+        with self.assertRaises(ValueError):
+            store.set_rows([(1, 2), (3,)])
+        with self.assertRaises(ValueError):
+            store.set_rows([(1, 2, 3)])
+        with self.assertRaises(ValueError):
+            store.set_columns([[1, 2]])
+
+
+class RoundedTableTest(FakeRootTestCase):
+    ROWS = [(index, f"row {index}") for index in range(1000)]
+
+    def setUp(self):
+        super().setUp()
+        self.table = RoundedTable(self.container, ["id", "name"], self.ROWS, row_height=20)
+        self.fake.set_size(self.table.body, 200, 100)
+
+    def visible_rows(self):
+        return sorted(slot["row"] for slot in self.table._slots if slot["row"] is not None)
+
+    def test_only_the_viewport_has_rows(self):
+        self.assertEqual(len(self.table._slots), 100 // 20 + 2)
+        self.assertEqual(self.visible_rows(), list(range(7)))
+
+    def test_scrolling_recycles_slots(self):
+        self.fake.reset_counts()
+        self.table.scroll_to(20 * 500)
+        self.assertEqual(self.visible_rows(), list(range(500, 507)))
+        self.assertEqual(self.calls("create"), [])
+
+    def test_sort_by(self):
+        self.table.sort_by(0, reverse=True)
+        self.assertEqual(self.table.get_row(0), (999, "row 999"))
+        self.table.select(1)
+        self.assertEqual(self.table.get_selected(), (998, "row 998"))
+
+    def test_rescale_keeps_the_first_visible_row(self):
+        context = get_theme_context(self.table)
+        self.table.scroll_to(20 * 300 + 5)
+        try:
+            context.scale = 2.0
+            self.table.rescale()
+            self.assertEqual(self.table.row_height, 40)
+            self.assertEqual(self.table._offset, 40 * 300)
+            self.assertEqual(self.visible_rows()[0], 300)
+        finally:
+            context.scale = 1.0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+ThemeContext tests.
+"""
+
+import tkinter
+import unittest
+
+from support import FakeRootTestCase
+from components import get_theme_context
+from components.theme_context import BINDTAG
+
+
+class ThemeContextTest(FakeRootTestCase):
+    def setUp(self):
+        super().setUp()
+        self.context = get_theme_context(self.root)
+
+    def test_toplevels_share_the_context(self):
+        window = tkinter.Toplevel(self.container)
+        frame = tkinter.Frame(window)
+        self.assertIs(get_theme_context(frame), self.context)
+        self.assertIs(get_theme_context(window), self.context)
+        self.assertEqual(self.root.bindtags().count(BINDTAG), 1)
+
+    def test_only_the_root_carries_the_bindtag(self):
+        self.assertEqual(self.root.bindtags()[0], BINDTAG)
+        frame = tkinter.Frame(self.container)
+        self.assertNotIn(BINDTAG, frame.bindtags())
+        self.assertIn(".", frame.bindtags())
+        # Bindings on "." would run for the events of every widget
+        self.assertNotIn("<<ThemeChanged>>", self.root.bind())
+        self.assertNotIn("<Destroy>", self.root.bind())
+
+    def test_theme_changed_of_other_widgets_is_ignored(self):
+        self.context._lookups[("Ghost.TButton", "background")] = "#000000"
+        self.fake.fire(self.container, "<<ThemeChanged>>")
+        self.assertIn(("Ghost.TButton", "background"), self.context._lookups)
+        self.fake.fire(self.root, "<<ThemeChanged>>")
+        self.assertEqual(self.context._lookups, {})
+
+    def test_listeners_run_on_real_switches_only(self):
+        switches = []
+        listener = lambda context: switches.append(context.theme)
+        self.context.on_theme_change(listener)
+        theme = self.context.theme
+        try:
+            self.fake.fire(self.root, "<<ThemeChanged>>")
+            self.assertEqual(switches, [])
+            self.context.theme = "previous"
+            self.context.derive_style("Ghost.Test", lambda style: None)
+            self.fake.fire(self.root, "<<ThemeChanged>>")
+            self.assertEqual(switches, [theme])
+            self.assertNotIn("Ghost.Test", self.context._derived)
+        finally:
+            self.context._theme_listeners.remove(listener)
+            self.context.theme = theme
+
+    def test_destroying_a_child_keeps_the_context(self):
+        frame = tkinter.Frame(self.container)
+        self.fake.fire(frame, "<Destroy>")
+        self.assertIs(get_theme_context(self.root), self.context)
+
+    def test_derive_style_builds_once(self):
+        builds = []
+        self.context.derive_style("Ghost.Once", builds.append)
+        self.context.derive_style("Ghost.Once", builds.append)
+        self.assertEqual(builds, [self.context.style])
+
+    def test_scaled(self):
+        scale = self.context.scale
+        try:
+            self.context.scale = 1.5
+            self.assertEqual(self.context.scaled(10), 15)
+            self.assertEqual(self.context.scaled((2, 4)), (3, 6))
+            self.assertEqual(self.context.scaled_font(("Host Grotesk", -12, "bold")), ("Host Grotesk", -18, "bold"))
+            self.assertEqual(self.context.scaled_font(("Host Grotesk", 10)), ("Host Grotesk", 10))
+        finally:
+            self.context.scale = scale
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Layout spec compilation and plan replay tests.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from support import FakeRootTestCase
+from components import RoundedButton, RoundedFrame, compile_spec, load_plan
+from components.offscreen import THEME_PATH
+from components.ui_spec import LAYOUT_PATH
+
+COLORS = {"bg": "#000000", "primary": "#0000ff", "secondary": "#222222"}
+SPEC = {
+    "fonts": {"body": ["Host Grotesk", 10]},
+    "sections": {
+        "main": [
+            {
+                "type": "RoundedFrame",
+                "options": {"bootstyle": "secondary.TFrame"},
+                "pack": {"fill": "x"},
+                "children": [
+                    {"type": "Label", "options": {"text": "Title", "font": "@body"}, "pack": {}},
+                    {"type": "RoundedButton", "id": "ok", "options": {"text": "OK", "command": "on_ok", "background": "$primary"}, "pack": {}},
+                ],
+            },
+        ],
+    },
+}
+
+
+class CompileSpecTest(unittest.TestCase):
+    def test_colors_fonts_and_surfaces_are_resolved(self):
+        frame, label, button = compile_spec(SPEC, COLORS).sections["main"]
+        self.assertEqual(frame["options"]["parent_background"], "#000000")
+        self.assertEqual(frame["options"]["background"], "#222222")
+        self.assertEqual(label["options"], {"text": "Title", "font": ["Host Grotesk", 10], "background": "#222222"})
+        self.assertEqual(button["options"]["parent_background"], "#222222")
+        self.assertEqual(button["options"]["background"], "#0000ff")
+        self.assertEqual((button["parent"], button["command"], button["id"]), (0, "on_ok", "ok"))
+
+    def test_unknown_types_are_rejected(self):
+        with self.assertRaises(ValueError):
+            compile_spec({"sections": {"main": [{"type": "Spinner"}]}}, COLORS)
+
+    def test_plans_are_cached_until_the_spec_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            spec_path = os.path.join(directory, "layout.json")
+            with open(spec_path, "w", encoding="utf-8") as file:
+                json.dump(SPEC, file)
+            plan = load_plan(spec_path, THEME_PATH, cache_dir=directory)
+            cache_path = os.path.join(directory, "layout.json.plan.json")
+            self.assertTrue(os.path.exists(cache_path))
+            self.assertEqual(load_plan(spec_path, THEME_PATH, cache_dir=directory).sections, plan.sections)
+
+            changed = dict(SPEC, sections={"other": SPEC["sections"]["main"]})
+            with open(spec_path, "w", encoding="utf-8") as file:
+                json.dump(changed, file)
+            self.assertEqual(list(load_plan(spec_path, THEME_PATH, cache_dir=directory).sections), ["other"])
+
+    def test_bundled_layout_compiles(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertTrue(load_plan(LAYOUT_PATH, cache_dir=directory).sections)
+
+
+class ReplayTest(FakeRootTestCase):
+    def test_replay_builds_named_widgets(self):
+        clicks = []
+        handlers = SimpleNamespace(on_ok=clicks.append)
+        named = compile_spec(SPEC, COLORS).replay(self.container, "main", handlers)
+        button = named["ok"]
+        self.assertIsInstance(button, RoundedButton)
+        self.assertIsInstance(button.parent, RoundedFrame)
+        self.assertEqual(button.cget("background"), "#222222")
+        self.fake.fire(button.button, "<Button-1>")
+        self.assertEqual(len(clicks), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+WidgetPool and RoundedButton reuse tests.
+"""
+
+import os
+import tempfile
+import unittest
+
+from support import FakeRootTestCase
+from components import RoundedButton, WidgetPool, get_icon_atlas
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+class WidgetPoolTest(FakeRootTestCase):
+    def setUp(self):
+        super().setUp()
+        self.pool = WidgetPool(RoundedButton, max_size=2)
+
+    def test_released_buttons_are_reused_for_the_same_parent(self):
+        clicks = []
+        button = self.pool.acquire(self.container, text="First", command=lambda e: clicks.append("first"))
+        self.pool.release(button)
+        reused = self.pool.acquire(self.container, text="Second", command=lambda e: clicks.append("second"))
+        self.assertIs(reused, button)
+        self.assertEqual(reused.button.cget("text"), "Second")
+        self.fake.fire(reused.button, "<Button-1>")
+        self.assertEqual(clicks, ["second"])
+        self.assertEqual(self.pool.stats()["hits"], 1)
+
+    def test_other_parents_get_new_buttons(self):
+        button = self.pool.acquire(self.container)
+        self.pool.release(button)
+        self.assertIsNot(self.pool.acquire(RoundedButton(self.container)), button)
+        self.assertEqual(len(self.pool), 1)
+
+    def test_reset_clears_the_content_of_the_previous_use(self):
+        button = self.pool.acquire(self.container, text="Old", bootstyle="danger.TButton")
+        self.pool.release(button)
+        self.pool.acquire(self.container)
+        self.assertEqual(button.button.cget("text"), "")
+        # Appearance options left at None are kept
+        self.assertEqual(button.original_bg, button.style.colors.get("danger"))
+
+    @unittest.skipIf(Image is None, "Pillow is not installed")
+    def test_reset_releases_the_previous_icon(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sheet.png")
+            Image.new("RGBA", (32, 16), "red").save(path)
+            atlas = get_icon_atlas(self.root)
+            atlas.add_sheet(path, ["pool-a", "pool-b"], 16)
+        references = atlas.info()["references"]
+        button = self.pool.acquire(self.container, icon="pool-a")
+        self.assertEqual(atlas.info()["references"], references + 1)
+        self.pool.release(button)
+        self.pool.acquire(self.container)
+        self.assertIsNone(button.icon_image)
+        self.assertEqual(atlas.info()["references"], references)
+
+    def test_lru_eviction_destroys_the_oldest(self):
+        buttons = [self.pool.acquire(self.container) for _ in range(3)]
+        for button in buttons:
+            self.pool.release(button)
+        self.assertEqual(self.pool.stats()["evictions"], 1)
+        self.assertFalse(buttons[0].winfo_exists())
+        self.assertIs(self.pool.acquire(self.container), buttons[2])
+
+    def test_fifo_reuses_in_release_order(self):
+        pool = WidgetPool(RoundedButton, max_size=2, policy="fifo")
+        buttons = [pool.acquire(self.container) for _ in range(2)]
+        for button in buttons:
+            pool.release(button)
+        self.assertIs(pool.acquire(self.container), buttons[0])
+
+    def test_destroyed_idle_buttons_are_skipped(self):
+        button = self.pool.acquire(self.container)
+        self.pool.release(button)
+        button.destroy()
+        self.assertIsNot(self.pool.acquire(self.container), button)
+        self.assertEqual(self.pool.stats()["misses"], 2)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            WidgetPool(RoundedButton, policy="random")
+
+
+if __name__ == "__main__":
+    unittest.main()